@@ -3,7 +3,6 @@ Excel 처리 API 라우터
 - POST /excel/batch   : Excel 배치 처리 (비동기)
 - POST /excel/export  : Excel 처리 결과 JSON 덤프 (동기)
 """
-import json
 import traceback
 from pathlib import Path
 from typing import List, Optional
@@ -121,7 +120,7 @@ async def excel_export(request: ExcelExportRequest):
     - **export_outdir**: 출력 디렉토리 (기본: data/temp/export)
     - **early_stop**: 연속 무값 행 N개에서 시트 스캔 중지 (기본: 10)
     """
-    from excel_processor import ExcelProcessor
+    from excel_processor import ExcelProcessor, write_json_file
 
     excel_path = request.excel_file
     if not Path(excel_path).exists():
@@ -157,8 +156,7 @@ async def excel_export(request: ExcelExportRequest):
                 outdir.mkdir(parents=True, exist_ok=True)
                 safe = "".join(ch if ch not in '\\/:*?"<>|' else "_" for ch in sheet_name).strip() or "sheet"
                 out_file = outdir / f"{safe}.processed.json"
-                with out_file.open("w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                write_json_file(data, out_file)
 
                 output_files.append(str(out_file))
                 sheets_processed += 1
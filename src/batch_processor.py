@@ -28,6 +28,9 @@ from config import (
     TEMP_DIR
 )
 
+# 업로드 후 chunk_method를 "table"로 지정할 파일 형식
+EXCEL_FILE_TYPES = frozenset({'xlsx', 'xls', 'xlsm'})
+
 
 class BatchProcessor:
     """배치 처리 메인 클래스"""
@@ -257,7 +260,10 @@ class BatchProcessor:
             # 1. Excel 데이터 추출
             if 'excel' in self.data_sources and self.excel_processor:
                 logger.info("\n[Excel 데이터 처리]")
-                sheet_data = self.excel_processor.process_all_sheets()
+                # 이력관리/소프트웨어 시트를 텍스트로 변환하는 경우에만 행 레코드를 기록해 재스캔 생략
+                sheet_data = self.excel_processor.process_all_sheets(
+                    record_text_rows=(HISTORY_SHEET_UPLOAD_FORMAT == "text")
+                )
                 all_data.update(sheet_data)
                 self.stats['total_sheets'] += len(sheet_data)
             
@@ -337,6 +343,8 @@ class BatchProcessor:
         
         finally:
             # 리소스 정리
+            # 실패로 cleanup_temp까지 가지 못해도 한글 프로그램/작업 스레드는 정리 (API 작업도 이 경로를 탐)
+            self.file_handler.close()
             if self.excel_processor:
                 self.excel_processor.close()
             if self.db_processor and self.db_processor.connector:
@@ -838,6 +846,11 @@ class BatchProcessor:
             logger.warning(f"{row_number}행: 하이퍼링크가 없습니다.")
             return []
         
+        # 항목(데이터셋) 단위로 고정인 값은 파일 루프 밖에서 한 번만 계산
+        dataset_id = dataset.get('id')
+        dataset_name = dataset.get('name')
+        save_revision = bool(ENABLE_REVISION_MANAGEMENT and document_key)
+        
         all_uploaded_doc_ids: List[str] = []
         for hyperlink in hyperlinks:
             # 처리된 URL 확인 (Revision 관리 안하는 시트용)
@@ -903,16 +916,16 @@ class BatchProcessor:
                         file_id = upload_result.get('file_id')
 
                         # Excel 파일인 경우 chunk_method를 "table"로 설정
-                        if file_type in ['xlsx', 'xls', 'xlsm']:
+                        if file_type in EXCEL_FILE_TYPES:
                             self.ragflow_client.update_document_parser(
-                                dataset_id=dataset.get('id'),
+                                dataset_id=dataset_id,
                                 document_id=doc_id,
                                 chunk_method="table"
                             )
 
                         # 메타데이터 업데이트 (업로드 후 별도 호출)
                         # 중요: 사용자 요구사항에 따라 엑셀의 row별 헤더:값(metadata)만 전달한다.
-                        self.ragflow_client.update_document(dataset.get('id'), doc_id, metadata)
+                        self.ragflow_client.update_document(dataset_id, doc_id, metadata)
 
                         all_uploaded_doc_ids.append(doc_id)
                         self.stats['successful_uploads'] += 1
@@ -923,10 +936,7 @@ class BatchProcessor:
                         )
                         
                         # RevisionDB에 저장 (revision 관리가 활성화된 경우)
-                        if ENABLE_REVISION_MANAGEMENT and document_key:
-                            dataset_id = dataset.get('id')
-                            dataset_name = dataset.get('name')
-                            
+                        if save_revision:
                             # DB 저장 시도
                             db_success = self.revision_db.save_document(
                                 document_key=document_key,
@@ -990,13 +1000,14 @@ class BatchProcessor:
             document_ids: 모니터링할 문서 ID 리스트
             max_wait_minutes: 최대 대기 시간 (분, 기본: 30분)
         """
-        logger.info(f"[{dataset_name}] 📊 파싱 진행 상황 모니터링 시작...")
+        header_lines = [f"[{dataset_name}] 📊 파싱 진행 상황 모니터링 시작..."]
         if document_ids:
-            logger.info(f"[{dataset_name}] 모니터링 대상: {len(document_ids)}개 문서")
-        logger.info(f"[{dataset_name}] 최대 대기 시간: {max_wait_minutes}분")
+            header_lines.append(f"[{dataset_name}] 모니터링 대상: {len(document_ids)}개 문서")
+        header_lines.append(f"[{dataset_name}] 최대 대기 시간: {max_wait_minutes}분")
+        logger.info("\n".join(header_lines))
         
-        start_time = time.time()
-        max_wait_seconds = max_wait_minutes * 60
+        # 벽시계 보정(NTP 등)에 영향받지 않도록 monotonic 기준 마감 시각을 한 번만 계산
+        deadline = time.monotonic() + max_wait_minutes * 60
         check_interval = 10  # 10초마다 확인
         last_status = None
         
@@ -1042,8 +1053,7 @@ class BatchProcessor:
                     logger.debug(f"[{dataset_name}] 진행 상황 정보 없음 (백그라운드 작업 대기 중...)")
                 
                 # 타임아웃 체크
-                elapsed = time.time() - start_time
-                if elapsed > max_wait_seconds:
+                if time.monotonic() > deadline:
                     logger.warning(f"[{dataset_name}] ⏱️ 파싱 대기 시간 초과 ({max_wait_minutes}분)")
                     logger.info(f"[{dataset_name}] 파싱은 계속 진행 중입니다. Management UI에서 확인하세요.")
                     break
@@ -1716,8 +1726,8 @@ class BatchProcessor:
             logger.info(f"최대 동작 시간: {max_hours}시간")
             logger.info("=" * 80)
             
-            start_time = time.time()
-            max_wait_seconds = max_hours * 3600  # 시간 -> 초
+            start_time = time.monotonic()
+            deadline = start_time + max_hours * 3600  # 시간 -> 초
             
             submitted_ids = set()  # 이미 파싱 요청한 문서
             completed_ids = set()  # 완료된 문서
@@ -1772,8 +1782,7 @@ class BatchProcessor:
                                    f"RUNNING: {our_running}/{concurrency_limit}")
                 
                 # 타임아웃 체크
-                elapsed = time.time() - start_time
-                if elapsed > max_wait_seconds:
+                if time.monotonic() > deadline:
                     logger.warning(f"⏱️ 최대 동작 시간 초과 ({max_hours}시간)")
                     logger.info(f"진행 상황: {len(completed_ids)}/{total_pending} 완료")
                     break
@@ -1788,7 +1797,7 @@ class BatchProcessor:
             # 최종 상태 확인
             _, final_status = self.get_running_document_count(dataset)
             
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.monotonic() - start_time
             elapsed_minutes = elapsed_time / 60
             
             logger.info("\n" + "=" * 80)
@@ -1946,54 +1955,58 @@ class BatchProcessor:
             logger.error(traceback.format_exc())
 
     def print_statistics(self):
-        """처리 통계 출력"""
-        logger.info("="*80)
-        logger.info("배치 처리 통계")
-        logger.info("-"*80)
+        """처리 통계 출력 (한 번의 로그 기록으로 묶어서 출력)"""
+        lines: List[str] = []
+        add = lines.append
+        
+        add("="*80)
+        add("배치 처리 통계")
+        add("-"*80)
         
         # 시트 통계
-        logger.info(f"총 시트 수: {self.stats['total_sheets']}")
-        logger.info(f"  - 건너뛴 시트 (목차): {self.stats['skipped_sheets']}")
-        logger.info(f"  - Revision 관리 시트: {self.stats['revision_sheets']}")
-        logger.info(f"  - 첨부파일 시트: {self.stats['attachment_sheets']}")
-        logger.info(f"  - 이력관리/소프트웨어 시트: {self.stats['history_sheets']}")
-        logger.info(f"생성된 지식베이스 수: {self.stats['datasets_created']}")
+        add(f"총 시트 수: {self.stats['total_sheets']}")
+        add(f"  - 건너뛴 시트 (목차): {self.stats['skipped_sheets']}")
+        add(f"  - Revision 관리 시트: {self.stats['revision_sheets']}")
+        add(f"  - 첨부파일 시트: {self.stats['attachment_sheets']}")
+        add(f"  - 이력관리/소프트웨어 시트: {self.stats['history_sheets']}")
+        add(f"생성된 지식베이스 수: {self.stats['datasets_created']}")
         
-        logger.info("-"*80)
+        add("-"*80)
         
         # Revision 관리 통계
         if self.stats['revision_sheets'] > 0:
-            logger.info(f"Revision 관리 문서:")
-            logger.info(f"  - 신규 문서: {self.stats['new_documents']}")
-            logger.info(f"  - 업데이트 문서: {self.stats['updated_documents']}")
-            logger.info(f"  - 건너뛴 문서 (동일 revision): {self.stats['skipped_documents']}")
-            logger.info(f"  - 삭제된 문서: {self.stats['deleted_documents']}")
+            add(f"Revision 관리 문서:")
+            add(f"  - 신규 문서: {self.stats['new_documents']}")
+            add(f"  - 업데이트 문서: {self.stats['updated_documents']}")
+            add(f"  - 건너뛴 문서 (동일 revision): {self.stats['skipped_documents']}")
+            add(f"  - 삭제된 문서: {self.stats['deleted_documents']}")
             if self.stats['failed_deletions'] > 0:
-                logger.info(f"  - 삭제 실패: {self.stats['failed_deletions']}")
-            logger.info("-"*80)
+                add(f"  - 삭제 실패: {self.stats['failed_deletions']}")
+            add("-"*80)
         
         # 파일 업로드 통계
-        logger.info(f"총 파일 수: {self.stats['total_files']}")
-        logger.info(f"업로드 성공: {self.stats['successful_uploads']}")
-        logger.info(f"업로드 실패: {self.stats['failed_uploads']}")
+        add(f"총 파일 수: {self.stats['total_files']}")
+        add(f"업로드 성공: {self.stats['successful_uploads']}")
+        add(f"업로드 실패: {self.stats['failed_uploads']}")
         
         if self.stats['total_files'] > 0:
             success_rate = (self.stats['successful_uploads'] / self.stats['total_files']) * 100
-            logger.info(f"업로드 성공률: {success_rate:.1f}%")
+            add(f"업로드 성공률: {success_rate:.1f}%")
         
-        logger.info("-"*80)
+        add("-"*80)
         
         # 다운로드 캐시 통계
         try:
             db_stats = self.revision_db.get_statistics()
             cached_downloads = db_stats.get('cached_downloads', 0)
             if cached_downloads > 0:
-                logger.info(f"다운로드 캐시: {cached_downloads}개 URL 캐시됨")
-                logger.info("-"*80)
+                add(f"다운로드 캐시: {cached_downloads}개 URL 캐시됨")
+                add("-"*80)
         except Exception as e:
             logger.debug(f"다운로드 캐시 통계 조회 실패: {e}")
         
-        logger.info("="*80)
+        add("="*80)
+        logger.info("\n".join(lines))
 
     def sync_dataset_with_db(self, dataset_name: str, fix: bool = False) -> Dict:
         """
@@ -129,6 +129,19 @@ PDF_SPLIT_SIZE_MB = int(os.getenv("PDF_SPLIT_SIZE_MB", "120"))
 # PDF 분할 설정 (페이지 수 단위, 0이면 비활성화)
 PDF_SPLIT_MAX_PAGES = int(os.getenv("PDF_SPLIT_MAX_PAGES", "0"))
 
+# ZIP 압축 해제 및 내부 파일 병렬 처리 스레드 수 (1 = 순차 처리, 기본값, 0 = CPU 코어 수)
+# 복호화/엑셀 단순화/PDF 분할은 병렬로, HWP/Office 변환은 한 번에 하나씩 수행
+FILE_PROCESS_WORKERS = int(os.getenv("FILE_PROCESS_WORKERS", "1"))
+
+# URL 다운로드 분할 연결 수 (1 = 단일 연결, 기본값)
+# 2 이상이면 Range 요청을 지원하는 서버에서 큰 파일을 여러 구간으로 나누어 동시에 다운로드
+DOWNLOAD_PARALLEL_PARTS = int(os.getenv("DOWNLOAD_PARALLEL_PARTS", "1"))
+
+# ZIP 압축 해제에 ISA-L(isal 패키지) 사용 여부 (기본값: false)
+# true면 zipfile 모듈의 해제 함수를 교체하므로 openpyxl 등 프로세스 내 모든 ZIP 읽기에 적용됨
+# (배치 실행 시작 시 file_handler.enable_isal_zip()에서 적용, 모듈 import만으로는 적용되지 않음)
+ZIP_USE_ISAL = os.getenv("ZIP_USE_ISAL", "false").lower() == "true"
+
 # HWP 변환용 Python 인터프리터 경로 (Linux 전용)
 # 가상환경을 사용하는 경우 가상환경의 python 경로를 지정하세요
 # 예: /home/minds/libre-converter/venv/bin/python
@@ -264,6 +277,17 @@ ROW_SEPARATOR = os.getenv("ROW_SEPARATOR", "\n---\n")
 # - "excel": Excel 파일로 추출하여 .xlsx 파일로 업로드
 HISTORY_SHEET_UPLOAD_FORMAT = os.getenv("HISTORY_SHEET_UPLOAD_FORMAT", "text").lower()
 
+# ==================== 엑셀 처리 설정 ====================
+# 시트 병렬 처리 프로세스 수 (1 = 순차 처리, 기본값, 0 = CPU 코어 수)
+# 2 이상이면 시트별로 별도 프로세스에서 워크북을 열어 동시에 처리
+EXCEL_SHEET_WORKERS = int(os.getenv("EXCEL_SHEET_WORKERS", "1"))
+# 병렬 처리를 적용할 최소 가시 시트 수 (이보다 적으면 워크북을 다시 여는 비용이 더 커서 순차 처리)
+EXCEL_PARALLEL_MIN_SHEETS = int(os.getenv("EXCEL_PARALLEL_MIN_SHEETS", "4"))
+# 연속 빈 행이 이 수에 도달하면 시트 데이터가 끝난 것으로 보고 스캔 중단 (0 = 끝까지 스캔)
+# 시트 dimension이 실제보다 크게 기록된 경우 max_row까지 헛도는 것을 방지
+# 예약된 빈 블록이 이보다 긴 대장형 시트는 값을 늘리거나 0으로 설정
+EXCEL_BLANK_ROW_LIMIT = int(os.getenv("EXCEL_BLANK_ROW_LIMIT", "1000"))
+
 # ==================== 테스트 모드 설정 ====================
 # 테스트 모드 활성화 여부
 TEST_MODE = os.getenv("TEST_MODE", "false").lower() == "true"
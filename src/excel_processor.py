@@ -2,18 +2,44 @@
 엑셀 파일 처리 모듈
 시트별 헤더 자동 감지, 하이퍼링크 추출, 숨김 행 제외, 시트 타입 감지
 """
-from typing import List, Dict, Tuple, Optional, Any
+from typing import List, Dict, Tuple, Optional, Any, Iterator
 from pathlib import Path
 from enum import Enum
+from functools import lru_cache
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+import json
+from copy import copy
+import os
+import posixpath
 import re
+import sys
+import weakref
+import zipfile
+import xml.etree.ElementTree as ET
 import openpyxl
+try:
+    import orjson
+except ImportError:  # 선택 의존성: 없으면 표준 json 사용
+    orjson = None
 from openpyxl.worksheet.worksheet import Worksheet
-from openpyxl.utils import get_column_letter, column_index_from_string
+from openpyxl.utils import get_column_letter, column_index_from_string, range_boundaries, coordinate_to_tuple
 from openpyxl.cell.cell import Cell
+from openpyxl.utils.datetime import from_excel, from_ISO8601
+from openpyxl.cell.text import Text
+from openpyxl.packaging.manifest import Manifest
+from openpyxl.reader.strings import read_string_table
+from openpyxl.reader.workbook import WorkbookParser
+from openpyxl.styles.stylesheet import Stylesheet
+from openpyxl.xml.constants import (
+    ARC_CONTENT_TYPES, ARC_STYLE, ARC_WORKBOOK, SHARED_STRINGS, XLSM, XLSX, XLTM, XLTX,
+)
+from openpyxl.xml.functions import fromstring as xml_fromstring
 from logger import logger
 from config import (
     TEST_MODE, TEST_MAX_SHEETS, TEST_MAX_ROWS,
-    SHEET_TYPE_KEYWORDS, COLUMN_NAME_MAPPINGS,
+    SHEET_TYPE_KEYWORDS, COLUMN_NAME_MAPPINGS, EXCEL_SHEET_WORKERS, EXCEL_PARALLEL_MIN_SHEETS,
+    EXCEL_BLANK_ROW_LIMIT,
     MAX_TEXT_LENGTH, ROW_SEPARATOR, TEXT_ENCODING
 )
 
@@ -29,6 +55,226 @@ class SheetType(Enum):
     UNKNOWN = "미분류"  # 알 수 없는 타입
 
 
+# xlsx(OOXML) 네임스페이스 (하이퍼링크 사전 수집용)
+_NS_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_NS_REL = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_NS_PKG_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+# 헤더 행 판별용 일반 키워드 (셀마다 키워드를 순회하지 않도록 하나의 정규식으로 컴파일)
+_HEADER_KEYWORDS = ('년도', '제목', '구분', '번호', '이름', '코드', '상태',
+                    '날짜', '작성', '담당', '버전', 'WBS', '종별', '관리')
+
+# 헤더 후보 행의 셀 값을 '\x00'으로 이어 붙인 문자열에서 조건을 만족하는 '셀 수'를 한 번에 계산
+# - 각 매치는 셀 시작(^ 또는 \x00)에서만 시작하고 \x00을 넘지 않으므로 셀당 최대 1회 매치
+_CELL_WITH_KEYWORD_RE = re.compile(
+    '(?:^|\x00)[^\x00]*?(?:' + '|'.join(map(re.escape, _HEADER_KEYWORDS)) + ')'
+)
+_CELL_WITH_PARENS_RE = re.compile(r'(?:^|\x00)(?=[^\x00]*\()(?=[^\x00]*\))')
+
+
+def _score_header_values(values: List[str]) -> int:
+    """
+    헤더 후보 행의 값 특성 점수 (워크시트 접근 없는 순수 함수)
+    - values: 숨김 컬럼을 제외한 선두 10개 값 (strip 완료, 빈 값 제외)
+    """
+    joined = '\x00'.join(values)
+    # 괄호가 있으면 헤더일 가능성 높음 (예: "년도(1)")
+    score = 5 * len(_CELL_WITH_PARENS_RE.findall(joined))
+    # 일반적인 헤더 키워드
+    score += 3 * len(_CELL_WITH_KEYWORD_RE.findall(joined))
+    # 단순 숫자 1~2자리면 제목일 가능성 높음 (감점)
+    score -= 3 * sum(1 for cell_str in values if len(cell_str) <= 2 and cell_str.isdigit())
+    # 너무 긴 텍스트는 제목일 가능성 높음 (감점)
+    score -= 2 * sum(1 for cell_str in values if len(cell_str) > 30)
+    return score
+
+# =HYPERLINK("url", "표시명") 수식에서 첫 번째 따옴표 문자열(url) 추출
+_HYPERLINK_FORMULA_RE = re.compile(r'=HYPERLINK[^"]*"([^"]*)"')
+
+# 시트 타입별 키워드(소문자)를 하나의 정규식으로 컴파일: 시트명/헤더 문자열을 타입당 한 번만 스캔
+# (키워드가 비어 있는 타입은 어떤 문자열과도 매칭되지 않도록 (?!) 사용)
+_SHEET_TYPE_KEYWORD_RE = {
+    kind: re.compile('|'.join(re.escape(kw.lower()) for kw in keywords) or '(?!)')
+    for kind, keywords in SHEET_TYPE_KEYWORDS.items()
+}
+
+# 문서 키 정규화: 공백, '/', '\\'를 '_'로 (replace 3회 대신 translate 1회)
+_DOCUMENT_KEY_TRANS = str.maketrans({' ': '_', '/': '_', '\\': '_'})
+
+
+@lru_cache(maxsize=8192)
+def _build_document_key(value: str, sheet_name: str) -> str:
+    """문서 키 조립 + 정규화 (같은 WBS/관리번호가 여러 행에 반복되므로 결과를 캐시)"""
+    return f"{value}_{sheet_name}".translate(_DOCUMENT_KEY_TRANS)
+
+
+@lru_cache(maxsize=1024)
+def _column_label(col: int) -> str:
+    """빈 헤더용 자동 컬럼명 'Column_N' (intern된 동일 객체를 시트/호출 간 재사용)"""
+    return sys.intern(f"Column_{col}")
+
+
+@lru_cache(maxsize=4096)
+def _normalize_cell_text(text: str) -> Optional[str]:
+    """
+    셀 문자열의 모든 공백류(줄바꿈, 탭 포함)를 단일 공백으로 정규화 (빈 결과는 None)
+    헤더/구분 값처럼 같은 문자열이 행마다 반복되므로 결과를 캐시한다.
+    """
+    s = " ".join(text.split())
+    return s if s else None
+
+
+# 행/헤더 카운팅에서 제외할 범례/참고 표식 (선두 한 글자, str.startswith에 튜플로 전달)
+_LEGEND_MARKERS = (
+    '※', '◎', '★', '☆', '●', '○', '■', '□', '◇', '◆', '▲', '△', '▼', '▽',
+    '▶', '▷', '▸', '▹', '•', '∙', '·', '–', '—'
+)
+
+# 목차 이동 링크 문구: 이 문구가 있는 행(과 그 직전 행)은 헤더에서 제외
+_TOC_MARKERS = ("목차로 되돌아가기",)
+
+
+# 부-헤더 상징 토큰 판정용 정규식 (_is_symbolic_token)
+_SYMBOL_SEPARATOR_RE = re.compile(r"[ \t\r\n\.]")
+_SYMBOL_ALPHA_NUM_RE = re.compile(r"[A-Za-z]+\s+\d+")
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
+_SYMBOL_ALLOWED_RE = re.compile(r"[A-Za-z0-9._\-'/]+")
+_SYMBOL_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}|\d{2}/\d{1,2}/\d{1,2}")
+
+
+@lru_cache(maxsize=2048)
+def _is_symbolic_text(text: str) -> bool:
+    """
+    _is_symbolic_token 본체 (문자열에 대해 결정적이므로 캐시)
+    INV, TYPE1, FTM, SEGMENT 같은 토큰은 시트/행을 넘나들며 반복되므로 판정 결과를 재사용한다
+    """
+    # 스마트쿼트 등 통일
+    text = text.replace("’", "'")
+    # 공백/개행/마침표는 라벨 내 구분자로 취급하여 제거 후 평가
+    # 예: "TDCS DU2" -> "TDCSDU2", "REV. TAG" -> "REVTAG"
+    condensed = _SYMBOL_SEPARATOR_RE.sub("", text)
+    # "TYPE 1"처럼 알파벳 + 공백 + 숫자 패턴도 동일하게 축약
+    if _SYMBOL_ALPHA_NUM_RE.fullmatch(text):
+        condensed = _WHITESPACE_RUN_RE.sub("", text)
+    # 허용 길이(공백/마침표 제거 기준)
+    if len(condensed) > 12:
+        return False
+    # 허용 문자: 영문/숫자/._-'/ (공백, 마침표는 위에서 제거된 상태)
+    if not _SYMBOL_ALLOWED_RE.fullmatch(condensed):
+        return False
+    # 숫자만은 제외
+    if condensed.isdigit():
+        return False
+    # 날짜/시간 패턴 간단 배제
+    if _SYMBOL_DATE_RE.search(condensed):
+        return False
+    # 대문자 비율(알파 기준) 체크 - 중간 리스트 없이 개수만 센다
+    letter_count = 0
+    upper_count = 0
+    for c in condensed:
+        if c.isalpha():
+            letter_count += 1
+            if c.isupper():
+                upper_count += 1
+    if letter_count and upper_count / letter_count < 0.6:
+        return False
+    return True
+
+
+def _has_text(value: Any) -> bool:
+    """
+    셀 값이 비어 있지 않은지 판정 (str(value).strip() != ''와 동일)
+    - 문자열만 strip 검사하고, 숫자/날짜/불리언은 str() 변환 없이 True
+    """
+    if value is None:
+        return False
+    if isinstance(value, str):
+        return value.strip() != ''
+    return True
+
+
+# _cells가 없는 openpyxl 버전용 시트별 셀 dict (시트 객체가 사라지면 함께 해제)
+_fallback_sheet_cells: "weakref.WeakKeyDictionary[Worksheet, Dict[Tuple[int, int], Cell]]" = weakref.WeakKeyDictionary()
+
+
+def _sheet_cells(sheet: Worksheet) -> Dict[Tuple[int, int], Cell]:
+    """
+    시트에 저장된 셀 {(row, col): 셀} 반환 (전체 로드 모드)
+    - 공개 API인 iter_rows()/sheet.cell()은 빈 좌표마다 셀 객체를 새로 만들므로
+      openpyxl 비공개 속성 Worksheet._cells를 직접 사용 (openpyxl 3.1 기준, requirements.txt에서 버전 범위 고정)
+    - _cells가 없는 버전이면 iter_rows()로 같은 형태의 dict를 시트당 1회 만들어 사용 (느리지만 결과 동일)
+    """
+    cells = getattr(sheet, '_cells', None)
+    if isinstance(cells, dict):
+        return cells
+    cells = _fallback_sheet_cells.get(sheet)
+    if cells is None:
+        logger.warning(f"openpyxl Worksheet._cells 없음 → iter_rows()로 셀 목록 구성: {sheet.title}")
+        cells = {(cell.row, cell.column): cell for row in sheet.iter_rows() for cell in row}
+        _fallback_sheet_cells[sheet] = cells
+    return cells
+
+
+# 텍스트 청크 길이 계산용 행 구분자 길이 (행마다 len()을 다시 계산하지 않도록 상수화)
+_ROW_SEP_LEN = len(ROW_SEPARATOR)
+
+# 시트 범위 이상치 판정 기준: 서식만 있는 빈 셀 때문에 열/행 범위가 부풀려진 경우
+# (예: A1:XFD1048576) 실제 값이 있는 셀 기준으로 범위를 다시 계산한다
+DIMENSION_MAX_COLUMN = 256
+EXCEL_MAX_ROW = 1048576
+EXCEL_MAX_COLUMN = 16384
+
+
+@lru_cache(maxsize=4096)
+def _normalize_keyword(text: str) -> str:
+    """헤더/키워드 비교용 정규화 (앞뒤 공백 제거, 내부 공백 제거, 소문자) - 동일 문자열은 캐시 재사용"""
+    return text.strip().replace(' ', '').lower()
+
+
+@lru_cache(maxsize=256)
+def _normalize_keyword_tuple(keywords: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    키워드/헤더 목록 전체를 한 번에 정규화 (목록 단위로 캐시)
+    - 설정 키워드와 시트 헤더 모두 같은 목록으로 반복 호출되므로 시트 타입 감지/키 컬럼 탐색이 결과를 공유한다
+    """
+    return tuple(_normalize_keyword(keyword) for keyword in keywords)
+
+
+# 컬럼명 매핑 키워드를 임포트 시 한 번 정규화: { 'rev': ('rev', ...), 'wbs': (...), ... }
+_COLUMN_KEYWORDS = {
+    kind: _normalize_keyword_tuple(tuple(keywords)) for kind, keywords in COLUMN_NAME_MAPPINGS.items()
+}
+
+
+def _first_matching_column(normalized_headers: Tuple[str, ...], normalized_keywords: Tuple[str, ...]) -> Optional[int]:
+    """정규화된 헤더 중 키워드를 포함하는 첫 컬럼 인덱스 (0-based, 없으면 None)"""
+    for idx, header in enumerate(normalized_headers):
+        if any(keyword in header for keyword in normalized_keywords):
+            return idx
+    return None
+
+
+def _all_matching_columns(normalized_headers: Tuple[str, ...], normalized_keywords: Tuple[str, ...]) -> List[int]:
+    """정규화된 헤더 중 키워드를 하나라도 포함하는 모든 컬럼 인덱스 (0-based)"""
+    return [
+        idx for idx, header in enumerate(normalized_headers)
+        if any(keyword in header for keyword in normalized_keywords)
+    ]
+
+
+# process_all_sheets_flat 결과 컬럼 (열 단위 리스트, pyarrow.table()/DataFrame에 그대로 전달 가능)
+FLAT_RESULT_COLUMNS = (
+    'sheet_name', 'row_number', 'hyperlink', 'hyperlinks',
+    'document_key', 'revision', 'metadata_json',
+)
+
+# 이 길이 이하의 메타데이터 값은 시트 내에서 같은 문자열 객체를 공유 (구분/상태 등 반복 값의 메모리 절감)
+VALUE_POOL_MAX_LEN = 32
+
+# 첫 컬럼이 빈 선행 행 대기 버퍼 크기 (초과 시 가장 오래된 행부터 폐기)
+PENDING_ROWS_MAX = 7
+
+
 class ExcelProcessor:
     """엑셀 파일 처리 클래스"""
     
@@ -37,16 +283,73 @@ class ExcelProcessor:
         self.workbook = None
         # data_only=True로 로드한 워크북(수식의 계산된 값 접근용, 지연 로드)
         self._workbook_data_only = None
-        # 시트별 컬럼 숨김 캐시: { sheet_name: {col_idx: bool_hidden} }
+        # 시트별 숨김 컬럼 캐시: { sheet_name: {col_idx: True} } (숨김 컬럼만 기록)
         self._sheet_col_hidden_map: Dict[str, Dict[int, bool]] = {}
+        # 시트 XML에서 사전 수집한 하이퍼링크 원본: { sheet_name: [(ref, target), ...] } (지연 로드)
+        self._hyperlinks: Optional[Dict[str, List[Tuple[str, str]]]] = None
+        # 시트별 좌표 → 하이퍼링크 맵: { sheet_name: {(row, col): target} }
+        self._sheet_hyperlink_map: Dict[str, Dict[Tuple[int, int], str]] = {}
+        # 시트별 헤더 행 감지 결과 캐시: { sheet_name: (header_row, max_col) }
+        self._header_row_cache: Dict[str, Tuple[int, int]] = {}
+        # 시트별 헤더/데이터 시작 행 캐시: { sheet_name: (headers, data_start_row, (header_start, header_end)) }
+        self._headers_cache: Dict[str, Tuple[List[str], int, Tuple[int, int]]] = {}
+        # 텍스트 변환 대상 시트(이력관리/소프트웨어)의 행 레코드: { sheet_name: [(row_idx, 첫 컬럼 값 여부, metadata), ...] }
+        # process_sheet(record_text_rows=True) 스캔에서 기록해 두고 iter_text_chunks가 1회 소비 (같은 행을 다시 훑지 않도록)
+        self._row_records_cache: Dict[str, List[Tuple[int, bool, Dict[str, str]]]] = {}
+        # 시트별 숨김 행 번호 집합 캐시: { sheet_name: frozenset(rows) }
+        self._hidden_rows_cache: Dict[str, frozenset] = {}
+        # 시트별 유효 범위 캐시: { sheet_name: (max_row, max_col) }
+        self._sheet_extent_cache: Dict[str, Tuple[int, int]] = {}
+        # 시트별 행 → 그 행에 걸친 병합 영역의 최대 컬럼 폭: { sheet_name: {row: span} }
+        self._row_merge_span_cache: Dict[str, Dict[int, int]] = {}
+        # 시트별 병합 인덱스: { sheet_name: ({row: [(min_col, max_col, top_row, top_col), ...]}, 아래로 이어지는 병합이 있는 행 집합) }
+        self._merge_index_cache: Dict[str, Tuple[Dict[int, List[Tuple[int, int, int, int]]], frozenset]] = {}
+        # 헤더 범위 판정용 행별 정규화 텍스트 캐시: { sheet_name: {row: [col1_text, col2_text, ...]} }
+        self._row_text_cache: Dict[str, Dict[int, List[Optional[str]]]] = {}
+        # 시트 타입 판별 결과 캐시: { (sheet_name, headers): SheetType }
+        self._sheet_type_cache: Dict[Tuple[str, Tuple[str, ...]], SheetType] = {}
+        # 시트 XML에서 직접 읽은 계산 값(캐시 값) 그리드: { sheet_name: {(row, col): value} 또는 None(읽기 실패) }
+        self._cached_values: Dict[str, Optional[Dict[Tuple[int, int], Any]]] = {}
+        self._shared_strings: Optional[List[str]] = None
+        # 패키지 정보 (_read_package에서 openpyxl과 같은 방식으로 1회 구성)
+        self._sheet_parts: Optional[Dict[str, str]] = None
+        self._shared_strings_path: Optional[str] = None
+        self._date_formats: frozenset = frozenset()
+        self._timedelta_formats: frozenset = frozenset()
+        
+    def _reset_sheet_caches(self):
+        """워크북을 (다시) 로드할 때 시트 단위 캐시 초기화"""
+        self._close_data_only_workbook()
+        self._sheet_col_hidden_map.clear()
+        self._hyperlinks = None
+        self._sheet_hyperlink_map.clear()
+        self._header_row_cache.clear()
+        self._headers_cache.clear()
+        self._row_records_cache.clear()
+        self._sheet_extent_cache.clear()
+        self._hidden_rows_cache.clear()
+        self._row_merge_span_cache.clear()
+        self._merge_index_cache.clear()
+        self._row_text_cache.clear()
+        self._sheet_type_cache.clear()
+        self._cached_values.clear()
+        self._shared_strings = None
+        self._sheet_parts = None
+        self._shared_strings_path = None
+        self._date_formats = frozenset()
+        self._timedelta_formats = frozenset()
         
     def load_workbook(self):
         """엑셀 파일 로드"""
         try:
+            self._reset_sheet_caches()
+            # read_only 모드는 병합 영역/행·열 숨김 정보/임의 셀 접근을 지원하지 않아 사용할 수 없음
+            # (값 스캔 비용은 시트 XML 직접 파싱(_load_cached_values)과 행 단위 스트리밍으로 줄인다)
             self.workbook = openpyxl.load_workbook(
                 self.excel_path, 
                 data_only=False,  # 하이퍼링크 읽기 위해 False
-                keep_vba=False
+                keep_vba=False,
+                keep_links=False  # 외부 통합문서 링크 캐시는 사용하지 않으므로 로드 생략
             )
             logger.info(f"엑셀 파일 로드 완료: {self.excel_path}")
             return True
@@ -64,14 +367,385 @@ class ExcelProcessor:
         try:
             self._workbook_data_only = openpyxl.load_workbook(
                 self.excel_path,
+                read_only=True,  # 값 스냅샷용으로 한 번만 순차 조회 (병합/서식 정보는 원본 워크북 사용)
                 data_only=True,
-                keep_vba=False
+                keep_vba=False,
+                keep_links=False
             )
             logger.debug("data_only 워크북 로드 완료 (수식 캐시 값 접근용)")
         except Exception as e:
             logger.debug(f"data_only 워크북 로드 실패: {e}")
             self._workbook_data_only = None
     
+    def _close_data_only_workbook(self):
+        """read_only로 연 data_only 워크북은 파일 핸들을 유지하므로 명시적으로 닫는다"""
+        if self._workbook_data_only is not None:
+            self._workbook_data_only.close()
+            self._workbook_data_only = None
+    
+    def _read_rels(self, zf: zipfile.ZipFile, rels_path: str) -> Dict[str, str]:
+        """.rels 파트를 읽어 {rId: Target} 반환 (파트가 없으면 빈 dict)"""
+        try:
+            root = ET.fromstring(zf.read(rels_path))
+        except KeyError:
+            return {}
+        return {rel.get('Id'): rel.get('Target') for rel in root.iter(f'{_NS_PKG_REL}Relationship')}
+
+    def _read_package(self, zf: zipfile.ZipFile):
+        """
+        openpyxl ExcelReader와 같은 방식으로 패키지 정보를 1회 구성
+        - [Content_Types].xml에서 워크북/공유 문자열 파트 경로 결정
+        - 워크북 관계 파일로 {시트명: 시트 XML 경로} 매핑
+        - styles.xml의 셀 서식 중 날짜/기간 서식 인덱스 (openpyxl이 숫자를 날짜로 바꾸는 기준)
+        """
+        manifest = Manifest.from_tree(xml_fromstring(zf.read(ARC_CONTENT_TYPES)))
+        
+        workbook_part = ARC_WORKBOOK
+        for content_type in (XLTM, XLTX, XLSM, XLSX):
+            part = manifest.find(content_type)
+            if part:
+                workbook_part = part.PartName[1:]
+                break
+        parser = WorkbookParser(zf, workbook_part, keep_links=False)
+        parser.parse()
+        sheet_parts = {sheet.name: rel.target for sheet, rel in parser.find_sheets()}
+        
+        strings_part = manifest.find(SHARED_STRINGS)
+        self._shared_strings_path = strings_part.PartName[1:] if strings_part is not None else None
+        
+        try:
+            stylesheet = Stylesheet.from_tree(xml_fromstring(zf.read(ARC_STYLE)))
+        except KeyError:
+            stylesheet = None
+        # 셀 서식이 없으면 openpyxl은 기본 워크북의 빈 날짜 서식 목록을 그대로 사용
+        if stylesheet is not None and stylesheet.cell_styles:
+            self._date_formats = frozenset(stylesheet.date_formats)
+            self._timedelta_formats = frozenset(stylesheet.timedelta_formats)
+        else:
+            self._date_formats = frozenset()
+            self._timedelta_formats = frozenset()
+        
+        self._sheet_parts = sheet_parts
+
+    def _read_shared_strings(self, zf: zipfile.ZipFile) -> List[str]:
+        """공유 문자열 테이블을 openpyxl의 read_string_table로 읽음 (x005F_ 이스케이프 처리 등 동일)"""
+        if self._shared_strings_path is None:
+            return []
+        with zf.open(self._shared_strings_path) as src:
+            return read_string_table(src)
+
+    def _load_cached_values(self, sheet: Worksheet) -> Optional[Dict[Tuple[int, int], Any]]:
+        """
+        시트 XML의 <c><v> 캐시 값을 직접 읽어 {(row, col): value} 그리드 구성 (시트당 1회, 캐시)
+        - data_only=True 워크북을 통째로 한 번 더 로드하는 대신 필요한 시트만 스트리밍 파싱
+        - 값 변환(숫자/날짜/불리언/문자열)과 병합 셀 처리(좌상단 외 값은 None)는 openpyxl data_only와 동일
+        - 직접 읽기에 실패하면 read_only data_only 워크북을 한 번 훑어 같은 그리드를 만들고,
+          그것도 실패하면 None을 반환한다 (호출부는 수식 문자열이 포함될 수 있는 원본 값으로 폴백)
+        """
+        sheet_name = sheet.title
+        if sheet_name in self._cached_values:
+            return self._cached_values[sheet_name]
+
+        try:
+            grid = self._parse_cached_values(sheet_name)
+        except Exception as e:
+            logger.debug(f"시트 '{sheet_name}' 캐시 값 직접 읽기 실패 (data_only 워크북으로 폴백): {e}")
+            grid = None
+
+        if grid is None:
+            grid = self._read_cached_values_with_openpyxl(sheet_name)
+
+        if grid is not None:
+            # openpyxl은 병합 영역의 좌상단 외 셀을 MergedCell(값 None)로 대체하므로 동일하게 제거
+            for mrange in sheet.merged_cells.ranges:
+                for r in range(mrange.min_row, mrange.max_row + 1):
+                    for c in range(mrange.min_col, mrange.max_col + 1):
+                        if r != mrange.min_row or c != mrange.min_col:
+                            grid.pop((r, c), None)
+
+        self._cached_values[sheet_name] = grid
+        return grid
+
+    def _read_cached_values_with_openpyxl(self, sheet_name: str) -> Optional[Dict[Tuple[int, int], Any]]:
+        """
+        (폴백) read_only data_only 워크북에서 시트 값을 iter_rows 1회로 읽어 그리드 구성
+        read_only 시트는 임의 셀 접근(cell())이 매번 XML을 다시 스트리밍하므로 좌표별 조회 대신 한 번에 읽는다.
+        """
+        self._ensure_data_only_workbook()
+        if self._workbook_data_only is None or sheet_name not in self._workbook_data_only.sheetnames:
+            return None
+        try:
+            grid: Dict[Tuple[int, int], Any] = {}
+            d_sheet = self._workbook_data_only[sheet_name]
+            # read_only 시트는 선언된 dimension(예: A1:XFD1048576)까지 빈 값으로 채워 행을 만들므로
+            # 본 워크북에서 보정한 유효 범위로 읽기 범위를 제한한다
+            max_row, max_col = self._get_sheet_extent(self.workbook[sheet_name])
+            rows_iter = d_sheet.iter_rows(min_row=1, max_row=max_row, max_col=max_col, values_only=True)
+            for row_idx, row_values in enumerate(rows_iter, start=1):
+                for col_idx, value in enumerate(row_values, start=1):
+                    if value is not None:
+                        grid[(row_idx, col_idx)] = value
+            return grid
+        except Exception as e:
+            logger.debug(f"시트 '{sheet_name}' data_only 값 읽기 실패: {e}")
+            return None
+
+    def _parse_cached_values(self, sheet_name: str) -> Optional[Dict[Tuple[int, int], Any]]:
+        """시트 XML을 iterparse로 스트리밍하며 셀 캐시 값을 변환 (행 단위로 요소 해제)"""
+        v_tag = f'{_NS_MAIN}v'
+        c_tag = f'{_NS_MAIN}c'
+        row_tag = f'{_NS_MAIN}row'
+        is_tag = f'{_NS_MAIN}is'
+        epoch = self.workbook.epoch
+
+        with zipfile.ZipFile(self.excel_path) as zf:
+            if self._sheet_parts is None:
+                self._read_package(zf)
+            sheet_path = self._sheet_parts.get(sheet_name)
+            if sheet_path is None:
+                return None
+            date_formats = self._date_formats
+            timedelta_formats = self._timedelta_formats
+
+            grid: Dict[Tuple[int, int], Any] = {}
+            row_counter = 0
+            with zf.open(sheet_path) as src:
+                for _event, row_el in ET.iterparse(src):
+                    if row_el.tag != row_tag:
+                        continue
+                    row_attr = row_el.get('r')
+                    row_counter = int(row_attr) if row_attr else row_counter + 1
+                    col_counter = 0
+                    for c_el in row_el.iterfind(c_tag):
+                        ref = c_el.get('r')
+                        if ref:
+                            row, col = coordinate_to_tuple(ref)
+                            col_counter = col
+                        else:
+                            col_counter += 1
+                            row, col = row_counter, col_counter
+
+                        data_type = c_el.get('t', 'n')
+                        if data_type == 'inlineStr':
+                            child = c_el.find(is_tag)
+                            if child is not None:
+                                grid[(row, col)] = Text.from_tree(child).content
+                            continue
+
+                        value = c_el.findtext(v_tag) or None
+                        if value is None:
+                            continue
+                        if data_type == 'n':
+                            value = float(value) if ('.' in value or 'E' in value or 'e' in value) else int(value)
+                            style_id = int(c_el.get('s') or 0)
+                            if style_id in date_formats:
+                                try:
+                                    value = from_excel(value, epoch, timedelta=style_id in timedelta_formats)
+                                except (OverflowError, ValueError):
+                                    value = "#VALUE!"
+                        elif data_type == 's':
+                            if self._shared_strings is None:
+                                self._shared_strings = self._read_shared_strings(zf)
+                            value = self._shared_strings[int(value)]
+                        elif data_type == 'b':
+                            value = bool(int(value))
+                        elif data_type == 'd':
+                            value = from_ISO8601(value)
+                        grid[(row, col)] = value
+                    row_el.clear()
+        return grid
+
+    def _prefetch_hyperlinks(self):
+        """
+        xlsx 아카이브를 직접 열어 시트별 <hyperlink> 요소를 한 번에 수집한다.
+        - 셀마다 cell.hyperlink를 조회하는 대신 행 처리 시 좌표 dict 조회로 대체하기 위함
+        - 결과: self._hyperlinks[sheet_name] = [(ref, target), ...]
+        - 수집에 실패한 시트는 결과에 없으며, 셀 객체에서 직접 수집한다 (_get_sheet_hyperlinks)
+        """
+        self._hyperlinks = {}
+        try:
+            with zipfile.ZipFile(self.excel_path) as zf:
+                if self._sheet_parts is None:
+                    self._read_package(zf)
+                for sheet_name, sheet_path in self._sheet_parts.items():
+                    sheet_dir, sheet_file = posixpath.split(sheet_path)
+                    sheet_rels = self._read_rels(zf, f"{sheet_dir}/_rels/{sheet_file}.rels")
+                    links: List[Tuple[str, str]] = []
+                    with zf.open(sheet_path) as src:
+                        for _event, el in ET.iterparse(src):
+                            if el.tag == f'{_NS_MAIN}hyperlink':
+                                link_target = sheet_rels.get(el.get(f'{_NS_REL}id'))
+                                if link_target and el.get('ref'):
+                                    links.append((el.get('ref'), link_target))
+                            elif el.tag == f'{_NS_MAIN}row':
+                                # 셀 데이터는 필요 없으므로 즉시 해제하여 메모리 사용을 일정하게 유지
+                                el.clear()
+                    self._hyperlinks[sheet_name] = links
+        except Exception as e:
+            logger.debug(f"하이퍼링크 사전 수집 실패 (셀 단위 조회로 폴백): {e}")
+
+    def _get_sheet_hyperlinks(self, sheet: Worksheet) -> Dict[Tuple[int, int], str]:
+        """
+        시트의 {(row, col): target} 하이퍼링크 맵 반환 (시트별 1회 생성 후 캐시)
+        openpyxl과 동일하게 병합 영역 안쪽 셀을 가리키는 단일 링크는 좌상단 셀에 연결한다.
+        """
+        sheet_name = sheet.title
+        cached = self._sheet_hyperlink_map.get(sheet_name)
+        if cached is not None:
+            return cached
+        if self._hyperlinks is None:
+            self._prefetch_hyperlinks()
+
+        link_map: Dict[Tuple[int, int], str] = {}
+        raw_links = self._hyperlinks.get(sheet_name)
+        if raw_links is None:
+            # 폴백: 로드된 셀 객체에서 직접 수집
+            # iter_rows()는 빈 좌표마다 셀을 새로 만들므로, 이미 존재하는 셀만 훑는다
+            for coord, cell in _sheet_cells(sheet).items():
+                link = cell.hyperlink
+                if link and link.target:
+                    link_map[coord] = link.target
+        else:
+            # 병합 영역은 행 인덱스로 조회 (링크마다 전체 병합 목록을 훑지 않음)
+            find_merge_origin = self._find_merge_origin
+            for ref, target in raw_links:
+                is_range = ':' in ref
+                min_col, min_row, max_col, max_row = range_boundaries(ref)
+                for r in range(min_row, max_row + 1):
+                    for c in range(min_col, max_col + 1):
+                        key = (r, c)
+                        origin = find_merge_origin(sheet, r, c)
+                        if origin is not None and origin != key:
+                            # 범위 링크는 병합 셀을 건너뛰고, 단일 링크는 좌상단으로 보정
+                            if is_range:
+                                continue
+                            key = origin
+                        link_map[key] = target
+        self._sheet_hyperlink_map[sheet_name] = link_map
+        return link_map
+
+    def _get_sheet_extent(self, sheet: Worksheet) -> Tuple[int, int]:
+        """
+        시트의 유효 범위 (max_row, max_col) 반환 (시트별 1회 계산, 캐시)
+        - 열 수가 DIMENSION_MAX_COLUMN을 넘거나 행 수가 엑셀 최대 행에 도달하면
+          서식만 적용된 빈 셀로 범위가 부풀려진 것으로 보고 값/링크가 있는 셀 기준으로 다시 계산
+        """
+        cached = self._sheet_extent_cache.get(sheet.title)
+        if cached is not None:
+            return cached
+
+        max_row = sheet.max_row
+        max_col = sheet.max_column or 1
+        if max_col > DIMENSION_MAX_COLUMN or max_row >= EXCEL_MAX_ROW:
+            data_row, data_col = 1, 1
+            # iter_rows()는 빈 좌표마다 셀 객체를 새로 만들므로, 이미 존재하는 셀만 직접 훑는다
+            for (r, c), cell in _sheet_cells(sheet).items():
+                if cell.value is not None or cell.hyperlink is not None:
+                    if r > data_row:
+                        data_row = r
+                    if c > data_col:
+                        data_col = c
+            logger.warning(
+                f"시트 '{sheet.title}' 범위 이상 감지: 선언 {max_row}행 x {max_col}열 → "
+                f"실제 데이터 {data_row}행 x {data_col}열로 보정"
+            )
+            max_row, max_col = data_row, data_col
+
+        self._sheet_extent_cache[sheet.title] = (max_row, max_col)
+        return max_row, max_col
+
+    def _iter_row_values(
+        self, sheet: Worksheet, min_row: int, max_row: int, max_col: int,
+        skip_rows: frozenset = frozenset()
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        iter_rows(values_only=True)와 같은 행별 값 튜플을 셀 객체 생성 없이 반환
+        (전체 로드 모드의 iter_rows는 빈 좌표마다 sheet.cell()로 셀을 새로 만들므로 저장된 셀만 조회한다)
+        - skip_rows(숨김 행 등 호출부가 값을 쓰지 않는 행)는 조회 없이 빈 튜플을 반환 (행 번호 정렬 유지)
+        """
+        get_cell = _sheet_cells(sheet).get
+        cols = range(1, max_col + 1)
+        for r in range(min_row, max_row + 1):
+            if r in skip_rows:
+                yield ()
+                continue
+            row_values = []
+            for c in cols:
+                cell = get_cell((r, c))
+                row_values.append(None if cell is None else cell.value)
+            yield tuple(row_values)
+
+    def _iter_data_rows(
+        self, sheet_name: str, rows_iter: Iterator[Tuple[Any, ...]], min_row: int, max_row: int,
+        hidden_rows: frozenset
+    ) -> Iterator[Tuple[int, Tuple[Any, ...]]]:
+        """
+        _iter_row_values 결과에서 숨김 행/빈 행을 건너뛰고 (row_idx, 값 튜플) 반환
+        - process_sheet와 iter_text_chunks가 같은 행 집합을 보도록 두 경로 모두 이 함수로 행을 읽는다
+        - 연속 빈 행이 EXCEL_BLANK_ROW_LIMIT에 도달하면 남은 행을 읽지 않고 중단 (경고 로그)
+        """
+        blank_streak = 0
+        for row_idx, row_values in enumerate(rows_iter, start=min_row):
+            if row_idx in hidden_rows:
+                continue
+            # 빈 행 건너뛰기 (tuple.count는 C 수준 스캔이라 제너레이터 기반 all()보다 빠름)
+            if row_values.count(None) == len(row_values):
+                blank_streak += 1
+                if 0 < EXCEL_BLANK_ROW_LIMIT <= blank_streak and row_idx < max_row:
+                    logger.warning(
+                        f"시트 '{sheet_name}': 연속 {blank_streak}개 빈 행 감지 → {row_idx}행에서 스캔 종료 "
+                        f"({row_idx + 1}~{max_row}행 미처리, EXCEL_BLANK_ROW_LIMIT로 조정)"
+                    )
+                    return
+                continue
+            blank_streak = 0
+            yield row_idx, row_values
+
+    def _get_row_merge_spans(self, sheet: Worksheet) -> Dict[int, int]:
+        """
+        행별 '그 행에 걸친 병합 영역의 최대 컬럼 폭' 표를 병합 목록 1회 순회로 구성 (시트별 캐시)
+        - 행마다 전체 병합 목록을 다시 훑던 80% 병합 판정을 dict 조회로 대체
+        """
+        spans = self._row_merge_span_cache.get(sheet.title)
+        if spans is not None:
+            return spans
+        spans = {}
+        for mrange in sheet.merged_cells.ranges:
+            merge_col_span = mrange.max_col - mrange.min_col + 1
+            for r in range(mrange.min_row, mrange.max_row + 1):
+                if spans.get(r, 0) < merge_col_span:
+                    spans[r] = merge_col_span
+        self._row_merge_span_cache[sheet.title] = spans
+        return spans
+
+    def _get_merge_index(self, sheet: Worksheet) -> Tuple[Dict[int, List[Tuple[int, int, int, int]]], frozenset]:
+        """
+        병합 영역 인덱스를 병합 목록 1회 순회로 구성 (시트별 캐시)
+        - 행 → 그 행에 걸친 병합 영역 (min_col, max_col, 좌상단 행, 좌상단 열) 목록 (merged_cells 순서 유지)
+        - 아래로 확장되는 병합(min_row <= row < max_row)이 있는 행 집합
+        좌표마다 전체 병합 목록을 훑던 조회를 해당 행의 병합 몇 개만 확인하도록 바꾼다.
+        """
+        index = self._merge_index_cache.get(sheet.title)
+        if index is not None:
+            return index
+        row_ranges: Dict[int, List[Tuple[int, int, int, int]]] = {}
+        downward_rows = set()
+        for mrange in sheet.merged_cells.ranges:
+            entry = (mrange.min_col, mrange.max_col, mrange.min_row, mrange.min_col)
+            for r in range(mrange.min_row, mrange.max_row + 1):
+                row_ranges.setdefault(r, []).append(entry)
+            downward_rows.update(range(mrange.min_row, mrange.max_row))
+        index = (row_ranges, frozenset(downward_rows))
+        self._merge_index_cache[sheet.title] = index
+        return index
+
+    def _find_merge_origin(self, sheet: Worksheet, row: int, col: int) -> Optional[Tuple[int, int]]:
+        """(row, col)이 속한 병합 영역의 좌상단 좌표 (병합 영역이 아니면 None)"""
+        for min_col, max_col, top_row, top_col in self._get_merge_index(sheet)[0].get(row, ()):
+            if min_col <= col <= max_col:
+                return top_row, top_col
+        return None
+
     def get_sheet_names(self) -> List[str]:
         """모든 시트 이름 반환"""
         if not self.workbook:
@@ -87,57 +761,74 @@ class ExcelProcessor:
         2. 괄호나 의미있는 단어 포함 (예: "년도(1)", "제목", "구분")
         3. 단순 숫자나 짧은 텍스트만 있으면 제목일 가능성 높음
         4. 다음 행부터 규칙적인 데이터가 있음
+        
+        결과는 시트별로 캐시되며, 확실한 헤더 행을 만나면 이후 행은 평가하지 않는다.
         """
-        max_search_row = min(15, sheet.max_row + 1)
+        cached = self._header_row_cache.get(sheet.title)
+        if cached is not None:
+            return cached
+        
+        # max_row/max_column은 접근할 때마다 전체 셀을 훑어 계산되므로 한 번만 읽는다
+        sheet_max_row, sheet_max_col = self._get_sheet_extent(sheet)
+        max_search_row = min(15, sheet_max_row + 1)
         candidates = []
+        hidden_cols = self._compute_hidden_cols(sheet)
+        visible_cols = [c for c in range(1, sheet_max_col + 1) if c not in hidden_cols]
+        visible_col_count = len(visible_cols)
+        row_merge_spans = self._get_row_merge_spans(sheet)
+        hidden_rows = self._compute_hidden_rows(sheet)
+        best_score: Optional[int] = None
+
+        # 탐색 구간(최대 15행, 다음 행 평가 포함)의 값을 한 번에 스냅샷 (셀 생성 없음)
+        scan_rows = min(15, sheet_max_row)
+        snapshot = list(self._iter_row_values(sheet, 1, scan_rows, sheet_max_col))
+        def snapshot_value(r: int, c: int) -> Optional[str]:
+            """_get_merged_top_left_value와 동일 규칙(현재 셀 값 우선, 없으면 병합 좌상단 값)을 스냅샷으로 적용"""
+            val = snapshot[r - 1][c - 1]
+            if val is None:
+                return self._merge_tl_value(sheet, r, c)
+            return str(val)
+
+        # 행별 '숨김 컬럼 제외, strip 후 비어있지 않은 값' 목록 (다음 행 평가에서 재사용)
+        row_values_cache: Dict[int, List[str]] = {}
+
+        def row_visible_values(r: int) -> List[str]:
+            values = row_values_cache.get(r)
+            if values is None:
+                values = []
+                for col_idx in visible_cols:
+                    val = snapshot_value(r, col_idx)
+                    if val is None:
+                        continue
+                    cell_str = val.strip()
+                    if cell_str:
+                        values.append(cell_str)
+                row_values_cache[r] = values
+            return values
         
         for row_idx in range(1, max_search_row):
             # 숨김 행은 스킵
-            if self.is_row_hidden(sheet, row_idx):
+            if row_idx in hidden_rows:
                 logger.debug(f"{row_idx}행 점수: 스킵(숨김 행)")
                 continue
 
-            visible_values: List[str] = []
-            visible_values_for_analysis: List[str] = []
-
             # 숨김 컬럼은 제외하고 값 수집
-            sheet_max_col = sheet.max_column or 1
-            for col_idx in range(1, sheet_max_col + 1):
-                if self.is_col_hidden(sheet, col_idx):
-                    continue
-                val = self._get_merged_top_left_value(sheet, row_idx, col_idx)
-                if val is None:
-                    continue
-                cell_str = str(val).strip()
-                if not cell_str:
-                    continue
-                visible_values.append(cell_str)
-                if len(visible_values_for_analysis) < 10:
-                    visible_values_for_analysis.append(cell_str)
+            visible_values = row_visible_values(row_idx)
+            visible_values_for_analysis = visible_values[:10]
             
             # 활성 컬럼의 80% 이상을 병합한 행은 제목 행으로 간주하여 헤더 후보에서 제외
-            visible_col_count = sum(1 for c in range(1, sheet_max_col + 1) if not self.is_col_hidden(sheet, c))
             if visible_col_count > 0:
-                max_merge_span = 0
-                for mrange in sheet.merged_cells.ranges:
-                    if mrange.min_row <= row_idx <= mrange.max_row:
-                        # 이 행에 걸친 병합 영역의 컬럼 범위 계산
-                        merge_col_span = mrange.max_col - mrange.min_col + 1
-                        max_merge_span = max(max_merge_span, merge_col_span)
-                
+                # 이 행에 걸친 병합 영역의 최대 컬럼 범위
+                max_merge_span = row_merge_spans.get(row_idx, 0)
                 if max_merge_span >= visible_col_count * 0.8:
                     logger.debug(f"{row_idx}행 점수: 스킵(80% 이상 병합: {max_merge_span}/{visible_col_count})")
                     continue
                 
 
             # '목차로 되돌아가기'가 포함된 행은 헤더 후보에서 제외
-            try:
-                if any("목차로 되돌아가기" in v for v in visible_values_for_analysis) or \
-                   any("목차로 되돌아가기" in v for v in visible_values):
-                    logger.debug(f"{row_idx}행 점수: 스킵(목차로 되돌아가기 포함)")
-                    continue
-            except Exception:
-                pass
+            if any(m in v for v in visible_values for m in _TOC_MARKERS):
+                logger.debug(f"{row_idx}행 점수: 스킵(목차로 되돌아가기 포함)")
+                continue
 
             non_empty_count = len(visible_values)
 
@@ -146,60 +837,48 @@ class ExcelProcessor:
                 logger.debug(f"{row_idx}행 점수: 스킵(비어있지 않은 셀 {non_empty_count}개 < 3)")
                 continue
 
+            # 이 행이 받을 수 있는 최대 점수(셀 수 + 선두 10개 값 가점 + 다음 행 가점)로도
+            # 현재 최고 점수를 넘지 못하면 채점 생략 (동점은 앞 행 우선)
+            if best_score is not None and non_empty_count + 8 * min(non_empty_count, 10) + 3 <= best_score:
+                logger.debug(f"{row_idx}행 점수: 스킵(최대 가능 점수가 현재 최고 {best_score}점 이하)")
+                continue
+
             # 헤더 점수 계산
             score = 0
 
             # 1. 비어있지 않은 셀이 많을수록 점수 증가
             score += non_empty_count
             # 2. 헤더 특성 분석 (숨김 컬럼 제외한 선두 10개 값 기준)
-            for cell_str in visible_values_for_analysis:
-                # 괄호가 있으면 헤더일 가능성 높음 (예: "년도(1)")
-                if '(' in cell_str and ')' in cell_str:
-                    score += 5
-
-                # 단순 숫자 1~2자리면 제목일 가능성 높음 (감점)
-                if cell_str.isdigit() and len(cell_str) <= 2:
-                    score -= 3
-
-                # 일반적인 헤더 키워드
-                header_keywords = ['년도', '제목', '구분', '번호', '이름', '코드', '상태', 
-                                 '날짜', '작성', '담당', '버전', 'WBS', '종별', '관리']
-                if any(keyword in cell_str for keyword in header_keywords):
-                    score += 3
-
-                # 너무 긴 텍스트는 제목일 가능성 높음 (감점)
-                if len(cell_str) > 30:
-                    score -= 2
+            score += _score_header_values(visible_values_for_analysis)
 
             # 3. 다음 (가시) 행에 데이터가 있는지 확인
-            if row_idx < sheet.max_row:
+            if row_idx < sheet_max_row:
                 next_row_idx = row_idx + 1
                 # 바로 다음 행이 숨김이면 '다음 행' 평가는 생략
-                if not self.is_row_hidden(sheet, next_row_idx):
-                    next_non_empty = 0
-                    for col_idx in range(1, sheet_max_col + 1):
-                        if self.is_col_hidden(sheet, col_idx):
-                            continue
-                        val = self._get_merged_top_left_value(sheet, next_row_idx, col_idx)
-                        if val is None:
-                            continue
-                        if str(val).strip():
-                            next_non_empty += 1
+                if next_row_idx not in hidden_rows:
+                    next_non_empty = len(row_visible_values(next_row_idx))
                     # 다음 행에도 비슷한 개수의 데이터가 있으면 헤더일 가능성 높음
                     if next_non_empty >= non_empty_count * 0.5:
                         score += 3
 
             candidates.append((row_idx, score, non_empty_count))
+            if best_score is None or score > best_score:
+                best_score = score
             logger.debug(f"{row_idx}행 점수: {score} (비어있지 않은 셀: {non_empty_count}개, 숨김 제외)")
+            
+            # 어떤 행도 넘을 수 없는 최대 점수(셀 수 + 선두 10개 값의 괄호/키워드 가점 + 다음 행 가점)에
+            # 도달했으면 이후 행은 이길 수 없으므로(동점은 앞 행 우선) 탐색 중단
+            if score >= visible_col_count + 8 * min(visible_col_count, 10) + 3:
+                logger.debug(f"{row_idx}행: 최대 점수 도달 → 이후 행 탐색 생략")
+                break
         
         # 가장 높은 점수의 행을 헤더로 선택 후, 해당 행의 마지막 의미 있는 컬럼을 max_col로 산출
         def compute_max_col(row_idx: int) -> int:
-            sheet_max_col = sheet.max_column or 1
             last_col = 1
             for c in range(sheet_max_col, 0, -1):
-                if self.is_col_hidden(sheet, c):
+                if c in hidden_cols:
                     continue
-                val = self._get_merged_top_left_value(sheet, row_idx, c)
+                val = snapshot_value(row_idx, c)
                 norm = self._normalize_text(val)
                 if norm and not self._starts_with_legend_marker(norm):
                     last_col = c
@@ -211,11 +890,14 @@ class ExcelProcessor:
             best_row, best_score, best_count = candidates[0]
             max_col = compute_max_col(best_row)
             logger.info(f"헤더 행 감지: {best_row}행 (점수: {best_score}, 비어있지 않은 셀: {best_count}개)")
-            return best_row, max_col
-
-        # 기본값: 1행
-        logger.warning("헤더 행을 찾지 못했습니다. 1행을 헤더로 사용합니다.")
-        return 1, (sheet.max_column or 1)
+            result = (best_row, max_col)
+        else:
+            # 기본값: 1행
+            logger.warning("헤더 행을 찾지 못했습니다. 1행을 헤더로 사용합니다.")
+            result = (1, sheet_max_col)
+        
+        self._header_row_cache[sheet.title] = result
+        return result
     
     # ----- 계층형/병합 헤더 지원 유틸 -----
     def _get_merged_top_left_value(self, sheet: Worksheet, row: int, col: int) -> Optional[str]:
@@ -223,99 +905,121 @@ class ExcelProcessor:
         해당 좌표가 병합영역이면 좌상단 셀 값을 반환, 아니면 현재 셀 값
         (수정: 병합 영역 내라도 현재 셀에 값이 있으면 그 값을 우선 반환 - 헤더 오버라이딩 지원)
         """
-        cell = sheet.cell(row=row, column=col)
         # 1. 현재 셀에 값이 있으면 우선 사용 (병합된 영역 내 숨겨진 값 읽기 용도)
-        if cell.value is not None:
+        #    (sheet.cell()은 없는 좌표에 빈 셀을 만들므로 저장된 셀만 조회)
+        cell = _sheet_cells(sheet).get((row, col))
+        if cell is not None and cell.value is not None:
             return str(cell.value)
 
-        # 2. 값이 없으면 병합 정보 확인하여 좌상단 값 가져오기
-        coord = cell.coordinate
-        for mrange in sheet.merged_cells.ranges:
-            if coord in mrange:
-                top_left = sheet.cell(row=mrange.min_row, column=mrange.min_col)
-                return None if top_left.value is None else str(top_left.value)
-        
-        return None
+        # 2. 값이 없으면 병합 인덱스에서 좌상단 값 가져오기
+        return self._merge_tl_value(sheet, row, col)
+    
+    def _merge_tl_value(self, sheet: Worksheet, row: int, col: int) -> Optional[str]:
+        """
+        (row, col)이 병합 영역에 속하면 좌상단 셀 값(문자열), 아니면 None
+        값 스냅샷을 이미 가진 호출부가 빈 셀에 대해서만 병합 인덱스를 조회할 때 사용 (셀 객체 생성 없음)
+        """
+        origin = self._find_merge_origin(sheet, row, col)
+        if origin is None:
+            return None
+        top_left = _sheet_cells(sheet).get(origin)
+        if top_left is None or top_left.value is None:
+            return None
+        return str(top_left.value)
     
     def _get_merged_top_left_value_evaluated(self, sheet: Worksheet, row: int, col: int) -> Optional[str]:
         """
         병합 좌상단 기준으로 '계산된 값(data_only)'을 우선 반환한다.
-        - data_only 워크북이 없거나 값이 없으면 기존 값으로 폴백.
+        - 계산 값 그리드(_load_cached_values)를 읽지 못했거나 값이 없으면 기존 값으로 폴백.
         """
         try:
-            self._ensure_data_only_workbook()
-            if self._workbook_data_only is not None:
-                d_sheet = self._workbook_data_only[sheet.title]
-                d_cell = d_sheet.cell(row=row, column=col)
-                
+            grid = self._load_cached_values(sheet)
+            if grid is not None:
                 # 1. 현재 셀 값 우선 확인 (하위 헤더 오버라이딩 지원)
-                if d_cell.value is not None:
-                    return str(d_cell.value)
+                value = grid.get((row, col))
+                if value is not None:
+                    return str(value)
 
                 # 2. 병합 영역이면 좌상단 값 확인
-                coord = d_cell.coordinate
-                for mrange in d_sheet.merged_cells.ranges:
-                    if coord in mrange:
-                        tl = d_sheet.cell(row=mrange.min_row, column=mrange.min_col)
-                        return None if tl.value is None else str(tl.value)
+                origin = self._find_merge_origin(sheet, row, col)
+                if origin is not None:
+                    tl = grid.get(origin)
+                    return None if tl is None else str(tl)
+                return self._get_merged_top_left_value(sheet, row, col)
                         
         except Exception as e:
             logger.debug(f"_get_merged_top_left_value_evaluated 실패(row={row}, col={col}): {e}")
         # 폴백: 기존(수식 문자열 포함 가능)
         return self._get_merged_top_left_value(sheet, row, col)
 
+    def _get_row_texts(self, sheet: Worksheet, row: int) -> List[Optional[str]]:
+        """
+        행의 컬럼별 정규화 텍스트 목록 (인덱스 = 컬럼 번호 - 1, 시트 범위 전체, 시트/행별 캐시)
+        _get_merged_top_left_value + _normalize_text와 같은 규칙(현재 셀 값 우선, 없으면 병합 좌상단 값)을
+        행 값 1회 조회로 적용한다. 헤더 범위 판정에서 같은 행을 여러 번 훑을 때 재사용한다.
+        """
+        sheet_rows = self._row_text_cache.setdefault(sheet.title, {})
+        texts = sheet_rows.get(row)
+        if texts is not None:
+            return texts
+        _sheet_max_row, sheet_max_col = self._get_sheet_extent(sheet)
+        row_values = next(self._iter_row_values(sheet, row, row, sheet_max_col))
+        texts = []
+        for col, val in enumerate(row_values, start=1):
+            if val is None:
+                val = self._merge_tl_value(sheet, row, col)
+            texts.append(None if val is None else self._normalize_text(str(val)))
+        sheet_rows[row] = texts
+        return texts
+
     def _row_non_empty_count(self, sheet: Worksheet, row: int, max_col: int) -> int:
         count = 0
-        for col in range(1, max_col + 1):
-            if self.is_col_hidden(sheet, col):
-                continue
-            val = self._get_merged_top_left_value(sheet, row, col)
-            norm = self._normalize_text(val)
-            if norm and not self._starts_with_legend_marker(norm):
+        hidden_cols = self._compute_hidden_cols(sheet)
+        for col, norm in enumerate(self._get_row_texts(sheet, row)[:max_col], start=1):
+            if norm and col not in hidden_cols and not self._starts_with_legend_marker(norm):
                 count += 1
         return count
 
     def _row_has_downward_merge_from(self, sheet: Worksheet, row: int) -> bool:
         """row를 포함하면서 아래로 확장되는 병합이 있는지"""
-        for mrange in sheet.merged_cells.ranges:
-            if mrange.min_row <= row <= mrange.max_row and mrange.max_row > row:
-                return True
-        return False
+        return row in self._get_merge_index(sheet)[1]
 
     def _is_row_mostly_merged(self, sheet: Worksheet, row: int, threshold: float = 0.8) -> bool:
         """
         행이 활성 컬럼의 threshold(기본 80%) 이상 병합되어 있는지 확인
         (제목 행처럼 전체가 하나로 병합된 경우 True)
         """
-        sheet_max_col = sheet.max_column or 1
-        visible_col_count = sum(1 for c in range(1, sheet_max_col + 1) if not self.is_col_hidden(sheet, c))
+        _sheet_max_row, sheet_max_col = self._get_sheet_extent(sheet)
+        hidden_cols = self._compute_hidden_cols(sheet)
+        visible_col_count = sum(1 for c in range(1, sheet_max_col + 1) if c not in hidden_cols)
         if visible_col_count == 0:
             return False
         
-        max_merge_span = 0
-        for mrange in sheet.merged_cells.ranges:
-            if mrange.min_row <= row <= mrange.max_row:
-                merge_col_span = mrange.max_col - mrange.min_col + 1
-                max_merge_span = max(max_merge_span, merge_col_span)
-        
+        max_merge_span = self._get_row_merge_spans(sheet).get(row, 0)
         return max_merge_span >= visible_col_count * threshold
 
     def _make_unique_headers(self, headers: List[str]) -> List[str]:
+        keys = [h or "Column" for h in headers]
+        # 중복된 헤더만 번호를 매기도록 먼저 등장 횟수를 센다 (중복이 없으면 그대로 반환)
+        counts = Counter(keys)
+        if len(counts) == len(keys):
+            return keys
         seen: dict[str, int] = {}
         unique: List[str] = []
-        for h in headers:
-            key = h or "Column"
-            if key not in seen:
-                seen[key] = 1
+        for key in keys:
+            if counts[key] == 1:
                 unique.append(key)
-            else:
-                seen[key] += 1
-                unique.append(f"{key} ({seen[key]})")
+                continue
+            n = seen.get(key, 0) + 1
+            seen[key] = n
+            unique.append(key if n == 1 else f"{key} ({n})")
         return unique
 
     def _normalize_text(self, text: Optional[str]) -> Optional[str]:
         if text is None:
             return None
+        if isinstance(text, str):
+            return _normalize_cell_text(text)
         # 모든 공백류(줄바꿈, 탭 포함)를 단일 공백으로 정규화
         s = " ".join(str(text).split())
         return s if s else None
@@ -324,14 +1028,7 @@ class ExcelProcessor:
         """행/헤더 카운팅에서 제외할 범례/참고 표식 여부(선두 특수기호)
         대괄호 등 헤더 그룹 표시는 유지하기 위해 과도한 범위는 피하고, 대표 표식만 필터링.
         """
-        if not text:
-            return False
-        first = text[0]
-        legend_markers = set([
-            '※', '◎', '★', '☆', '●', '○', '■', '□', '◇', '◆', '▲', '△', '▼', '▽',
-            '▶', '▷', '▸', '▹', '•', '∙', '·', '–', '—'
-        ])
-        return first in legend_markers
+        return bool(text) and text.startswith(_LEGEND_MARKERS)
 
     def _is_symbolic_token(self, text: str) -> bool:
         """
@@ -340,33 +1037,7 @@ class ExcelProcessor:
         """
         if not text:
             return False
-        # 스마트쿼트 등 통일
-        text = str(text).replace("’", "'")
-        # 공백/개행/마침표는 라벨 내 구분자로 취급하여 제거 후 평가
-        # 예: "TDCS DU2" -> "TDCSDU2", "REV. TAG" -> "REVTAG"
-        condensed = re.sub(r"[ \t\r\n\.]", "", text)
-        # "TYPE 1"처럼 알파벳 + 공백 + 숫자 패턴도 동일하게 축약
-        if re.fullmatch(r"[A-Za-z]+\s+\d+", text):
-            condensed = re.sub(r"\s+", "", text)
-        # 허용 길이(공백/마침표 제거 기준)
-        if len(condensed) > 12:
-            return False
-        # 허용 문자: 영문/숫자/._-'/ (공백, 마침표는 위에서 제거된 상태)
-        if not re.fullmatch(r"[A-Za-z0-9._\-'/]+", condensed):
-            return False
-        # 숫자만은 제외
-        if condensed.isdigit():
-            return False
-        # 날짜/시간 패턴 간단 배제
-        if re.search(r"\d{4}-\d{2}-\d{2}", condensed) or re.search(r"\d{2}/\d{1,2}/\d{1,2}", condensed):
-            return False
-        # 대문자 비율(알파 기준) 체크
-        letters = [c for c in condensed if c.isalpha()]
-        if letters:
-            upper_ratio = sum(1 for c in letters if c.isupper()) / len(letters)
-            if upper_ratio < 0.6:
-                return False
-        return True
+        return _is_symbolic_text(str(text))
 
     def _is_likely_symbolic_subheader_row(self, sheet: Worksheet, row: int, max_col: int) -> bool:
         """
@@ -374,14 +1045,11 @@ class ExcelProcessor:
         - 비어있지 않은 셀 수: 2~(max_col의 1/2) 범위
         - 비어있지 않은 값 중 80% 이상이 상징 토큰
         """
-        non_empty = []
-        for c in range(1, max_col + 1):
-            if self.is_col_hidden(sheet, c):
-                continue
-            val = self._get_merged_top_left_value(sheet, row, c)
-            norm = self._normalize_text(val)
-            if norm:
-                non_empty.append(norm)
+        hidden_cols = self._compute_hidden_cols(sheet)
+        non_empty = [
+            norm for c, norm in enumerate(self._get_row_texts(sheet, row)[:max_col], start=1)
+            if norm and c not in hidden_cols
+        ]
         count = len(non_empty)
         if count < 2:
             return False
@@ -394,11 +1062,22 @@ class ExcelProcessor:
     def build_headers_and_data_start(self, sheet: Worksheet) -> Tuple[List[str], int, Tuple[int, int]]:
         """
         병합/다단 헤더를 고려하여 헤더를 생성하고 데이터 시작 행을 반환
+        (시트별 1회 계산 후 캐시. 호출부가 목록을 수정해도 캐시가 바뀌지 않도록 헤더는 복사본을 반환)
         
         Returns:
             (headers, data_start_row, (header_start_row, header_end_row))
         """
+        cached = self._headers_cache.get(sheet.title)
+        if cached is None:
+            cached = self._build_headers_and_data_start(sheet)
+            self._headers_cache[sheet.title] = cached
+        headers, data_start_row, header_span = cached
+        return list(headers), data_start_row, header_span
+
+    def _build_headers_and_data_start(self, sheet: Worksheet) -> Tuple[List[str], int, Tuple[int, int]]:
+        """build_headers_and_data_start 본체 (헤더 범위 확장 → 컬럼별 헤더 조립 → 데이터 시작 행 탐색)"""
         base_header_row, max_col = self.detect_header_row(sheet)
+        sheet_max_row, _sheet_max_col = self._get_sheet_extent(sheet)
 
         include_prev = False
         include_next = False
@@ -419,7 +1098,7 @@ class ExcelProcessor:
         
         while extension_count < max_extension:
             next_row = header_end + 1
-            if next_row > (sheet.max_row or next_row):
+            if next_row > (sheet_max_row or next_row):
                 break
             
             should_extend = False
@@ -441,16 +1120,9 @@ class ExcelProcessor:
         header_rows = list(range(header_start, header_end + 1))
         # 2-2) '목차로 되돌아가기' 규칙 적용: 해당 문구가 있는 행과 그 직전 행은 헤더에서 제외
         def row_contains_markers(r: int) -> bool:
-            markers = ["목차로 되돌아가기"]
-            for c in range(1, max_col + 1):
-                val = self._get_merged_top_left_value(sheet, r, c)
-                norm = self._normalize_text(val)
-                if not norm:
-                    continue
-                for m in markers:
-                    if m in norm:
-                        return True
-            return False
+            return any(
+                m in norm for norm in self._get_row_texts(sheet, r)[:max_col] if norm for m in _TOC_MARKERS
+            )
 
         marker_rows = {r for r in header_rows if row_contains_markers(r)}
         exclude_rows = set(marker_rows)
@@ -468,38 +1140,41 @@ class ExcelProcessor:
             # 기준 행이 제외되었다면 그 다음 행을 시도, 그렇지 않으면 기준 행 사용
             candidate = base_header_row + 1 if base_header_row in exclude_rows else base_header_row
             # 시트 범위 내 보정
-            if candidate > (sheet.max_row or candidate):
+            if candidate > (sheet_max_row or candidate):
                 candidate = base_header_row
             header_rows = [candidate]
         # 2-4) 하드코딩 없이 '상징 토큰'으로 구성된 부-헤더 행을 추가로 포함 (최대 2행)
         tail = max(header_rows)
-        for r in range(tail + 1, min(tail + 3, (sheet.max_row or tail) + 1)):
+        for r in range(tail + 1, min(tail + 3, (sheet_max_row or tail) + 1)):
             if self._is_likely_symbolic_subheader_row(sheet, r, max_col):
                 header_rows.append(r)
             else:
                 break
         headers: List[str] = []
+        header_row_texts = [self._get_row_texts(sheet, row) for row in header_rows]
 
+        hidden_cols = self._compute_hidden_cols(sheet)
         for col in range(1, max_col + 1):
-            if self.is_col_hidden(sheet, col):
+            if col in hidden_cols:
                 continue
             parts: List[str] = []
-            for row in header_rows:
-                val = self._get_merged_top_left_value(sheet, row, col)
-                norm = self._normalize_text(val)
+            for row_texts in header_row_texts:
+                norm = row_texts[col - 1] if col <= len(row_texts) else None
                 if norm:
                     if not parts or parts[-1] != norm:
                         parts.append(norm)
-            header_name = ' - '.join(parts) if parts else f"Column_{col}"
+            header_name = ' - '.join(parts) if parts else _column_label(col)
             headers.append(header_name)
 
-        headers = self._make_unique_headers(headers)
+        # 헤더는 모든 행의 메타데이터 dict 키로 쓰이므로 intern하여 해시 캐시/객체를 공유
+        headers = [sys.intern(h) for h in self._make_unique_headers(headers)]
         data_start_row = max(header_rows) + 1
         # 2-5) 헤더 직후 비어있는(또는 숨김) 행들을 건너뛰고 첫 유효 데이터 행으로 보정
         row_probe = data_start_row
-        while row_probe <= (sheet.max_row or row_probe):
+        hidden_rows = self._compute_hidden_rows(sheet)
+        while row_probe <= (sheet_max_row or row_probe):
             # 숨김 행이면 계속 진행
-            if self.is_row_hidden(sheet, row_probe):
+            if row_probe in hidden_rows:
                 row_probe += 1
                 continue
             # 내용이 하나도 없으면 계속 진행
@@ -515,21 +1190,27 @@ class ExcelProcessor:
 
     def _prepare_col_hidden_cache(self, sheet: Worksheet):
         """
-        openpyxl의 column_dimensions를 한 번 훑어 범위(min..max) 단위의 숨김 설정을 캐시한다.
+        openpyxl의 column_dimensions를 한 번 훑어 '사실상 숨김' 컬럼 집합을 캐시한다.
         XML 파싱 없이 dim의 범위 속성(min/max)과 단일 컬럼 속성을 모두 반영한다.
+        - <cols>는 워크북 로드 시 이미 column_dimensions로 파싱되어 있으므로 XML을 다시 읽지 않는다
+        - 숨김 컬럼만 기록한다 (없는 키는 숨김 아님). sheet.max_column은 접근할 때마다 전체 셀을
+          훑으므로 범위를 그것으로 자르지 않고 dim 범위(최대 16384열)를 그대로 적용한다
+        - 윤곽 접힘(collapsed)은 자기 자신과 인접 컬럼까지 여기서 전파하므로 is_col_hidden은 조회만 한다
         """
         sheet_name = sheet.title
         if sheet_name in self._sheet_col_hidden_map:
             return
         hidden_map: Dict[int, bool] = {}
-        max_col = sheet.max_column or 1
-        # 기본값: 모두 False
-        for i in range(1, max_col + 1):
-            hidden_map[i] = False
+        # 인접 컬럼 접힘 전파용: { 컬럼 인덱스: dim } (키 문자 기준)
+        dims_by_idx: Dict[int, Any] = {}
         try:
             for key, dim in sheet.column_dimensions.items():
                 if dim is None:
                     continue
+                try:
+                    dims_by_idx[column_index_from_string(key)] = dim
+                except (TypeError, ValueError):
+                    pass
                 # 범위 우선(min..max). openpyxl이 보존한 경우에 한함
                 min_idx = getattr(dim, 'min', None)
                 max_idx = getattr(dim, 'max', None)
@@ -540,17 +1221,17 @@ class ExcelProcessor:
                         try:
                             if float(width_val) == 0 or float(width_val) <= 0.2:
                                 is_hidden = True
-                        except Exception:
+                        except (TypeError, ValueError):
                             pass
                     if is_hidden:
-                        for ci in range(min_idx, min(max_idx, max_col) + 1):
+                        for ci in range(min_idx, min(max_idx, EXCEL_MAX_COLUMN) + 1):
                             hidden_map[ci] = True
                         logger.debug(f"[col_cache] 범위 {min_idx}-{max_idx} hidden=True 적용")
                     continue
                 # 단일 컬럼(키가 문자 인덱스) 처리
                 try:
                     col_idx = column_index_from_string(key)
-                except Exception:
+                except (TypeError, ValueError):
                     # 키가 문자형이 아닐 수 있음. 이 경우는 스킵
                     continue
                 is_hidden = bool(getattr(dim, 'hidden', False))
@@ -559,98 +1240,51 @@ class ExcelProcessor:
                     try:
                         if float(width_val) == 0 or float(width_val) <= 0.2:
                             is_hidden = True
-                    except Exception:
+                    except (TypeError, ValueError):
                         pass
-                # 윤곽 접힘도 보수적으로 반영
-                if not is_hidden:
-                    outline_level = getattr(dim, 'outlineLevel', 0) or 0
-                    collapsed = getattr(dim, 'collapsed', False)
-                    if outline_level and collapsed:
-                        is_hidden = True
                 if is_hidden:
                     hidden_map[col_idx] = True
+
+            # 윤곽/그룹 접힘 전파 (보수적 처리)
+            # - 접힌 컬럼 자신은 숨김
+            # - 인접 컬럼에 dim이 없으면 접힘에 포함된 것으로 보고 숨김
+            # - 인접 컬럼이 윤곽 레벨을 가지며 접힌 컬럼 레벨 이하이면 숨김
+            for col_idx, dim in dims_by_idx.items():
+                outline_level = getattr(dim, 'outlineLevel', 0) or 0
+                if not (outline_level and getattr(dim, 'collapsed', False)):
+                    continue
+                hidden_map[col_idx] = True
+                for adj_idx in (col_idx - 1, col_idx + 1):
+                    if adj_idx < 1 or adj_idx in hidden_map:
+                        continue
+                    adj_dim = dims_by_idx.get(adj_idx)
+                    if adj_dim is not None:
+                        adj_level = getattr(adj_dim, 'outlineLevel', 0) or 0
+                        if not adj_level or adj_level > outline_level:
+                            continue
+                    hidden_map[adj_idx] = True
+                    logger.debug(
+                        f"[col_cache] 컬럼 {get_column_letter(adj_idx)}: 인접 {get_column_letter(col_idx)} "
+                        f"collapsed=True (outlineLevel={outline_level}) → 숨김 취급"
+                    )
         except Exception as e:
             logger.debug(f"_prepare_col_hidden_cache 실패(sheet='{sheet_name}'): {e}")
         self._sheet_col_hidden_map[sheet_name] = hidden_map
 
-    def is_col_hidden(self, sheet: Worksheet, col_idx: int) -> bool:
-        try:
-            # 캐시 우선
+    def _compute_hidden_cols(self, sheet: Worksheet) -> Dict[int, bool]:
+        """
+        숨김 컬럼 번호 맵 반환 (숨김 컬럼만 키로 가지므로 `col in hidden_cols`로 판정)
+        컬럼 루프에서는 지역 변수로 두고 메서드 호출 없이 조회한다.
+        """
+        hidden_cols = self._sheet_col_hidden_map.get(sheet.title)
+        if hidden_cols is None:
             self._prepare_col_hidden_cache(sheet)
-            cached = self._sheet_col_hidden_map.get(sheet.title, {}).get(col_idx, False)
-            if cached:
-                return True
-            letter = get_column_letter(col_idx)
-            dim = sheet.column_dimensions.get(letter)
-            if dim is None:
-                # 인접 컬럼의 그룹 접힘(collapse) 영향으로 사실상 비가시일 수 있음 (보수적 처리)
-                try:
-                    for offset in (-1, 1):
-                        adj_idx = col_idx + offset
-                        if adj_idx < 1:
-                            continue
-                        adj_letter = get_column_letter(adj_idx)
-                        adj_dim = sheet.column_dimensions.get(adj_letter)
-                        if adj_dim and getattr(adj_dim, 'collapsed', False) and getattr(adj_dim, 'outlineLevel', 0):
-                            logger.debug(f"[is_col_hidden] 컬럼 {letter}: 인접 {adj_letter} collapsed=True (outlineLevel={getattr(adj_dim,'outlineLevel', None)}) → 숨김 취급")
-                            return True
-                except Exception as e:
-                    logger.debug(f"[is_col_hidden] 컬럼 {letter}: 인접 컬럼 검사 중 오류: {e}")
-                logger.debug(f"[is_col_hidden] 컬럼 {letter}: dimension 항목 없음 (sheet='{sheet.title}')")
-                return False
-            # 명시적 숨김
-            if getattr(dim, 'hidden', False):
-                logger.debug(f"[is_col_hidden] 컬럼 {letter}: dim.hidden=True 로 숨김 판정")
-                return True
-            # 너비 0
-            if getattr(dim, 'width', None) == 0:
-                logger.debug(f"[is_col_hidden] 컬럼 {letter}: dim.width=0 로 숨김 판정")
-                return True
-            # 보수적 확장: 극소 너비도 숨김으로 간주
-            width = getattr(dim, 'width', None)
-            if width is not None and isinstance(width, (int, float)) and width <= 0.2:
-                logger.debug(f"[is_col_hidden] 컬럼 {letter}: dim.width={width} <= 0.2 (사실상 비가시) → 숨김 판정")
-                return True
-            # 보수적 확장: 윤곽/그룹 접힘 상태 고려
-            outline_level = getattr(dim, 'outlineLevel', 0) or 0
-            collapsed = getattr(dim, 'collapsed', False)
-            if outline_level and collapsed:
-                logger.debug(f"[is_col_hidden] 컬럼 {letter}: outlineLevel={outline_level}, collapsed=True → 숨김 판정")
-                return True
-            if outline_level:
-                # 인접 컬럼이 동일/상위 레벨에서 collapsed인 경우, 현재 컬럼도 접힘에 포함된 것으로 간주
-                try:
-                    for offset in (-1, 1):
-                        adj_idx = col_idx + offset
-                        if adj_idx < 1:
-                            continue
-                        adj_letter = get_column_letter(adj_idx)
-                        adj_dim = sheet.column_dimensions.get(adj_letter)
-                        if not adj_dim:
-                            continue
-                        adj_collapsed = getattr(adj_dim, 'collapsed', False)
-                        adj_level = (getattr(adj_dim, 'outlineLevel', 0) or 0)
-                        if adj_collapsed and adj_level >= outline_level:
-                            logger.debug(f"[is_col_hidden] 컬럼 {letter}: 인접 {adj_letter} collapsed=True (adj_level={adj_level} >= {outline_level}) → 숨김 판정")
-                            return True
-                except Exception as e:
-                    logger.debug(f"[is_col_hidden] 컬럼 {letter}: 인접 컬럼 접힘 판정 중 오류: {e}")
-            # 숨김 아님: dim 속성 스냅샷 남김
-            try:
-                attr_names = [a for a in dir(dim) if not a.startswith('_')]
-                snapshot = {
-                    'hidden': getattr(dim, 'hidden', None),
-                    'width': getattr(dim, 'width', None),
-                    'bestFit': getattr(dim, 'bestFit', None),
-                    'outlineLevel': getattr(dim, 'outlineLevel', None),
-                    'collapsed': getattr(dim, 'collapsed', None),
-                }
-                logger.debug(f"[is_col_hidden] 컬럼 {letter}: 숨김 아님. dim 스냅샷={snapshot}, attrs={attr_names}")
-            except Exception as e:
-                logger.debug(f"[is_col_hidden] 컬럼 {letter}: dim 속성 로깅 중 오류: {e}")
-            return False
-        except Exception:
-            return False
+            hidden_cols = self._sheet_col_hidden_map[sheet.title]
+        return hidden_cols
+
+    def is_col_hidden(self, sheet: Worksheet, col_idx: int) -> bool:
+        """컬럼 숨김 여부 (숨김/너비 0/윤곽 접힘 전파까지 _prepare_col_hidden_cache에서 계산된 집합 조회)"""
+        return col_idx in self._compute_hidden_cols(sheet)
 
     def get_headers(self, sheet: Worksheet, header_row: int) -> List[str]:
         """단일 행 기준 폴백 헤더 추출 (호환용)"""
@@ -658,9 +1292,9 @@ class ExcelProcessor:
         for cell in sheet[header_row]:
             value = cell.value
             if value is not None:
-                headers.append(str(value).strip())
+                headers.append(sys.intern(str(value).strip()))
             else:
-                headers.append(f"Column_{cell.column}")
+                headers.append(_column_label(cell.column))
         return headers
     
     def _find_column_by_keywords(self, headers: List[str], keywords: List[str]) -> Optional[int]:
@@ -674,13 +1308,9 @@ class ExcelProcessor:
         Returns:
             컬럼 인덱스 (0-based) 또는 None
         """
-        for idx, header in enumerate(headers):
-            header_normalized = header.strip().replace(' ', '').lower()
-            for keyword in keywords:
-                keyword_normalized = keyword.strip().replace(' ', '').lower()
-                if keyword_normalized in header_normalized:
-                    return idx
-        return None
+        return _first_matching_column(
+            _normalize_keyword_tuple(tuple(headers)), _normalize_keyword_tuple(tuple(keywords))
+        )
     
     def _find_all_columns_by_keywords(self, headers: List[str], keywords: List[str]) -> List[int]:
         """
@@ -693,15 +1323,9 @@ class ExcelProcessor:
         Returns:
             컬럼 인덱스 리스트 (0-based)
         """
-        matching_indices = []
-        for idx, header in enumerate(headers):
-            header_normalized = header.strip().replace(' ', '').lower()
-            for keyword in keywords:
-                keyword_normalized = keyword.strip().replace(' ', '').lower()
-                if keyword_normalized in header_normalized:
-                    matching_indices.append(idx)
-                    break  # 하나라도 매칭되면 추가하고 다음 헤더로
-        return matching_indices
+        return _all_matching_columns(
+            _normalize_keyword_tuple(tuple(headers)), _normalize_keyword_tuple(tuple(keywords))
+        )
     
     def detect_sheet_type(self, sheet: Worksheet, sheet_name: str, headers: List[str]) -> SheetType:
         """
@@ -723,55 +1347,67 @@ class ExcelProcessor:
         Returns:
             SheetType enum
         """
+        cache_key = (sheet_name, tuple(headers))
+        cached = self._sheet_type_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        sheet_type = self._classify_sheet(sheet, sheet_name, headers)
+        self._sheet_type_cache[cache_key] = sheet_type
+        return sheet_type
+    
+    def _classify_sheet(self, sheet: Worksheet, sheet_name: str, headers: List[str]) -> SheetType:
+        """detect_sheet_type 본체 (시트명/헤더 문자열 검사 → 하이퍼링크 탐색 순으로 판별)"""
         sheet_name_lower = sheet_name.lower()
         
         # 1. 목차 시트 (시트명 + 헤더 키워드)
-        for keyword in SHEET_TYPE_KEYWORDS['toc']:
-            if keyword.lower() in sheet_name_lower:
-                # 헤더에도 목차 관련 키워드가 있는지 확인
-                header_text = ' '.join(headers).lower()
-                if any(kw.lower() in header_text for kw in SHEET_TYPE_KEYWORDS['toc']):
-                    logger.info(f"시트 타입 감지: {sheet_name} → 목차 (시트명+헤더 키워드)")
-                    return SheetType.TOC
+        toc_re = _SHEET_TYPE_KEYWORD_RE['toc']
+        if toc_re.search(sheet_name_lower):
+            # 헤더에도 목차 관련 키워드가 있는지 확인
+            header_text = ' '.join(headers).lower()
+            if toc_re.search(header_text):
+                logger.info(f"시트 타입 감지: {sheet_name} → 목차 (시트명+헤더 키워드)")
+                return SheetType.TOC
         
         # 2. 소프트웨어 형상기록 시트 (시트명 우선)
-        for keyword in SHEET_TYPE_KEYWORDS['software']:
-            if keyword.lower() in sheet_name_lower:
-                logger.info(f"시트 타입 감지: {sheet_name} → 소프트웨어 형상기록 (시트명)")
-                return SheetType.SOFTWARE
+        if _SHEET_TYPE_KEYWORD_RE['software'].search(sheet_name_lower):
+            logger.info(f"시트 타입 감지: {sheet_name} → 소프트웨어 형상기록 (시트명)")
+            return SheetType.SOFTWARE
         
         # 3. 이력관리 시트 (시트명)
-        for keyword in SHEET_TYPE_KEYWORDS['history']:
-            if keyword.lower() in sheet_name_lower:
-                logger.info(f"시트 타입 감지: {sheet_name} → 이력관리 (시트명)")
-                return SheetType.HISTORY
+        if _SHEET_TYPE_KEYWORD_RE['history'].search(sheet_name_lower):
+            logger.info(f"시트 타입 감지: {sheet_name} → 이력관리 (시트명)")
+            return SheetType.HISTORY
+        
+        # 헤더는 한 번만 정규화하여 아래 4개 컬럼 탐색에 재사용
+        normalized_headers = _normalize_keyword_tuple(tuple(headers))
         
         # 4. REV 관리 문서 (헤더에 REV + WBS 컬럼)
-        rev_col_idx = self._find_column_by_keywords(headers, COLUMN_NAME_MAPPINGS['rev'])
-        wbs_col_idx = self._find_column_by_keywords(headers, COLUMN_NAME_MAPPINGS['wbs'])
+        rev_col_idx = _first_matching_column(normalized_headers, _COLUMN_KEYWORDS['rev'])
+        wbs_col_idx = _first_matching_column(normalized_headers, _COLUMN_KEYWORDS['wbs'])
         
         if rev_col_idx is not None and wbs_col_idx is not None:
             logger.info(f"시트 타입 감지: {sheet_name} → REV 관리 (REV+WBS 컬럼)")
             return SheetType.REV_MANAGED
         
         # 5. 작성버전 관리 문서 (헤더에 작성버전 + 관리번호 컬럼)
-        version_col_idx = self._find_column_by_keywords(headers, COLUMN_NAME_MAPPINGS['version'])
-        manage_no_col_idx = self._find_column_by_keywords(headers, COLUMN_NAME_MAPPINGS['manage_no'])
+        version_col_idx = _first_matching_column(normalized_headers, _COLUMN_KEYWORDS['version'])
+        manage_no_col_idx = _first_matching_column(normalized_headers, _COLUMN_KEYWORDS['manage_no'])
         
         if version_col_idx is not None and manage_no_col_idx is not None:
             logger.info(f"시트 타입 감지: {sheet_name} → 작성버전 관리 (작성버전+관리번호 컬럼)")
             return SheetType.VERSION_MANAGED
         
         # 6. 첨부파일 시트 (하이퍼링크 존재 여부 확인)
-        # 최대 10개 행만 확인 (빠른 판별)
-        has_hyperlink = False
-        for row_idx in range(1, min(sheet.max_row + 1, 20)):
-            for cell in sheet[row_idx]:
-                if self.extract_hyperlink(cell):
+        # 상단 19개 행만 확인 (빠른 판별): 시트 하이퍼링크 맵 → =HYPERLINK 수식 순
+        max_row, max_col = self._get_sheet_extent(sheet)
+        probe_last_row = min(max_row, 19)
+        has_hyperlink = any(r <= probe_last_row for r, _ in self._get_sheet_hyperlinks(sheet))
+        if not has_hyperlink and probe_last_row >= 1:
+            extract_formula_hyperlink = self._extract_formula_hyperlink
+            for row_values in self._iter_row_values(sheet, 1, probe_last_row, max_col):
+                if any(extract_formula_hyperlink(v) for v in row_values):
                     has_hyperlink = True
                     break
-            if has_hyperlink:
-                break
         
         if has_hyperlink:
             logger.info(f"시트 타입 감지: {sheet_name} → 첨부파일 (하이퍼링크 존재)")
@@ -782,45 +1418,73 @@ class ExcelProcessor:
         return SheetType.UNKNOWN
     
     def is_row_hidden(self, sheet: Worksheet, row_idx: int) -> bool:
-        """행이 숨겨져 있거나 높이가 0인지 확인"""
-        try:
-            row_dimension = sheet.row_dimensions[row_idx]
-            # 숨김 처리되었거나 높이가 0인 경우
-            if row_dimension.hidden:
-                return True
-            if row_dimension.height is not None and row_dimension.height == 0:
-                return True
-            return False
-        except:
-            return False
+        """
+        행이 숨겨져 있거나 높이가 0인지 확인 (호환용)
+        행 루프에서는 _compute_hidden_rows로 얻은 집합을 지역 변수로 두고 `in`으로 판정한다.
+        """
+        return row_idx in self._compute_hidden_rows(sheet)
+    
+    def _compute_hidden_rows(self, sheet: Worksheet) -> frozenset:
+        """
+        숨김 처리되었거나 높이가 0인 행 번호 집합을 한 번에 계산 (시트별 캐시)
+        (행마다 row_dimensions[row_idx]를 조회하면 없는 행의 RowDimension이 새로 생성되므로
+        이미 존재하는 항목만 훑는다)
+        """
+        hidden_rows = self._hidden_rows_cache.get(sheet.title)
+        if hidden_rows is None:
+            hidden_rows = frozenset(
+                idx for idx, dim in sheet.row_dimensions.items()
+                if dim.hidden or (dim.height is not None and dim.height == 0)
+            )
+            self._hidden_rows_cache[sheet.title] = hidden_rows
+        return hidden_rows
     
     def extract_hyperlink(self, cell: Cell) -> Optional[str]:
         """셀에서 하이퍼링크 추출"""
-        if cell.hyperlink:
+        link = cell.hyperlink
+        if link:
             # 하이퍼링크 객체가 있는 경우
-            target = cell.hyperlink.target
+            target = link.target
             if target:
                 return target
         
         # 수식에서 하이퍼링크 추출 시도
-        if cell.value and isinstance(cell.value, str):
-            if cell.value.startswith('=HYPERLINK'):
-                # =HYPERLINK("url", "display") 형식 파싱
-                try:
-                    start = cell.value.index('"') + 1
-                    end = cell.value.index('"', start)
-                    return cell.value[start:end]
-                except:
-                    pass
+        return self._extract_formula_hyperlink(cell.value)
+    
+    def _extract_formula_hyperlink(self, value: Any) -> Optional[str]:
+        """=HYPERLINK("url", "display") 수식 문자열에서 url 추출"""
+        # 문자열이 아니거나 접두어가 다르면 정규식 엔진을 거치지 않고 바로 반환 (대부분의 셀)
+        if not isinstance(value, str) or not value.startswith('=HYPERLINK'):
+            return None
+        m = _HYPERLINK_FORMULA_RE.match(value)
+        return m.group(1) if m else None
+    
+    def resolve_key_columns(self, sheet_type: SheetType, headers: List[str]) -> Dict[str, Any]:
+        """
+        문서 키/revision 추출에 쓰는 컬럼 인덱스를 시트당 한 번 계산
+        (행마다 헤더 전체를 키워드로 다시 훑지 않도록 generate_document_key/get_revision_value에 전달)
         
-        return None
+        Returns:
+            {'wbs': [idx, ...], 'manage_no': idx|None, 'rev': idx|None, 'version': idx|None}
+        """
+        columns: Dict[str, Any] = {'wbs': [], 'manage_no': None, 'rev': None, 'version': None}
+        if sheet_type == SheetType.REV_MANAGED:
+            normalized_headers = _normalize_keyword_tuple(tuple(headers))
+            columns['wbs'] = _all_matching_columns(normalized_headers, _COLUMN_KEYWORDS['wbs'])
+            columns['rev'] = _first_matching_column(normalized_headers, _COLUMN_KEYWORDS['rev'])
+        elif sheet_type == SheetType.VERSION_MANAGED:
+            normalized_headers = _normalize_keyword_tuple(tuple(headers))
+            columns['manage_no'] = _first_matching_column(normalized_headers, _COLUMN_KEYWORDS['manage_no'])
+            columns['version'] = _first_matching_column(normalized_headers, _COLUMN_KEYWORDS['version'])
+        return columns
     
     def generate_document_key(
         self, 
         sheet_type: SheetType, 
         sheet_name: str, 
         row_data: Dict[str, str],
-        headers: List[str]
+        headers: List[str],
+        key_columns: Optional[Dict[str, Any]] = None
     ) -> Optional[str]:
         """
         문서 고유 키 생성 (Revision 관리용)
@@ -830,13 +1494,17 @@ class ExcelProcessor:
             sheet_name: 시트 이름
             row_data: 행 데이터 (헤더: 값)
             headers: 헤더 리스트
+            key_columns: resolve_key_columns 결과 (없으면 헤더에서 직접 탐색)
         
         Returns:
             문서 키 또는 None
         """
+        if key_columns is None:
+            key_columns = self.resolve_key_columns(sheet_type, headers)
+        
         if sheet_type == SheetType.REV_MANAGED:
             # REV 관리: 모든 WBS 컬럼 값 합치기 + 시트명
-            wbs_col_indices = self._find_all_columns_by_keywords(headers, COLUMN_NAME_MAPPINGS['wbs'])
+            wbs_col_indices = key_columns['wbs']
             
             if wbs_col_indices:
                 wbs_values = []
@@ -851,21 +1519,19 @@ class ExcelProcessor:
                     # 모든 WBS 값을 '-'로 연결
                     combined_wbs = '-'.join(wbs_values)
                     # 공백, 특수문자 정규화
-                    key = f"{combined_wbs}_{sheet_name}"
-                    key = key.replace(' ', '_').replace('/', '_').replace('\\', '_')
+                    key = _build_document_key(combined_wbs, sheet_name)
                     logger.debug(f"생성된 문서 키 (WBS 컬럼 {len(wbs_values)}개): {key}")
                     return key
         
         elif sheet_type == SheetType.VERSION_MANAGED:
             # 작성버전 관리: 관리번호 + 시트명
-            manage_no_col_idx = self._find_column_by_keywords(headers, COLUMN_NAME_MAPPINGS['manage_no'])
+            manage_no_col_idx = key_columns['manage_no']
             if manage_no_col_idx is not None and manage_no_col_idx < len(headers):
                 manage_no_header = headers[manage_no_col_idx]
                 manage_no_value = row_data.get(manage_no_header, '').strip()
                 if manage_no_value:
                     # 공백, 특수문자 정규화
-                    key = f"{manage_no_value}_{sheet_name}"
-                    key = key.replace(' ', '_').replace('/', '_').replace('\\', '_')
+                    key = _build_document_key(manage_no_value, sheet_name)
                     return key
         
         return None
@@ -875,7 +1541,8 @@ class ExcelProcessor:
         sheet_type: SheetType, 
         row_data: Dict[str, str],
         headers: List[str],
-        row_cells: List[Cell] = None
+        row_cells: List[Cell] = None,
+        key_columns: Optional[Dict[str, Any]] = None
     ) -> Optional[str]:
         """
         행에서 revision 값 추출
@@ -885,6 +1552,7 @@ class ExcelProcessor:
             row_data: 행 데이터 (헤더: 값)
             headers: 헤더 리스트
             row_cells: 행의 셀 리스트 (하이퍼링크 텍스트 추출용, 선택)
+            key_columns: resolve_key_columns 결과 (없으면 헤더에서 직접 탐색)
         
         Returns:
             revision 값 또는 None
@@ -893,9 +1561,12 @@ class ExcelProcessor:
             - REV 관리: rev 컬럼의 하이퍼링크 텍스트가 revision 명
             - 작성버전 관리: 관리번호 컬럼의 하이퍼링크 텍스트가 revision 명
         """
+        if key_columns is None:
+            key_columns = self.resolve_key_columns(sheet_type, headers)
+        
         if sheet_type == SheetType.REV_MANAGED:
             # REV 컬럼에서 값 추출 (하이퍼링크 텍스트 우선)
-            rev_col_idx = self._find_column_by_keywords(headers, COLUMN_NAME_MAPPINGS['rev'])
+            rev_col_idx = key_columns['rev']
             if rev_col_idx is not None and rev_col_idx < len(headers):
                 # 1. 셀이 제공된 경우: 하이퍼링크 텍스트(셀 표시 텍스트) 추출
                 if row_cells and rev_col_idx < len(row_cells):
@@ -913,7 +1584,7 @@ class ExcelProcessor:
         
         elif sheet_type == SheetType.VERSION_MANAGED:
             # 작성버전 컬럼에서 값 추출
-            version_col_idx = self._find_column_by_keywords(headers, COLUMN_NAME_MAPPINGS['version'])
+            version_col_idx = key_columns['version']
             if version_col_idx is not None and version_col_idx < len(headers):
                 # 1. 셀이 제공된 경우: 하이퍼링크 텍스트(셀 표시 텍스트) 추출
                 if row_cells and version_col_idx < len(row_cells):
@@ -955,32 +1626,43 @@ class ExcelProcessor:
             source_sheet = self.workbook[sheet_name]
             target_sheet = new_wb.create_sheet(sheet_name)
             
-            # 모든 셀 복사 (값, 스타일 포함)
-            for row in source_sheet.iter_rows():
-                for cell in row:
-                    target_cell = target_sheet[cell.coordinate]
-                    target_cell.value = cell.value
-                    
-                    # 스타일 복사 (간단 버전)
-                    if cell.has_style:
-                        target_cell.font = cell.font.copy()
-                        target_cell.border = cell.border.copy()
-                        target_cell.fill = cell.fill.copy()
-                        target_cell.number_format = cell.number_format
-                        target_cell.protection = cell.protection.copy()
-                        target_cell.alignment = cell.alignment.copy()
+            # 실제로 존재하는 셀만 복사 (값, 스타일 포함)
+            # - iter_rows()는 빈 좌표마다 셀 객체를 새로 만들고, 빈 셀은 저장 시 어차피 기록되지 않는다
+            # - 같은 스타일 조합(StyleArray)은 첫 셀에서만 스타일 객체를 복사하고,
+            #   이후 셀은 대상 워크북 기준 StyleArray를 그대로 재사용한다
+            #   (원본 StyleArray는 원본 워크북 스타일 테이블의 인덱스라 직접 옮길 수 없음)
+            style_map: Dict[Tuple[int, ...], Any] = {}
+            # - 값도 스타일도 없는 셀은 저장 시 기록되지 않으므로 대상 셀을 만들지 않는다
+            for (row_idx, col_idx), cell in list(_sheet_cells(source_sheet).items()):
+                has_style = cell.has_style
+                if cell.value is None and not has_style:
+                    continue
+                target_cell = target_sheet.cell(row=row_idx, column=col_idx, value=cell.value)
+                
+                # 스타일 복사 (간단 버전)
+                if has_style:
+                    style_key = tuple(cell._style)
+                    target_style = style_map.get(style_key)
+                    if target_style is not None:
+                        target_cell._style = copy(target_style)
+                        continue
+                    target_cell.font = cell.font.copy()
+                    target_cell.border = cell.border.copy()
+                    target_cell.fill = cell.fill.copy()
+                    target_cell.number_format = cell.number_format
+                    target_cell.protection = cell.protection.copy()
+                    target_cell.alignment = cell.alignment.copy()
+                    style_map[style_key] = copy(target_cell._style)
             
             # 컬럼 너비 복사
-            for col_letter in source_sheet.column_dimensions:
-                if col_letter in source_sheet.column_dimensions:
-                    target_sheet.column_dimensions[col_letter].width = \
-                        source_sheet.column_dimensions[col_letter].width
+            target_col_dims = target_sheet.column_dimensions
+            for col_letter, dim in source_sheet.column_dimensions.items():
+                target_col_dims[col_letter].width = dim.width
             
             # 행 높이 복사
-            for row_num in source_sheet.row_dimensions:
-                if row_num in source_sheet.row_dimensions:
-                    target_sheet.row_dimensions[row_num].height = \
-                        source_sheet.row_dimensions[row_num].height
+            target_row_dims = target_sheet.row_dimensions
+            for row_num, dim in source_sheet.row_dimensions.items():
+                target_row_dims[row_num].height = dim.height
             
             # 파일 저장
             output_path = output_dir / f"{sheet_name}.xlsx"
@@ -1051,9 +1733,12 @@ class ExcelProcessor:
                         skipped_count += 1
                         continue
                     
+                    # max_row/max_column은 접근할 때마다 전체 셀을 훑으므로 캐시된 범위를 사용
+                    sheet_max_row, sheet_max_col = self._get_sheet_extent(sheet)
+                    
                     # 가시 컬럼 인덱스 목록 (1-based)
-                    visible_col_indices = [c for c in range(1, (sheet.max_column or 1) + 1) 
-                                           if not self.is_col_hidden(sheet, c)]
+                    hidden_cols = self._compute_hidden_cols(sheet)
+                    visible_col_indices = [c for c in range(1, sheet_max_col + 1) if c not in hidden_cols]
                     if len(visible_col_indices) > len(headers):
                         visible_col_indices = visible_col_indices[:len(headers)]
                     
@@ -1072,8 +1757,9 @@ class ExcelProcessor:
                     
                     # 데이터 쓰기 (2행~)
                     target_row = 2
-                    for src_row in range(data_start_row, (sheet.max_row or data_start_row) + 1):
-                        if self.is_row_hidden(sheet, src_row):
+                    hidden_rows = self._compute_hidden_rows(sheet)
+                    for src_row in range(data_start_row, (sheet_max_row or data_start_row) + 1):
+                        if src_row in hidden_rows:
                             continue
                         
                         row_values = []
@@ -1150,9 +1836,21 @@ class ExcelProcessor:
         Returns:
             변환된 텍스트 청크 리스트 (str 또는 List[str])
         """
+        return list(self.iter_text_chunks(sheet_name, max_length, return_rows_as_list))
+    
+    def iter_text_chunks(
+        self, 
+        sheet_name: str, 
+        max_length: int = MAX_TEXT_LENGTH,
+        return_rows_as_list: bool = False
+    ) -> Iterator[Any]:
+        """
+        convert_sheet_to_text_chunks의 제너레이터 버전
+        청크가 완성될 때마다 하나씩 반환하므로 시트 전체 텍스트를 메모리에 쌓지 않는다.
+        """
         if not self.workbook:
             logger.error("워크북이 로드되지 않았습니다.")
-            return []
+            return
         
         sheet = self.workbook[sheet_name]
         
@@ -1160,11 +1858,8 @@ class ExcelProcessor:
         headers, data_start_row, header_span = self.build_headers_and_data_start(sheet)
         
         # === 첫 컬럼 기준 그룹핑(+최대 5행 버퍼) 로직을 적용하여 텍스트 생성 ===
-        def first_col_has_value(cells: List[Cell]) -> bool:
-            if not cells:
-                return False
-            v = cells[0].value
-            return v is not None and str(v).strip() != ''
+        def first_col_has_value(values: Tuple[Any, ...]) -> bool:
+            return bool(values) and _has_text(values[0])
         
         def merge_metadata(dst: Dict[str, str], src: Dict[str, str]):
             for k, v in src.items():
@@ -1176,84 +1871,97 @@ class ExcelProcessor:
                     if v not in dst[k]:
                         dst[k] = f"{dst[k]} / {v}"
         
+        # 시트명 줄은 모든 레코드에 공통이므로 1회만 생성
+        sheet_name_line = f"시트명: {sheet_name}"
+        
         def make_text_from_metadata(metadata: Dict[str, str]) -> Optional[str]:
             if not metadata:
                 return None
-            parts: List[str] = []
-            
-            # 시트명 정보 추가
-            parts.append(f"시트명: {sheet_name}")
-            
-            # 헤더 순서대로 출력 (가시 컬럼만)
+            # 시트명 + 헤더 순서대로 출력 (가시 컬럼만) - 한 번의 join으로 조립
+            parts = [sheet_name_line]
             for header in headers:
-                val = metadata.get(header, '')
+                val = metadata.get(header)
                 if val:
                     parts.append(f"{header}: {val}")
-            return '\n'.join(parts) if parts else None
+            return '\n'.join(parts)
         
-        chunks: List[Any] = []
+        chunk_count = 0
         current_chunk_rows: List[str] = []
         current_length: int = 0
         
         current_metadata: Optional[Dict[str, str]] = None
-        pending_rows: List[Dict[str, str]] = []  # 병합 전 대기 메타데이터 (최대 5행)
+        # 병합 전 대기 메타데이터 (deque(maxlen)이 가득 차면 가장 오래된 항목을 자동 폐기)
+        pending_rows: deque = deque(maxlen=PENDING_ROWS_MAX)
+        
+        def make_chunk(rows: List[str]) -> Any:
+            nonlocal chunk_count
+            chunk_count += 1
+            logger.debug(f"청크 {chunk_count} 완료: {len(rows)}개 행")
+            return rows if return_rows_as_list else ROW_SEPARATOR.join(rows)
         
-        def flush_current_to_chunks():
+        def flush_current_to_chunks() -> Optional[Any]:
+            """현재 레코드를 청크에 추가하고, 길이 초과로 마감된 이전 청크가 있으면 반환"""
             nonlocal current_metadata, current_chunk_rows, current_length
             if not current_metadata:
-                return
+                return None
             row_text = make_text_from_metadata(current_metadata)
             current_metadata = None
             if not row_text:
-                return
-            row_length = len(row_text) + len(ROW_SEPARATOR)
+                return None
+            row_length = len(row_text) + _ROW_SEP_LEN
             if current_length + row_length > max_length and current_chunk_rows:
-                # 청크 마감
-                if return_rows_as_list:
-                    chunks.append(list(current_chunk_rows))
-                else:
-                    chunk_text = ROW_SEPARATOR.join(current_chunk_rows)
-                    chunks.append(chunk_text)
-                
-                logger.debug(f"청크 {len(chunks)} 완료: {len(current_chunk_rows)}개 행")
-                # 새 청크 시작
+                # 청크 마감 후 새 청크 시작
+                done = make_chunk(current_chunk_rows)
                 current_chunk_rows = [row_text]
                 current_length = row_length
-            else:
-                current_chunk_rows.append(row_text)
-                current_length += row_length
+                return done
+            current_chunk_rows.append(row_text)
+            current_length += row_length
+            return None
         
-        for row_idx in range(data_start_row, sheet.max_row + 1):
-            # 숨김 행 제외
-            if self.is_row_hidden(sheet, row_idx):
-                continue
-            
-            row_cells = list(sheet[row_idx])
-            # 빈 행 건너뛰기
-            if all(cell.value is None for cell in row_cells):
-                continue
-            
-            # 현재 행의 메타데이터 구성 (병합영역 좌상단 값 사용, 숨김 컬럼 제외)
-            row_metadata: Dict[str, str] = {}
-            header_idx = 0
-            for col_idx, _cell in enumerate(row_cells):
-                col_number = col_idx + 1
-                if self.is_col_hidden(sheet, col_number):
-                    continue
-                if header_idx < len(headers):
-                    header = headers[header_idx]
-                    header_idx += 1
+        def walk_rows() -> Iterator[Tuple[int, bool, Dict[str, str]]]:
+            """
+            (row_idx, 첫 컬럼 값 여부, metadata) 순회
+            process_sheet와 동일하게 숨김 행 집합/(헤더, 가시 컬럼) 쌍을 시트당 1회 구성하고
+            행은 _iter_row_values 한 번의 순방향 스캔으로 읽는다
+            """
+            hidden_rows = self._compute_hidden_rows(sheet)
+            sheet_max_row, sheet_max_col = self._get_sheet_extent(sheet)
+            hidden_cols = self._compute_hidden_cols(sheet)
+            visible_cols = [c for c in range(1, sheet_max_col + 1) if c not in hidden_cols]
+            header_columns = list(zip(headers, visible_cols))
+            get_evaluated = self._get_merged_top_left_value_evaluated
+            # 평가 값 조회는 항상 str 또는 None을 반환하므로 문자열 정규화(캐시)를 직접 호출
+            normalize_cell = _normalize_cell_text
+            rows_iter = self._iter_row_values(sheet, data_start_row, sheet_max_row, sheet_max_col, hidden_rows)
+            # 숨김 행/빈 행 제외 (연속 빈 행 기준 중단 규칙은 process_sheet와 동일)
+            data_rows = self._iter_data_rows(sheet_name, rows_iter, data_start_row, sheet_max_row, hidden_rows)
+            for row_idx, row_values in data_rows:
+                # 현재 행의 메타데이터 구성 (병합영역 좌상단 값 사용, 숨김 컬럼 제외)
+                row_metadata: Dict[str, str] = {}
+                for header, col_number in header_columns:
                     # 수식 셀은 계산된 값(data_only)을 우선 사용
-                    merged_val = self._get_merged_top_left_value_evaluated(sheet, row_idx, col_number)
-                    text = self._normalize_text(merged_val)
+                    merged_val = get_evaluated(sheet, row_idx, col_number)
+                    if merged_val is None:
+                        continue
+                    text = normalize_cell(merged_val)
                     if text:
                         row_metadata[header] = text
-            
-            if first_col_has_value(row_cells):
+                yield row_idx, first_col_has_value(row_values), row_metadata
+        
+        # process_sheet 스캔에서 기록된 행 레코드가 있으면 시트를 다시 훑지 않고 그대로 사용 (1회 소비)
+        row_records = self._row_records_cache.pop(sheet_name, None)
+        if row_records is None:
+            row_records = walk_rows()
+        for _row_idx, has_first_col, row_metadata in row_records:
+            if has_first_col:
                 # 기존 레코드가 있으면 플러시
-                flush_current_to_chunks()
+                done = flush_current_to_chunks()
+                if done is not None:
+                    yield done
                 # 새 레코드 시작
-                current_metadata = dict(row_metadata)
+                # row_metadata는 행마다 새로 만들어지므로 복사 없이 그대로 사용
+                current_metadata = row_metadata
                 # 대기(pending)된 선행 행들 병합 (최대 5행 누적)
                 if pending_rows:
                     for pm in pending_rows:
@@ -1265,31 +1973,35 @@ class ExcelProcessor:
             if current_metadata is not None:
                 merge_metadata(current_metadata, row_metadata)
             else:
-                if len(pending_rows) < 7:
-                    pending_rows.append(dict(row_metadata))
-                else:
-                    pending_rows.pop(0)
-                    pending_rows.append(dict(row_metadata))
+                pending_rows.append(row_metadata)
         
         # 마지막 레코드 플러시
-        flush_current_to_chunks()
+        done = flush_current_to_chunks()
+        if done is not None:
+            yield done
         
         # 마지막 청크 추가
         if current_chunk_rows:
-            if return_rows_as_list:
-                chunks.append(list(current_chunk_rows))
-            else:
-                chunk_text = ROW_SEPARATOR.join(current_chunk_rows)
-                chunks.append(chunk_text)
-            logger.debug(f"청크 {len(chunks)} 완료: {len(current_chunk_rows)}개 행")
+            yield make_chunk(current_chunk_rows)
         
-        logger.info(f"시트 '{sheet_name}' 텍스트 변환 완료: 총 {len(chunks)}개 청크")
-        return chunks
+        logger.info(f"시트 '{sheet_name}' 텍스트 변환 완료: 총 {chunk_count}개 청크")
     
-    def process_sheet(self, sheet_name: str, early_stop_no_value: Optional[int] = None) -> Tuple[SheetType, List[Dict], List[str]]:
+    def process_sheet(
+        self,
+        sheet_name: str,
+        early_stop_no_value: Optional[int] = None,
+        record_text_rows: bool = False
+    ) -> Tuple[SheetType, List[Dict], List[str]]:
         """
         시트 처리 - 시트 타입 감지, 하이퍼링크와 메타데이터 추출
         
+        Args:
+            sheet_name: 시트 이름
+            early_stop_no_value: 연속 무값 행 수 기준 조기 종료 (None이면 끝까지 스캔)
+            record_text_rows: 이력관리/소프트웨어 시트의 행 레코드를 기록해 두었다가
+                이어지는 convert_sheet_to_text_chunks/iter_text_chunks 호출이 시트를 다시 훑지 않고 사용
+                (텍스트로 변환할 때만 True, 기록은 1회 소비되거나 워크북 재로드/close 시 해제)
+        
         Returns:
             Tuple[SheetType, List[Dict], List[str]]: (
                 시트 타입,
@@ -1310,6 +2022,30 @@ class ExcelProcessor:
             logger.error("워크북이 로드되지 않았습니다.")
             return SheetType.UNKNOWN, [], []
         
+        sheet, sheet_type, headers, data_start_row = self._prepare_sheet(sheet_name)
+        results = list(self._iter_sheet_items(
+            sheet, sheet_name, sheet_type, headers, data_start_row, early_stop_no_value, record_text_rows
+        ))
+        return sheet_type, results, headers
+    
+    def iter_sheet(self, sheet_name: str, early_stop_no_value: Optional[int] = None) -> Iterator[Dict]:
+        """
+        시트 처리 결과를 행 그룹(레코드) 단위로 하나씩 반환하는 제너레이터
+        
+        process_sheet와 동일한 항목을 만들지만 전체 리스트를 메모리에 쌓지 않는다.
+        시트 타입/헤더가 필요하면 process_sheet를 사용한다.
+        """
+        if not self.workbook:
+            logger.error("워크북이 로드되지 않았습니다.")
+            return
+        
+        sheet, sheet_type, headers, data_start_row = self._prepare_sheet(sheet_name)
+        yield from self._iter_sheet_items(
+            sheet, sheet_name, sheet_type, headers, data_start_row, early_stop_no_value
+        )
+    
+    def _prepare_sheet(self, sheet_name: str) -> Tuple[Worksheet, SheetType, List[str], int]:
+        """시트 처리 준비: 헤더/데이터 시작 행 결정 및 시트 타입 감지"""
         sheet = self.workbook[sheet_name]
         logger.log_sheet_start(sheet_name)
         
@@ -1319,17 +2055,63 @@ class ExcelProcessor:
         # 시트 타입 감지
         sheet_type = self.detect_sheet_type(sheet, sheet_name, headers)
         
-        results: List[Dict] = []
+        return sheet, sheet_type, headers, data_start_row
+    
+    def _iter_sheet_items(
+        self,
+        sheet: Worksheet,
+        sheet_name: str,
+        sheet_type: SheetType,
+        headers: List[str],
+        data_start_row: int,
+        early_stop_no_value: Optional[int],
+        record_text_rows: bool = False
+    ) -> Iterator[Dict]:
+        """데이터 행을 순방향으로 스캔하며 완성된 레코드를 즉시 yield"""
+        item_count = 0
+        # 데이터 행이 없는 시트(빈 시트, 헤더만 있는 시트)는 링크/병합/키 컬럼 준비 없이 바로 종료
+        sheet_max_row, _sheet_max_col = self._get_sheet_extent(sheet)
+        if data_start_row > sheet_max_row:
+            logger.debug(f"시트 '{sheet_name}': 데이터 행 없음 (데이터 시작 {data_start_row}행 > 마지막 {sheet_max_row}행)")
+            logger.log_sheet_end(sheet_name, item_count)
+            return
+        # 좌표 → 하이퍼링크 맵 (셀마다 hyperlink 객체를 조회하지 않도록 시트당 1회 구성)
+        sheet_links = self._get_sheet_hyperlinks(sheet)
+        # 링크가 있는 병합 영역만 추림 (좌상단 셀의 링크/HYPERLINK 수식) — 셀마다 전체 병합 목록을 훑지 않도록
+        merged_link_ranges: List[Tuple[int, int, int, int, str]] = []
+        for mrange in sheet.merged_cells.ranges:
+            top_left = _sheet_cells(sheet).get((mrange.min_row, mrange.min_col))
+            top_left_link = (sheet_links.get((mrange.min_row, mrange.min_col))
+                             or (top_left is not None and self._extract_formula_hyperlink(top_left.value)))
+            if top_left_link:
+                merged_link_ranges.append(
+                    (mrange.min_row, mrange.max_row, mrange.min_col, mrange.max_col, top_left_link)
+                )
+        # 행 → 링크가 존재할 수 있는 컬럼 집합 (셀 링크 또는 링크 있는 병합 영역이 덮는 컬럼)
+        # 링크 행에서도 전체 컬럼이 아니라 이 컬럼들만 확인한다
+        row_link_cols: Dict[int, set] = {}
+        for r, c in sheet_links:
+            row_link_cols.setdefault(r, set()).add(c)
+        # 행 → 그 행을 덮는 링크 병합 영역 [(min_col, max_col, link), ...] (셀마다 전체 영역 목록을 훑지 않도록)
+        row_merged_links: Dict[int, List[Tuple[int, int, str]]] = {}
+        for min_r, max_r, min_c, max_c, range_link in merged_link_ranges:
+            for r in range(min_r, max_r + 1):
+                row_link_cols.setdefault(r, set()).update(range(min_c, max_c + 1))
+                row_merged_links.setdefault(r, []).append((min_c, max_c, range_link))
+        hidden_rows = self._compute_hidden_rows(sheet)
+        # (헤더, 가시 컬럼 번호) 쌍을 시트당 1회 구성 — 행마다 숨김 판정/헤더 인덱스 비교를 반복하지 않음
+        sheet_max_row, sheet_max_col = self._get_sheet_extent(sheet)
+        hidden_cols = self._compute_hidden_cols(sheet)
+        visible_cols = [c for c in range(1, sheet_max_col + 1) if c not in hidden_cols]
+        header_columns = list(zip(headers, visible_cols))
+        # 문서 키/revision 컬럼 인덱스 (시트 타입과 헤더에만 의존하므로 행 루프 밖에서 1회 계산)
+        key_columns = self.resolve_key_columns(sheet_type, headers)
+        # 짧은 반복 값 공유용 풀 (시트 단위)
+        value_pool: Dict[str, str] = {}
         
         # 연속 행 병합 로직 (첫 컬럼 우선 + 5행 버퍼)
-        def count_non_empty(cells: List[Cell]) -> int:
-            return sum(1 for c in cells if c.value is not None and str(c.value).strip())
-
-        def first_col_has_value(cells: List[Cell]) -> bool:
-            if not cells:
-                return False
-            v = cells[0].value
-            return v is not None and str(v).strip() != ''
+        def first_col_has_value(values: Tuple[Any, ...]) -> bool:
+            return bool(values) and _has_text(values[0])
  
         def merge_metadata(dst: Dict[str, str], src: Dict[str, str]):
             for k, v in src.items():
@@ -1342,92 +2124,128 @@ class ExcelProcessor:
                         dst[k] = f"{dst[k]} / {v}"
  
         current: Optional[Dict] = None
-        pending_rows: List[Tuple[Dict[str, str], List[str], int]] = []  # (metadata, hyperlinks, row_idx)
+        current_link_seen: set = set()
+        # (metadata, hyperlinks, row_idx) 대기 버퍼 — 가득 차면 가장 오래된 항목을 자동 폐기하여 메모리 제한 유지
+        pending_rows: deque = deque(maxlen=PENDING_ROWS_MAX)
+
+        # 시트 타입별 마감 규칙 (레코드마다 리스트 멤버십을 다시 평가하지 않도록 1회 계산)
+        requires_link = sheet_type in (SheetType.ATTACHMENT, SheetType.REV_MANAGED, SheetType.VERSION_MANAGED)
+        needs_document_key = sheet_type in (SheetType.REV_MANAGED, SheetType.VERSION_MANAGED)
 
-        def finalize_current():
+        def finalize_current() -> Optional[Dict]:
             if not current:
-                return
+                return None
             # 하위 호환: hyperlinks가 있고 hyperlink가 비어있으면 첫 항목을 대표 링크로 설정
             if current.get('hyperlinks') and not current.get('hyperlink'):
                 if isinstance(current.get('hyperlinks'), list) and current['hyperlinks']:
                     current['hyperlink'] = current['hyperlinks'][0]
-            if sheet_type in [SheetType.ATTACHMENT, SheetType.REV_MANAGED, SheetType.VERSION_MANAGED] and not (current.get('hyperlink') or (isinstance(current.get('hyperlinks'), list) and current.get('hyperlinks'))):
-                return
-            if sheet_type in [SheetType.REV_MANAGED, SheetType.VERSION_MANAGED]:
+            if requires_link and not (current.get('hyperlink') or (isinstance(current.get('hyperlinks'), list) and current.get('hyperlinks'))):
+                return None
+            if needs_document_key:
                 metadata = current['metadata']
-                document_key = self.generate_document_key(sheet_type, sheet_name, metadata, headers)
-                revision = self.get_revision_value(sheet_type, metadata, headers, None)
+                document_key = self.generate_document_key(
+                    sheet_type, sheet_name, metadata, headers, key_columns=key_columns
+                )
+                revision = self.get_revision_value(
+                    sheet_type, metadata, headers, None, key_columns=key_columns
+                )
                 if document_key:
                     current['document_key'] = document_key
                 if revision:
                     current['revision'] = revision
-            results.append(current.copy())
+            # 마감 직후 current는 새 레코드로 다시 바인딩되거나 스캔이 끝나므로 복사 없이 그대로 넘긴다
+            return current
+
+        # 행 루프에서 반복 조회되는 메서드를 지역 변수로 바인딩
+        get_link = sheet_links.get
+        extract_formula_link = self._extract_formula_hyperlink
+        get_evaluated = self._get_merged_top_left_value_evaluated
+        # 평가 값 조회는 항상 str 또는 None을 반환하므로 문자열 정규화(캐시)를 직접 호출
+        normalize_cell = _normalize_cell_text
+
+        # 호출자가 텍스트 변환을 예고한 경우에만 행 레코드를 기록해 두었다가 iter_text_chunks에 넘긴다
+        # (중간에 끊긴 스캔은 전체 행을 담지 못하므로 끝까지 돈 경우에만 저장)
+        row_records: Optional[List[Tuple[int, bool, Dict[str, str]]]] = (
+            [] if record_text_rows and sheet_type in (SheetType.HISTORY, SheetType.SOFTWARE) else None
+        )
 
         # 데이터 행 처리 (그룹핑 적용)
         no_value_streak = 0
-        for row_idx in range(data_start_row, sheet.max_row + 1):
+        # 행마다 sheet[row_idx]로 다시 조회하지 않고 값 튜플을 한 번의 순방향 스캔으로 읽는다
+        # (숨겨진 행/높이 0인 행과 빈 행은 _iter_data_rows에서 제외)
+        rows_iter = self._iter_row_values(sheet, data_start_row, sheet_max_row, sheet_max_col, hidden_rows)
+        data_rows = self._iter_data_rows(sheet_name, rows_iter, data_start_row, sheet_max_row, hidden_rows)
+        for row_idx, row_values in data_rows:
             # 테스트 모드: 행 수 제한 확인
-            if TEST_MODE and TEST_MAX_ROWS > 0 and len(results) >= TEST_MAX_ROWS:
+            if TEST_MODE and TEST_MAX_ROWS > 0 and item_count >= TEST_MAX_ROWS:
                 logger.warning(f"[테스트 모드] 시트 '{sheet_name}': {TEST_MAX_ROWS}개 행 제한 도달, 나머지 행 건너뜁니다.")
                 break
             
-            # 숨겨진 행 또는 높이가 0인 행 제외
-            if self.is_row_hidden(sheet, row_idx):
-                logger.debug(f"{row_idx}행은 숨김 처리되었거나 높이가 0이어서 건너뜁니다.")
-                continue
-            
-            row_cells = list(sheet[row_idx])
-            
-            # 빈 행 건너뛰기
-            if all(cell.value is None for cell in row_cells):
-                continue
-            
             # 하이퍼링크 찾기 (병합영역 좌상단 포함) - 행 단위로 모두 수집
             hyperlinks_in_row: List[str] = []
-            for col_i, cell in enumerate(row_cells, start=1):
-                link = self.extract_hyperlink(cell)
-                if not link:
-                    # 병합영역의 좌상단에서 재시도
-                    coord = cell.coordinate
-                    for mrange in sheet.merged_cells.ranges:
-                        if coord in mrange:
-                            top_left_cell = sheet.cell(row=mrange.min_row, column=mrange.min_col)
-                            link = self.extract_hyperlink(top_left_cell)
-                            break
-                if link:
-                    if link not in hyperlinks_in_row:
+            row_link_seen: set = set()  # 중복 판정용 (목록은 순서 보존용)
+            # 링크 후보 컬럼(셀 링크/링크 병합 영역 + HYPERLINK 수식 셀)만 컬럼 순서대로 확인
+            link_cols = row_link_cols.get(row_idx)
+            formula_cols = [
+                c for c, v in enumerate(row_values, start=1)
+                if isinstance(v, str) and v.startswith('=HYPERLINK')
+            ]
+            if link_cols or formula_cols:
+                if link_cols:
+                    candidate_cols = sorted(link_cols.union(formula_cols))
+                else:
+                    candidate_cols = formula_cols
+                row_width = len(row_values)
+                for col_i in candidate_cols:
+                    if col_i > row_width:
+                        break
+                    link = get_link((row_idx, col_i)) or extract_formula_link(row_values[col_i - 1])
+                    if not link:
+                        # 병합영역의 좌상단에서 재시도
+                        for min_c, max_c, range_link in row_merged_links.get(row_idx, ()):
+                            if min_c <= col_i <= max_c:
+                                link = range_link
+                                break
+                    if link and link not in row_link_seen:
+                        row_link_seen.add(link)
                         hyperlinks_in_row.append(link)
             
             # 메타데이터 구성 (병합영역 좌상단 값 사용)
             row_metadata: Dict[str, str] = {}
-            header_idx = 0
-            for col_idx, cell in enumerate(row_cells):
-                col_number = col_idx + 1
-                if self.is_col_hidden(sheet, col_number):
+            for header, col_number in header_columns:
+                merged_val = get_evaluated(sheet, row_idx, col_number)
+                if merged_val is None:
                     continue
-                if header_idx < len(headers):
-                    header = headers[header_idx]
-                    header_idx += 1
-                    merged_val = self._get_merged_top_left_value_evaluated(sheet, row_idx, col_number)
-                    text = self._normalize_text(merged_val)
-                    if text:
-                        row_metadata[header] = text
+                text = normalize_cell(merged_val)
+                if text:
+                    if len(text) <= VALUE_POOL_MAX_LEN:
+                        text = value_pool.setdefault(text, text)
+                    row_metadata[header] = text
+            has_first_col = first_col_has_value(row_values)
+            if row_records is not None:
+                # 아래 그룹핑에서 row_metadata가 병합 대상으로 수정되므로 복사본을 기록
+                row_records.append((row_idx, has_first_col, dict(row_metadata)))
 
             # 첫 컬럼 기준 그룹핑
-            if first_col_has_value(row_cells):
+            if has_first_col:
                 # 조기 종료 카운터 리셋
                 no_value_streak = 0
                 # 기존 레코드 마감
-                finalize_current()
+                item = finalize_current()
+                if item is not None:
+                    item_count += 1
+                    yield item
 
                 # 새 레코드 시작
                 current = {
                     'hyperlink': hyperlinks_in_row[0] if hyperlinks_in_row else None,
-                    'hyperlinks': list(hyperlinks_in_row) if hyperlinks_in_row else [],
+                    'hyperlinks': hyperlinks_in_row,
                     'metadata': row_metadata,
                     'row_number': row_idx,
                     'sheet_name': sheet_name
                 }
+                # 현재 레코드 링크 중복 판정용 집합 (current['hyperlinks']와 항상 같은 내용 유지)
+                current_link_seen = set(hyperlinks_in_row)
 
                 # 대기(pending)된 선행 행들 병합 (최대 5행 누적)
                 if pending_rows:
@@ -1438,7 +2256,8 @@ class ExcelProcessor:
                             if not current.get('hyperlinks'):
                                 current['hyperlinks'] = []
                             for l in phs:
-                                if l not in current['hyperlinks']:
+                                if l not in current_link_seen:
+                                    current_link_seen.add(l)
                                     current['hyperlinks'].append(l)
                             if not current.get('hyperlink') and current['hyperlinks']:
                                 current['hyperlink'] = current['hyperlinks'][0]
@@ -1454,18 +2273,14 @@ class ExcelProcessor:
                     if not current.get('hyperlinks'):
                         current['hyperlinks'] = []
                     for l in hyperlinks_in_row:
-                        if l not in current['hyperlinks']:
+                        if l not in current_link_seen:
+                            current_link_seen.add(l)
                             current['hyperlinks'].append(l)
                     if not current.get('hyperlink'):
                         current['hyperlink'] = current['hyperlinks'][0]
                 current['row_number'] = row_idx
             else:
-                if len(pending_rows) < 7:
-                    pending_rows.append((row_metadata, list(hyperlinks_in_row), row_idx))
-                else:
-                    # 버퍼 초과 시 가장 오래된 항목은 폐기하여 메모리 제한 유지
-                    pending_rows.pop(0)
-                    pending_rows.append((row_metadata, list(hyperlinks_in_row), row_idx))
+                pending_rows.append((row_metadata, hyperlinks_in_row, row_idx))
 
             # 조기 종료 카운팅 (유효 값이 전혀 없을 때만 증가)
             if row_metadata:
@@ -1475,17 +2290,25 @@ class ExcelProcessor:
                 if early_stop_no_value is not None and no_value_streak >= early_stop_no_value:
                     logger.info(f"연속 {early_stop_no_value}개 무값 행 감지 → 스캔 조기 종료 (row={row_idx})")
                     break
+        else:
+            if row_records is not None:
+                self._row_records_cache[sheet_name] = row_records
 
         # 마지막 레코드 마감
-        finalize_current()
+        item = finalize_current()
+        if item is not None:
+            item_count += 1
+            yield item
         
-        logger.log_sheet_end(sheet_name, len(results))
-        return sheet_type, results, headers
+        logger.log_sheet_end(sheet_name, item_count)
     
-    def process_all_sheets(self) -> Dict[str, Tuple[SheetType, List[Dict], List[str]]]:
+    def process_all_sheets(self, record_text_rows: bool = False) -> Dict[str, Tuple[SheetType, List[Dict], List[str]]]:
         """
         모든 시트 처리 (숨겨진 시트 제외)
         
+        Args:
+            record_text_rows: 이력관리/소프트웨어 시트를 이어서 텍스트로 변환할 때 True (process_sheet 참고)
+        
         Returns:
             Dict[str, Tuple[SheetType, List[Dict], List[str]]]: {
                 'sheet1': (시트타입, [항목들...], [헤더들...]),
@@ -1505,6 +2328,25 @@ class ExcelProcessor:
         if TEST_MODE:
             logger.warning(f"[테스트 모드] 활성화됨 - 최대 {TEST_MAX_SHEETS}개 시트, 시트당 {TEST_MAX_ROWS}개 행만 처리")
         
+        # 0 = CPU 코어 수만큼 자동 설정 (설정값이 더 커도 CPU 코어 수를 넘지 않음)
+        cpu_count = os.cpu_count() or 1
+        sheet_workers = min(EXCEL_SHEET_WORKERS, cpu_count) if EXCEL_SHEET_WORKERS > 0 else cpu_count
+        if sheet_workers > 1:
+            visible_count = sum(
+                1 for name in sheet_names
+                if self.workbook[name].sheet_state not in ('hidden', 'veryHidden')
+            )
+            if TEST_MODE and TEST_MAX_SHEETS > 0:
+                visible_count = min(visible_count, TEST_MAX_SHEETS)
+            sheet_workers = min(sheet_workers, visible_count)
+            # 시트가 적으면 작업 프로세스마다 워크북을 다시 여는 비용이 병렬 이득보다 크므로 순차 처리
+            # (프로세스가 1개면 워크북만 한 번 더 열게 되므로 역시 순차 처리)
+            if sheet_workers > 1 and visible_count >= EXCEL_PARALLEL_MIN_SHEETS:
+                return self._process_sheets_parallel(sheet_names, sheet_workers, record_text_rows)
+            logger.info(
+                f"가시 시트 {visible_count}개, 작업 프로세스 {sheet_workers}개 → 병렬 처리 대신 순차 처리"
+            )
+        
         processed_sheet_count = 0
         for sheet_name in sheet_names:
             # 테스트 모드: 시트 수 제한 확인
@@ -1520,7 +2362,7 @@ class ExcelProcessor:
                     logger.info(f"시트 '{sheet_name}'는 숨김 처리되어 건너뜁니다.")
                     continue
                 
-                sheet_type, results, headers = self.process_sheet(sheet_name)
+                sheet_type, results, headers = self.process_sheet(sheet_name, record_text_rows=record_text_rows)
                 all_results[sheet_name] = (sheet_type, results, headers)
                 processed_sheet_count += 1
             except Exception as e:
@@ -1531,9 +2373,189 @@ class ExcelProcessor:
         
         return all_results
     
+    def iter_all_sheets(self) -> Iterator[Tuple[str, Dict]]:
+        """
+        모든 시트(숨김 시트 제외)의 처리 결과를 (시트명, 항목) 단위로 스트리밍
+        
+        워크북 전체 결과를 한 번에 보관하지 않으므로 대용량 파일의 후속 처리에 사용한다.
+        """
+        if not self.load_workbook():
+            return
+        
+        processed_sheet_count = 0
+        for sheet_name in self.get_sheet_names():
+            if TEST_MODE and TEST_MAX_SHEETS > 0 and processed_sheet_count >= TEST_MAX_SHEETS:
+                logger.warning(f"[테스트 모드] {TEST_MAX_SHEETS}개 시트 제한 도달, 나머지 시트 건너뜀")
+                break
+            
+            sheet = self.workbook[sheet_name]
+            if sheet.sheet_state == 'hidden' or sheet.sheet_state == 'veryHidden':
+                logger.info(f"시트 '{sheet_name}'는 숨김 처리되어 건너뜁니다.")
+                continue
+            
+            try:
+                for item in self.iter_sheet(sheet_name):
+                    yield sheet_name, item
+                processed_sheet_count += 1
+            except Exception as e:
+                logger.error(f"시트 '{sheet_name}' 처리 중 오류: {e}")
+                import traceback
+                logger.error(traceback.format_exc())
+                continue
+    
+    def process_all_sheets_flat(self) -> Dict[str, List[Any]]:
+        """
+        모든 시트의 항목을 하나의 열 지향(컬럼별 리스트) 테이블로 반환
+        
+        시트별 dict-of-lists 대신 FLAT_RESULT_COLUMNS 스키마의 평탄한 컬럼 리스트를 만든다.
+        metadata는 시트마다 헤더가 달라 JSON 문자열 컬럼(dumps_json, 공백 없는 한 줄)으로 저장한다.
+        
+        Returns:
+            Dict[str, List[Any]]: {'sheet_name': [...], 'row_number': [...], ...}
+        """
+        columns: Dict[str, List[Any]] = {name: [] for name in FLAT_RESULT_COLUMNS}
+        sheet_names = columns['sheet_name'].append
+        row_numbers = columns['row_number'].append
+        hyperlinks = columns['hyperlink'].append
+        hyperlink_lists = columns['hyperlinks'].append
+        document_keys = columns['document_key'].append
+        revisions = columns['revision'].append
+        metadata_json = columns['metadata_json'].append
+        
+        for sheet_name, item in self.iter_all_sheets():
+            sheet_names(sheet_name)
+            row_numbers(item.get('row_number'))
+            hyperlinks(item.get('hyperlink'))
+            hyperlink_lists(item.get('hyperlinks') or [])
+            document_keys(item.get('document_key'))
+            revisions(item.get('revision'))
+            metadata_json(dumps_json(item.get('metadata') or {}).decode('utf-8'))
+        
+        return columns
+    
+    def _process_sheets_parallel(
+        self,
+        sheet_names: List[str],
+        max_workers: int,
+        record_text_rows: bool = False
+    ) -> Dict[str, Tuple[SheetType, List[Dict], List[str]]]:
+        """
+        가시 시트를 프로세스 풀에 나누어 처리 (EXCEL_SHEET_WORKERS > 1)
+        - 각 작업 프로세스는 워크북을 한 번만 열어 여러 시트를 처리한다
+        - 결과는 원래 시트 순서대로 반환하며, 실패한 시트는 로그만 남기고 제외한다
+        - record_text_rows이면 작업 프로세스에서 기록한 행 레코드도 받아 순차 처리와 같이 보관한다
+        """
+        visible_sheets = []
+        for sheet_name in sheet_names:
+            sheet = self.workbook[sheet_name]
+            if sheet.sheet_state == 'hidden' or sheet.sheet_state == 'veryHidden':
+                logger.info(f"시트 '{sheet_name}'는 숨김 처리되어 건너뜁니다.")
+                continue
+            visible_sheets.append(sheet_name)
+        
+        if TEST_MODE and TEST_MAX_SHEETS > 0 and len(visible_sheets) > TEST_MAX_SHEETS:
+            logger.warning(f"[테스트 모드] {TEST_MAX_SHEETS}개 시트 제한 도달, 나머지 시트 건너뜀")
+            visible_sheets = visible_sheets[:TEST_MAX_SHEETS]
+        
+        if not visible_sheets:
+            return {}
+        
+        workers = min(max_workers, len(visible_sheets))
+        logger.info(f"시트 병렬 처리: {len(visible_sheets)}개 시트, 프로세스 {workers}개")
+        
+        # 셀 수가 많은 시트부터 제출해 큰 시트 하나가 마지막에 남아 전체 시간을 늘리는 것을 방지
+        # (결과는 원래 시트 순서대로 수집)
+        submit_order = sorted(
+            visible_sheets, key=lambda name: len(_sheet_cells(self.workbook[name])), reverse=True
+        )
+        all_results = {}
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_sheet_worker,
+            initargs=(str(self.excel_path),)
+        ) as executor:
+            futures = {
+                name: executor.submit(_process_sheet_worker, name, record_text_rows)
+                for name in submit_order
+            }
+            for sheet_name in visible_sheets:
+                future = futures[sheet_name]
+                try:
+                    all_results[sheet_name], row_records = future.result()
+                    if row_records is not None:
+                        self._row_records_cache[sheet_name] = row_records
+                except Exception as e:
+                    logger.error(f"시트 '{sheet_name}' 처리 중 오류: {e}")
+                    import traceback
+                    logger.error(traceback.format_exc())
+        
+        return all_results
+    
     def close(self):
         """워크북 닫기"""
+        self._close_data_only_workbook()
         if self.workbook:
             self.workbook.close()
             logger.info("워크북 닫기 완료")
 
+
+# ----- 시트 병렬 처리용 작업 프로세스 함수 (pickle 가능하도록 모듈 최상위에 정의) -----
+_worker_processor: Optional[ExcelProcessor] = None
+
+
+def _init_sheet_worker(excel_path: str):
+    """작업 프로세스 초기화: 프로세스당 워크북을 한 번만 로드"""
+    global _worker_processor
+    _worker_processor = ExcelProcessor(excel_path)
+    if not _worker_processor.load_workbook():
+        _worker_processor = None
+
+
+def _process_sheet_worker(
+    sheet_name: str,
+    record_text_rows: bool = False
+) -> Tuple[Tuple[SheetType, List[Dict], List[str]], Optional[List[Tuple[int, bool, Dict[str, str]]]]]:
+    """작업 프로세스에서 시트 하나를 처리 (결과, 기록된 행 레코드 또는 None)"""
+    if _worker_processor is None:
+        raise RuntimeError("작업 프로세스에서 워크북을 로드하지 못했습니다.")
+    result = _worker_processor.process_sheet(sheet_name, record_text_rows=record_text_rows)
+    return result, _worker_processor._row_records_cache.pop(sheet_name, None)
+
+
+# orjson이 json.dump가 처리하지 않는 타입(datetime/date, dataclass, str·dict 등의 하위 클래스)을
+# 자체 규칙으로 변환하지 않도록 그대로 넘기게 함 → TypeError로 표준 json 경로를 타서 json과 같은 결과/예외
+_ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_SUBCLASS
+    if orjson is not None else 0
+)
+
+
+def dumps_json(data: Any, indent: bool = False) -> bytes:
+    """
+    UTF-8 JSON 바이트로 직렬화 (orjson이 있으면 사용, 없거나 처리하지 못하는 값이면 표준 json)
+    - indent=True: 들여쓰기 2칸, False: 공백 없는 한 줄 (두 구현의 출력 구분자 통일)
+    - 결과는 json.dumps(ensure_ascii=False)와 같은 데이터를 담은 유효한 JSON이지만 orjson 사용 시 바이트까지 같지는 않음
+      · NaN/Infinity는 null로 기록 (json은 표준 JSON이 아닌 NaN/Infinity 리터럴을 씀)
+      · 실수 표기가 다를 수 있음 (예: json 1e+16 / orjson 1e16)
+      · 문자열이 아닌 dict 키, 64비트를 넘는 정수 등은 표준 json으로 처리
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=_ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if indent else 0))
+        except TypeError:
+            # orjson이 직렬화하지 못하는 타입이 섞인 경우 표준 json으로 폴백
+            pass
+    if indent:
+        text = json.dumps(data, ensure_ascii=False, indent=2)
+    else:
+        text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    return text.encode('utf-8')
+
+
+def write_json_file(data: Any, path: Path):
+    """
+    처리 결과를 들여쓰기 2칸 UTF-8 JSON 파일로 저장 (dumps_json 사용)
+    - orjson이 설치되어 있으면 사용 (json.dump는 indent 지정 시 순수 파이썬 인코더로 동작)
+    - json.dump(ensure_ascii=False, indent=2)와 같은 데이터의 유효한 JSON을 쓰며, 표기 차이는 dumps_json 참고
+    """
+    Path(path).write_bytes(dumps_json(data, indent=True))
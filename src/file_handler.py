@@ -5,16 +5,177 @@ import os
 import shutil
 import subprocess
 import zipfile
+import zlib
+import types
+import io
+import struct
 import stat
 import time
 import threading
 import html
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Optional, List, Tuple
 from urllib.parse import urlparse, unquote
 import requests
 from logger import logger
-from config import DOWNLOAD_DIR, TEMP_DIR, TEXT_ENCODING, PDF_SPLIT_SIZE_MB, PDF_SPLIT_MAX_PAGES
+from config import (
+    DOWNLOAD_DIR, TEMP_DIR, TEXT_ENCODING, PDF_SPLIT_SIZE_MB, PDF_SPLIT_MAX_PAGES,
+    FILE_PROCESS_WORKERS, DOWNLOAD_PARALLEL_PARTS, ZIP_USE_ISAL,
+)
+
+# ZIP 압축 해제 가속 (선택: ZIP_USE_ISAL=true + pip install isal) — enable_isal_zip() 참고
+_isal_enabled = False
+
+
+class _IsalDecompressor:
+    """ISA-L 해제 객체 래퍼: 해제 오류를 zlib.error로 바꿔 zipfile 호출부가 표준 zlib과 같은 예외를 받게 함"""
+    
+    __slots__ = ('_decomp', '_error')
+    
+    def __init__(self, decomp, error):
+        self._decomp = decomp
+        self._error = error
+    
+    def decompress(self, data, max_length=0):
+        try:
+            return self._decomp.decompress(data, max_length)
+        except self._error as e:
+            raise zlib.error(str(e)) from e
+    
+    def flush(self, *args):
+        try:
+            return self._decomp.flush(*args)
+        except self._error as e:
+            raise zlib.error(str(e)) from e
+    
+    @property
+    def eof(self):
+        return self._decomp.eof
+    
+    @property
+    def unconsumed_tail(self):
+        return self._decomp.unconsumed_tail
+    
+    @property
+    def unused_data(self):
+        return self._decomp.unused_data
+
+
+def enable_isal_zip() -> bool:
+    """
+    zipfile의 Deflate 해제와 CRC 계산을 ISA-L(isal 패키지) 구현으로 교체 (ZIP_USE_ISAL=true일 때만)
+    
+    zipfile 모듈 자체를 바꾸므로 openpyxl 등 프로세스 내 모든 ZIP 읽기에 적용된다.
+    그래서 import 시점이 아니라 배치 진입점(main.run_batch)에서 명시적으로 1회 호출한다.
+    - 해제는 zlib.decompressobj와 모듈 전역 crc32만 쓰므로 이 두 가지만 교체 (압축은 표준 zlib 유지)
+    - 교체 전 CRC 결과가 zlib과 같은지 확인하고, 해제 오류는 zlib.error로 전달
+    
+    Returns:
+        ISA-L 적용 여부
+    """
+    global _isal_enabled
+    if not ZIP_USE_ISAL:
+        return False
+    if _isal_enabled:
+        return True
+    try:
+        from isal import isal_zlib
+    except ImportError:
+        logger.warning("ZIP_USE_ISAL=true 이지만 isal 패키지가 없어 표준 zlib을 사용합니다 (pip install isal)")
+        return False
+    
+    probe = bytes(range(256)) * 64
+    if (isal_zlib.crc32(probe) != zlib.crc32(probe)
+            or isal_zlib.crc32(probe, 0x12345678) != zlib.crc32(probe, 0x12345678)):
+        logger.warning("isal crc32 결과가 zlib과 달라 표준 zlib을 사용합니다")
+        return False
+    
+    isal_decompressobj = isal_zlib.decompressobj
+    isal_error = isal_zlib.error
+    
+    def decompressobj(*args, **kwargs):
+        return _IsalDecompressor(isal_decompressobj(*args, **kwargs), isal_error)
+    
+    zipfile_zlib = types.ModuleType('zlib')
+    zipfile_zlib.__dict__.update(vars(zlib))
+    zipfile_zlib.decompressobj = decompressobj
+    zipfile.zlib = zipfile_zlib
+    # zipfile은 import 시점에 crc32 = zlib.crc32를 모듈 전역으로 바인딩하므로 별도로 교체
+    zipfile.crc32 = isal_zlib.crc32
+    _isal_enabled = True
+    logger.info("ZIP 압축 해제에 ISA-L(isal) 사용")
+    return True
+
+# 대용량 ZIP 멤버 병렬 해제 (선택: pip install rapidgzip)
+# 단일 Deflate 스트림도 여러 코어로 나누어 해제 (미설치 시 zipfile로 해제)
+try:
+    import rapidgzip
+except ImportError:
+    rapidgzip = None
+
+# 다운로드 스트림 읽기 단위 (작으면 Python 루프 반복이 많아짐)
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# 분할 다운로드를 적용할 최소 파일 크기 (작은 파일은 연결 수립 비용이 더 큼)
+RANGED_DOWNLOAD_MIN_BYTES = 16 * 1024 * 1024
+
+# 병렬 압축 해제를 적용할 최소 ZIP 멤버 수 (적으면 ZipFile을 스레드마다 여는 비용이 더 큼)
+PARALLEL_EXTRACT_MIN_MEMBERS = 8
+
+# rapidgzip으로 해제할 최소 압축 크기 (작은 멤버는 병렬 해제 준비 비용이 더 큼)
+PARALLEL_DEFLATE_MIN_BYTES = 32 * 1024 * 1024
+
+
+class _ZipEntryReader(io.RawIOBase):
+    """ZIP 파일 안에서 한 멤버의 압축 데이터 구간만 읽는 파일 객체 (rapidgzip 입력용)"""
+    
+    def __init__(self, fp, offset: int, size: int):
+        self._fp = fp
+        self._offset = offset
+        self._size = size
+        self._pos = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def tell(self) -> int:
+        return self._pos
+    
+    def seek(self, pos: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            pos += self._pos
+        elif whence == io.SEEK_END:
+            pos += self._size
+        self._pos = max(0, min(pos, self._size))
+        return self._pos
+    
+    def readinto(self, buffer) -> int:
+        n = min(len(buffer), self._size - self._pos)
+        if n <= 0:
+            return 0
+        self._fp.seek(self._offset + self._pos)
+        data = self._fp.read(n)
+        buffer[:len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+# Windows에서 파일명에 쓸 수 없는 문자 → '_' (zipfile 해제 규칙과 동일)
+_WINDOWS_ILLEGAL_NAME_TABLE = str.maketrans(':<>|"?*', '_' * 7)
+
+
+def _sanitize_windows_name(arcname: str, pathsep: str) -> str:
+    """
+    Windows 금지 문자를 치환하고 경로 요소 끝의 '.'과 빈 요소 제거
+    (zipfile.ZipFile._sanitize_windows_name과 같은 규칙을 비공개 메서드에 의존하지 않도록 복사)
+    """
+    arcname = arcname.translate(_WINDOWS_ILLEGAL_NAME_TABLE)
+    return pathsep.join(part for part in (x.rstrip('.') for x in arcname.split(pathsep)) if part)
+
 
 # Excel 단순화용 (지연 import로 순환 참조 방지)
 _ExcelProcessor = None
@@ -48,6 +209,14 @@ class FileHandler:
         self.temp_dir = TEMP_DIR
         self.revision_db = revision_db  # 다운로드 캐시용
         self.crypto_handler = crypto_handler  # 암복호화 처리용
+        self._executor = None  # ZIP 내부 파일 병렬 처리용 (지연 생성)
+        self._worker_state = threading.local()  # 풀 작업 스레드 여부 (중첩 ZIP 교착 방지)
+        # HWP/Office 변환은 한글 대화상자 자동 클릭(전역 창 조작)과 LibreOffice 프로필을 공유하므로 직렬화
+        self._convert_lock = threading.Lock()
+        # 한글 프로그램 COM 객체는 전용 스레드 하나에서 생성/재사용 (close_hwp에서 종료)
+        self._hwp_executor = None
+        self._hwp = None
+        self._hwp_com_initialized = False
     
     def is_url(self, path: str) -> bool:
         """URL인지 파일 경로인지 판별"""
@@ -103,12 +272,13 @@ class FileHandler:
             save_path = self.download_dir / save_name
             
             logger.info(f"파일 다운로드 시작: {url}")
-            response = requests.get(url, stream=True, timeout=60)
-            response.raise_for_status()
-            
-            with open(save_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            if not (DOWNLOAD_PARALLEL_PARTS > 1 and self._download_ranged(url, save_path, DOWNLOAD_PARALLEL_PARTS)):
+                response = requests.get(url, stream=True, timeout=60)
+                response.raise_for_status()
+                
+                with open(save_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
             
             logger.info(f"파일 다운로드 완료: {save_path}")
             
@@ -134,6 +304,95 @@ class FileHandler:
             logger.error(f"파일 다운로드 실패 ({url}): {e}")
             return None
     
+    def _download_ranged(self, url: str, save_path: Path, parts: int) -> bool:
+        """
+        HTTP Range 요청으로 파일을 여러 구간으로 나누어 동시에 다운로드
+        
+        Args:
+            url: 다운로드할 파일 URL
+            save_path: 저장 경로
+            parts: 동시 연결 수
+        
+        Note:
+            - 모든 구간이 HEAD 응답과 같은 버전의 파일에서 오도록 If-Range(ETag 또는 Last-Modified)를 보낸다
+              (파일이 바뀌었으면 서버가 206 대신 전체 본문 200을 보내므로 실패 처리)
+            - 구간 응답은 206 + 요청한 구간/전체 크기와 같은 Content-Range만 받는다
+            - 실패하면 일부만 기록된 파일을 지우고 False 반환
+        
+        Returns:
+            성공 여부 (False면 호출 측에서 단일 연결로 다운로드)
+        """
+        # 구간 길이가 Content-Length와 일치해야 하므로 압축 전송은 받지 않음
+        headers = {'Accept-Encoding': 'identity'}
+        try:
+            head = requests.head(url, headers=headers, allow_redirects=True, timeout=60)
+            head.raise_for_status()
+            size = int(head.headers.get('Content-Length') or 0)
+            if head.headers.get('Accept-Ranges', '').lower() != 'bytes' or size < RANGED_DOWNLOAD_MIN_BYTES:
+                return False
+        except Exception as e:
+            logger.debug(f"분할 다운로드 확인 실패 (단일 연결 사용): {e}")
+            return False
+        
+        # If-Range에는 강한 ETag 또는 Last-Modified만 사용 가능 (약한 ETag W/"..."는 서버가 무시)
+        etag = head.headers.get('ETag')
+        validator = etag if etag and not etag.startswith('W/') else head.headers.get('Last-Modified')
+        if not validator:
+            logger.debug("ETag/Last-Modified 없음 → 구간이 같은 버전인지 확인할 수 없어 단일 연결 사용")
+            return False
+        
+        part_size = -(-size // parts)
+        ranges = [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+        logger.info(f"분할 다운로드: {size} bytes, {len(ranges)}개 구간")
+        
+        # 전체 크기로 미리 생성해 두고 각 구간은 자기 위치에만 기록
+        with open(save_path, 'wb') as f:
+            f.truncate(size)
+        
+        def fetch(start: int, end: int):
+            range_headers = dict(headers, Range=f"bytes={start}-{end}")
+            range_headers['If-Range'] = validator
+            with requests.get(url, headers=range_headers, stream=True, timeout=60) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    # 200이면 Range 미지원이거나 HEAD 이후 파일이 바뀐 것 (If-Range 불일치)
+                    raise IOError(f"Range 응답 아님 (HTTP {response.status_code})")
+                content_range = response.headers.get('Content-Range', '')
+                if content_range.replace(' ', '') != f"bytes{start}-{end}/{size}":
+                    raise IOError(f"Content-Range 불일치 (요청 {start}-{end}/{size}, 응답 '{content_range}')")
+                
+                written = 0
+                with open(save_path, 'r+b') as f:
+                    f.seek(start)
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        written += len(chunk)
+            
+            if written != end - start + 1:
+                raise IOError(f"구간 크기 불일치 ({start}-{end}: {written} bytes)")
+        
+        try:
+            with ThreadPoolExecutor(max_workers=len(ranges), thread_name_prefix="download") as executor:
+                futures = [executor.submit(fetch, start, end) for start, end in ranges]
+                try:
+                    for future in futures:
+                        future.result()
+                except Exception:
+                    # 아직 시작하지 않은 구간은 취소 (진행 중인 구간은 풀 종료 시 끝날 때까지 대기)
+                    for future in futures:
+                        future.cancel()
+                    raise
+        except Exception as e:
+            logger.warning(f"분할 다운로드 실패, 단일 연결로 재시도: {e}")
+            # 일부 구간만 기록된(나머지는 0으로 채워진) 파일이 남지 않도록 삭제
+            try:
+                save_path.unlink()
+            except OSError:
+                pass
+            return False
+        
+        return True
+    
     def copy_local_file(self, file_path: str) -> Optional[Path]:
         """
         로컬 파일을 작업 디렉토리로 복사
@@ -234,19 +493,22 @@ class FileHandler:
 
             result = False
             
-            # Windows에서 한글 프로그램 우선 시도
-            if platform.system() == 'Windows':
-                logger.info("Windows 환경 감지 - 한글 프로그램으로 변환 시도")
-                result = self._convert_with_hwp_com(hwp_path, pdf_path)
+            with self._convert_lock:
+                # Windows에서 한글 프로그램 우선 시도
+                if platform.system() == 'Windows':
+                    logger.info("Windows 환경 감지 - 한글 프로그램으로 변환 시도")
+                    if self._hwp_executor is None:
+                        self._hwp_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hwp_com")
+                    result = self._hwp_executor.submit(self._convert_with_hwp_com, hwp_path, pdf_path).result()
+                    
+                    if result:
+                        logger.info(f"한글 프로그램으로 변환 완료: {pdf_path}")
+                        return pdf_path
+                    else:
+                        logger.warning("한글 프로그램 변환 실패 - LibreOffice로 재시도")
                 
-                if result:
-                    logger.info(f"한글 프로그램으로 변환 완료: {pdf_path}")
-                    return pdf_path
-                else:
-                    logger.warning("한글 프로그램 변환 실패 - LibreOffice로 재시도")
-            
-            # 한글 프로그램 실패 또는 Linux인 경우 LibreOffice 사용
-            result = self._convert_with_libreoffice(hwp_path, pdf_path)
+                # 한글 프로그램 실패 또는 Linux인 경우 LibreOffice 사용
+                result = self._convert_with_libreoffice(hwp_path, pdf_path)
             
             if result:
                 logger.info(f"HWP->PDF 변환 완료: {pdf_path}")
@@ -261,10 +523,117 @@ class FileHandler:
             logger.error(f"HWP->PDF 변환 실패 ({hwp_path}): {e}")
             return hwp_path  # 원본 반환
     
+    def _get_hwp(self):
+        """
+        재사용할 한글 프로그램 COM 객체 반환 (없으면 생성)
+        
+        HWP 변환 전용 스레드(_hwp_executor)에서만 호출됨.
+        COM 객체는 생성한 스레드(아파트먼트)에서만 사용할 수 있으므로
+        모든 변환을 같은 스레드에서 수행하고, 한글 프로그램은 한 번만 기동한다.
+        """
+        if self._hwp is not None:
+            # 한글 프로그램이 비정상 종료되었으면 죽은 COM 객체를 재사용하지 않고 새로 생성
+            try:
+                self._hwp.Version
+                return self._hwp
+            except Exception as e:
+                logger.warning(f"한글 프로그램 COM 객체 응답 없음, 다시 생성: {e}")
+                self._quit_hwp()
+        
+        import win32com.client
+        import pythoncom
+        
+        logger.info("한글 프로그램 COM 초기화 시작")
+        if not self._hwp_com_initialized:
+            pythoncom.CoInitialize()
+            self._hwp_com_initialized = True
+        
+        # 한글 프로그램 COM 객체 생성 (DispatchEx로 새 인스턴스 생성)
+        logger.info("HWP COM 객체 생성 중...")
+        try:
+            hwp = win32com.client.DispatchEx("HWPFrame.HwpObject")
+            logger.info("DispatchEx로 COM 객체 생성 완료")
+        except Exception as e:
+            logger.warning(f"DispatchEx 실패, Dispatch 시도: {e}")
+            hwp = win32com.client.Dispatch("HWPFrame.HwpObject")
+            logger.info("Dispatch로 COM 객체 생성 완료")
+        
+        # HWP 객체 정보 로깅
+        logger.info(f"HWP 객체 타입: {type(hwp)}")
+        logger.info(f"HWP 객체 속성: {dir(hwp)[:10]}...")  # 처음 10개만
+        
+        # 한글 프로그램 창 숨기기 시도
+        try:
+            # HWP 버전에 따라 다른 속성 사용
+            if hasattr(hwp, 'XVisible'):
+                hwp.XVisible = False
+                logger.info("한글 프로그램 창 숨김 설정 (XVisible)")
+            elif hasattr(hwp, 'Visible'):
+                hwp.Visible = False
+                logger.info("한글 프로그램 창 숨김 설정 (Visible)")
+            else:
+                logger.warning("창 숨김 속성을 찾을 수 없습니다")
+                # 사용 가능한 속성 확인
+                visible_attrs = [attr for attr in dir(hwp) if 'visible' in attr.lower()]
+                logger.info(f"Visible 관련 속성: {visible_attrs}")
+        except Exception as e:
+            logger.warning(f"창 숨김 설정 실패: {e}")
+        
+        # 메시지 박스 억제 (경고 대화상자 방지) - 가장 중요!
+        try:
+            # 0x00000010: 메시지박스 표시 안함
+            # 0x00000020: 모든 대화상자를 기본값으로 자동 처리
+            if hasattr(hwp, 'SetMessageBoxMode'):
+                hwp.SetMessageBoxMode(0x00000030)
+                logger.info("메시지 박스 억제 설정 완료 (0x00000030)")
+            else:
+                logger.warning("SetMessageBoxMode 메서드를 찾을 수 없습니다")
+        except Exception as e:
+            logger.warning(f"메시지 박스 억제 설정 실패: {e}")
+        
+        self._hwp = hwp
+        return hwp
+    
+    def _quit_hwp(self):
+        """재사용 중인 한글 프로그램 종료 및 COM 정리 (HWP 변환 전용 스레드에서 호출)"""
+        if self._hwp is not None:
+            try:
+                logger.info("한글 프로그램 종료 중...")
+                self._hwp.Quit()
+            except Exception as e:
+                logger.warning(f"한글 프로그램 종료 실패: {e}")
+            self._hwp = None
+        
+        if self._hwp_com_initialized:
+            try:
+                import pythoncom
+                pythoncom.CoUninitialize()
+            except Exception as e:
+                logger.warning(f"COM 정리 실패: {e}")
+            self._hwp_com_initialized = False
+    
+    def close_hwp(self):
+        """
+        HWP 변환 전용 스레드와 한글 프로그램 COM 객체 정리
+        
+        atexit 시점에는 ThreadPoolExecutor 작업 스레드가 이미 종료되어 COM 스레드에서 Quit를 호출할 수 없으므로
+        FileHandler를 쓰는 쪽이 close()(또는 cleanup_temp())를 finally에서 호출해야 한다.
+        """
+        if self._hwp_executor is None:
+            return
+        try:
+            self._hwp_executor.submit(self._quit_hwp).result()
+        finally:
+            self._hwp_executor.shutdown(wait=True)
+            self._hwp_executor = None
+    
     def _convert_with_hwp_com(self, hwp_path: Path, pdf_path: Path) -> bool:
         """
         Windows 한글 프로그램 COM을 사용한 HWP → PDF 변환
         
+        HWP 변환 전용 스레드에서 실행되며, 한글 프로그램은 종료하지 않고
+        문서만 닫아(Clear) 다음 파일 변환에 재사용한다.
+        
         Args:
             hwp_path: 원본 HWP 파일 경로
             pdf_path: 출력 PDF 파일 경로
@@ -272,68 +641,20 @@ class FileHandler:
         Returns:
             변환 성공 여부
         """
-        hwp = None
+        stop_clicking = [False]
         try:
             # pywin32 패키지 필요
-            import win32com.client
-            import pythoncom
+            import win32com.client  # noqa: F401
             import time
             
-            logger.info("한글 프로그램 COM 초기화 시작")
-            
             # 파일 경로 검증
             if not hwp_path.exists():
                 logger.error(f"HWP 파일이 존재하지 않습니다: {hwp_path}")
                 return False
             
-            # COM 초기화
-            pythoncom.CoInitialize()
+            hwp = self._get_hwp()
             
             try:
-                # 한글 프로그램 COM 객체 생성 (DispatchEx로 새 인스턴스 생성)
-                logger.info("HWP COM 객체 생성 중...")
-                try:
-                    hwp = win32com.client.DispatchEx("HWPFrame.HwpObject")
-                    logger.info("DispatchEx로 COM 객체 생성 완료")
-                except Exception as e:
-                    logger.warning(f"DispatchEx 실패, Dispatch 시도: {e}")
-                    hwp = win32com.client.Dispatch("HWPFrame.HwpObject")
-                    logger.info("Dispatch로 COM 객체 생성 완료")
-                
-                # HWP 객체 정보 로깅
-                logger.info(f"HWP 객체 타입: {type(hwp)}")
-                logger.info(f"HWP 객체 속성: {dir(hwp)[:10]}...")  # 처음 10개만
-                
-                # 한글 프로그램 창 숨기기 시도
-                try:
-                    # HWP 버전에 따라 다른 속성 사용
-                    if hasattr(hwp, 'XVisible'):
-                        hwp.XVisible = False
-                        logger.info("한글 프로그램 창 숨김 설정 (XVisible)")
-                    elif hasattr(hwp, 'Visible'):
-                        hwp.Visible = False
-                        logger.info("한글 프로그램 창 숨김 설정 (Visible)")
-                    else:
-                        logger.warning("창 숨김 속성을 찾을 수 없습니다")
-                        # 사용 가능한 속성 확인
-                        visible_attrs = [attr for attr in dir(hwp) if 'visible' in attr.lower()]
-                        logger.info(f"Visible 관련 속성: {visible_attrs}")
-                except Exception as e:
-                    logger.warning(f"창 숨김 설정 실패: {e}")
-                
-                # 메시지 박스 억제 (경고 대화상자 방지) - 가장 중요!
-                try:
-                    # 0x00000010: 메시지박스 표시 안함
-                    # 0x00000020: 모든 대화상자를 기본값으로 자동 처리
-                    if hasattr(hwp, 'SetMessageBoxMode'):
-                        hwp.SetMessageBoxMode(0x00000030)
-                        logger.info("메시지 박스 억제 설정 완료 (0x00000030)")
-                    else:
-                        logger.warning("SetMessageBoxMode 메서드를 찾을 수 없습니다")
-                except Exception as e:
-                    logger.warning(f"메시지 박스 억제 설정 실패: {e}")
-                
-                stop_clicking = [False]
                 processed_dialogs = set()  # 처리한 대화상자 추적
                 
                 def auto_click_dialog():
@@ -429,7 +750,7 @@ class FileHandler:
                 
                 click_thread = threading.Thread(target=auto_click_dialog, daemon=True)
                 click_thread.start()
-                # 보안 경고 무시 설정 시도
+                # 보안 경고 무시 설정 시도 (보안 대화상자가 뜰 수 있으므로 자동 클릭 스레드 시작 후 호출)
                 try:
                     if hasattr(hwp, 'RegisterModule'):
                         hwp.RegisterModule("FilePathCheckDLL", "SecurityModule")
@@ -468,19 +789,13 @@ class FileHandler:
                         logger.info(f"hwp.Open() 재시도 성공: {result}")
                     except Exception as e2:
                         logger.error(f"hwp.Open() 재시도 실패: {e2}")
-                        try:
-                            hwp.Quit()
-                        except:
-                            pass
+                        # 상태를 알 수 없으므로 한글 프로그램을 종료하고 다음 변환에서 새로 생성
+                        self._quit_hwp()
                         return False
                 
                 if not result:
                     logger.error("HWP 파일 열기 실패 - Open() 반환값이 False")
-                    try:
-                        hwp.Quit()
-                        
-                    except:
-                        pass
+                    self._quit_hwp()
                     return False
                 
                 logger.info("HWP 파일 열기 성공")
@@ -498,10 +813,12 @@ class FileHandler:
                 save_result = hwp.SaveAs(abs_pdf_path, "PDF", "")
                 logger.info(f"SaveAs() 결과: {save_result}")
                 
-                # 한글 프로그램 종료
-                logger.info("한글 프로그램 종료 중...")
-                hwp.Quit()
-                hwp = None
+                # 문서만 닫고 한글 프로그램은 다음 변환에 재사용 (1: 저장하지 않고 닫기)
+                try:
+                    hwp.Clear(1)
+                except Exception as e:
+                    logger.warning(f"문서 닫기 실패, 한글 프로그램 재시작 예정: {e}")
+                    self._quit_hwp()
                 
                 # 파일 저장 대기
                 time.sleep(0.5)
@@ -515,18 +832,8 @@ class FileHandler:
                     return False
             
             finally:
-                # COM 정리
-                if hwp is not None:
-                    try:
-                        logger.info("한글 프로그램 강제 종료 시도...")
-                        hwp.Quit()
-                    except Exception as e:
-                        logger.warning(f"한글 프로그램 종료 실패: {e}")
-                
-                try:
-                    pythoncom.CoUninitialize()
-                except Exception as e:
-                    logger.warning(f"COM 정리 실패: {e}")
+                # 대화상자 자동 클릭 스레드 종료
+                stop_clicking[0] = True
         
         except ImportError:
             logger.warning("pywin32 패키지가 설치되지 않았습니다.")
@@ -538,12 +845,8 @@ class FileHandler:
             import traceback
             logger.error(traceback.format_exc())
             
-            # 비정상 종료 시 한글 프로세스 정리
-            if hwp is not None:
-                try:
-                    hwp.Quit()
-                except:
-                    pass
+            # 비정상 종료 시 한글 프로세스 정리 (다음 변환에서 새로 생성)
+            self._quit_hwp()
             
             return False
     
@@ -582,107 +885,90 @@ class FileHandler:
             output_dir = pdf_absolute.parent
             output_dir.mkdir(parents=True, exist_ok=True)
             
-            # hwp_path를 먼저 절대 경로로 변환 (chdir 전에!)
+            # hwp_path를 절대 경로로 변환 (변환 스크립트는 출력 디렉토리에서 실행)
             hwp_absolute = hwp_path.resolve()
             
-            # 변환 스크립트의 디렉토리로 이동하여 실행
+            # 변환 스크립트를 출력 디렉토리를 작업 디렉토리로 하여 실행
             # (변환된 PDF가 호출 경로에 생성되므로)
-            original_cwd = Path.cwd()
+            # (os.chdir는 프로세스 전역이라 다른 스레드의 상대 경로가 깨지므로 subprocess의 cwd로만 지정)
+            
+            # Python 변환 명령 실행 (환경변수에서 Python 경로 가져오기)
+            cmd = [
+                HWP_CONVERTER_PYTHON,
+                str(conversion_script),
+                str(hwp_absolute)
+            ]
+            
+            logger.info(f"HWP 변환 Python API 호출: {' '.join(cmd)}")
+            logger.info(f"Python 인터프리터: {HWP_CONVERTER_PYTHON}")
+            logger.info(f"작업 디렉토리: {output_dir}")
+            logger.debug(f"실제 전달되는 cmd 리스트: {cmd}")
+            logger.debug(f"HWP 파일 경로: {hwp_absolute}")
+            logger.debug(f"HWP 파일 존재 확인: {hwp_absolute.exists()}")
+            
+            result = subprocess.run(
+                cmd,
+                cwd=str(output_dir),
+                capture_output=True,
+                text=True,
+                timeout=300  # 5분 타임아웃
+            )
             
-            try:
-                # 출력 디렉토리로 이동
-                os.chdir(output_dir)
-                
-                # Python 변환 명령 실행 (환경변수에서 Python 경로 가져오기)
-                cmd = [
-                    HWP_CONVERTER_PYTHON,
-                    str(conversion_script),
-                    str(hwp_absolute)
-                ]
-                
-                logger.info(f"HWP 변환 Python API 호출: {' '.join(cmd)}")
-                logger.info(f"Python 인터프리터: {HWP_CONVERTER_PYTHON}")
-                logger.info(f"작업 디렉토리: {output_dir}")
-                logger.debug(f"실제 전달되는 cmd 리스트: {cmd}")
-                logger.debug(f"HWP 파일 경로: {hwp_absolute}")
-                logger.debug(f"HWP 파일 존재 확인: {hwp_absolute.exists()}")
+            # 출력 로그 확인
+            if result.stdout:
+                logger.info(f"변환 출력: {result.stdout.strip()}")
+            if result.stderr:
+                logger.warning(f"변환 경고: {result.stderr.strip()}")
+            
+            if result.returncode == 0:
+                # 변환된 PDF 파일명 확인
+                # test_conversion.py는 스크립트 실행 위치(cwd)에 생성하거나 
+                # 원본과 같은 위치에 생성할 수 있음 (스크립트 구현에 따라 다름)
                 
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=300  # 5분 타임아웃
-                )
+                # 1. 예상 경로 (output_dir 내)
+                expected_pdf = output_dir / f"{hwp_path.stem}.pdf"
                 
-                # 출력 로그 확인
-                if result.stdout:
-                    logger.info(f"변환 출력: {result.stdout.strip()}")
-                if result.stderr:
-                    logger.warning(f"변환 경고: {result.stderr.strip()}")
                 
-                if result.returncode == 0:
-                    # 변환된 PDF 파일명 확인
-                    # test_conversion.py는 스크립트 실행 위치(cwd)에 생성하거나 
-                    # 원본과 같은 위치에 생성할 수 있음 (스크립트 구현에 따라 다름)
-                    
-                    # 1. 예상 경로 (output_dir 내)
-                    expected_pdf = output_dir / f"{hwp_path.stem}.pdf"
-                    
-                    
-                    found_pdf = None
-                    # 2. 원본 HWP 파일과 같은 위치에 생성되었을 경우
-                    # (hwp_absolute가 가리키는 원본 경로 기준)
-                    original_location_pdf = hwp_absolute.with_suffix('.pdf')
+                found_pdf = None
+                # 2. 원본 HWP 파일과 같은 위치에 생성되었을 경우
+                # (hwp_absolute가 가리키는 원본 경로 기준)
+                original_location_pdf = hwp_absolute.with_suffix('.pdf')
 
-                    if expected_pdf.exists() and expected_pdf.stat().st_size > 0:
-                        found_pdf = expected_pdf
-                    elif original_location_pdf.exists() and original_location_pdf.stat().st_size > 0:
-                        found_pdf = original_location_pdf
-                    
-                    # PDF 파일이 생성되었는지 확인
-                    if found_pdf:
-                        # 원하는 경로로 이동 (다른 경우에만)
-                        # found_pdf와 pdf_absolute가 다른 경로일 때 이동
-                        if found_pdf.resolve() != pdf_absolute:
-                            import shutil
-                            # 이미 목적지에 파일이 있으면 삭제
-                            if pdf_absolute.exists():
-                                pdf_absolute.unlink()
-                            
-                            shutil.move(str(found_pdf), str(pdf_absolute))
-                            logger.info(f"PDF 이동: {found_pdf} → {pdf_absolute}")
+                if expected_pdf.exists() and expected_pdf.stat().st_size > 0:
+                    found_pdf = expected_pdf
+                elif original_location_pdf.exists() and original_location_pdf.stat().st_size > 0:
+                    found_pdf = original_location_pdf
+                
+                # PDF 파일이 생성되었는지 확인
+                if found_pdf:
+                    # 원하는 경로로 이동 (다른 경우에만)
+                    # found_pdf와 pdf_absolute가 다른 경로일 때 이동
+                    if found_pdf.resolve() != pdf_absolute:
+                        import shutil
+                        # 이미 목적지에 파일이 있으면 삭제
+                        if pdf_absolute.exists():
+                            pdf_absolute.unlink()
                         
-                        logger.info(f"✓ HWP → PDF 변환 성공: {pdf_absolute}")
-                        return True
-                    else:
-                        logger.error(f"✗ PDF 파일이 생성되지 않았거나 크기가 0입니다")
-                        logger.error(f"   예상 경로: {expected_pdf}")
-                        return False
+                        shutil.move(str(found_pdf), str(pdf_absolute))
+                        logger.info(f"PDF 이동: {found_pdf} → {pdf_absolute}")
+                    
+                    logger.info(f"✓ HWP → PDF 변환 성공: {pdf_absolute}")
+                    return True
                 else:
-                    logger.error(f"✗ HWP 변환 실패 (exit code: {result.returncode})")
+                    logger.error(f"✗ PDF 파일이 생성되지 않았거나 크기가 0입니다")
+                    logger.error(f"   예상 경로: {expected_pdf}")
                     return False
-            
-            finally:
-                # 원래 디렉토리로 복귀
-                os.chdir(original_cwd)
+            else:
+                logger.error(f"✗ HWP 변환 실패 (exit code: {result.returncode})")
+                return False
         
         except subprocess.TimeoutExpired:
             logger.error(f"HWP 변환 타임아웃 (5분 초과): {hwp_path}")
-            # 원래 디렉토리로 복귀
-            try:
-                os.chdir(original_cwd)
-            except:
-                pass
             return False
         except Exception as e:
             logger.error(f"HWP 변환 중 오류: {e}")
             import traceback
             logger.error(traceback.format_exc())
-            # 원래 디렉토리로 복귀
-            try:
-                os.chdir(original_cwd)
-            except:
-                pass
             return False
     
     def extract_zip(self, zip_path: Path) -> List[Path]:
@@ -709,14 +995,12 @@ class FileHandler:
             if python_version >= (3, 11):
                 try:
                     # CP949 인코딩 시도 (Windows ZIP)
-                    with zipfile.ZipFile(zip_path, 'r', metadata_encoding='cp949') as zip_ref:
-                        zip_ref.extractall(extract_dir)
+                    self._extract_members(zip_path, extract_dir, 'cp949')
                     logger.info("ZIP 파일 압축 해제 완료 (CP949 인코딩)")
                 except Exception as e:
                     logger.warning(f"CP949 인코딩 실패, UTF-8로 재시도: {e}")
                     # UTF-8 인코딩 시도
-                    with zipfile.ZipFile(zip_path, 'r', metadata_encoding='utf-8') as zip_ref:
-                        zip_ref.extractall(extract_dir)
+                    self._extract_members(zip_path, extract_dir, 'utf-8')
                     logger.info("ZIP 파일 압축 해제 완료 (UTF-8 인코딩)")
             
             # Python 3.10 이하: 수동 인코딩 처리
@@ -780,6 +1064,128 @@ class FileHandler:
             logger.debug(traceback.format_exc())
             return []
     
+    def _extract_members(self, zip_path: Path, extract_dir: Path, metadata_encoding: str):
+        """
+        ZIP 멤버 전체 압축 해제 (Python 3.11 이상)
+        
+        FILE_PROCESS_WORKERS > 1이고 멤버가 많으면 멤버를 스레드 수만큼 나누어
+        스레드마다 별도 ZipFile(파일 핸들)로 동시에 해제한다.
+        하나의 ZipFile은 파일 핸들을 잠금으로 공유하므로 스레드별로 따로 열어야 병렬로 읽힌다.
+        
+        Args:
+            zip_path: ZIP 파일 경로
+            extract_dir: 압축 해제 디렉토리
+            metadata_encoding: 파일명 인코딩 (cp949, utf-8)
+        """
+        with zipfile.ZipFile(zip_path, 'r', metadata_encoding=metadata_encoding) as zip_ref:
+            members = zip_ref.infolist()
+            
+            # 대용량 Deflate 멤버는 rapidgzip으로 먼저 해제 (실패 시 아래 zipfile 경로에서 처리)
+            if rapidgzip is not None:
+                members = [
+                    member for member in members
+                    if not (member.compress_type == zipfile.ZIP_DEFLATED
+                            and not member.flag_bits & 0x1
+                            and member.compress_size >= PARALLEL_DEFLATE_MIN_BYTES
+                            and self._extract_large_deflated(zip_path, member, extract_dir))
+                ]
+            
+            workers = FILE_PROCESS_WORKERS if FILE_PROCESS_WORKERS > 0 else (os.cpu_count() or 1)
+            if (workers <= 1 or len(members) < PARALLEL_EXTRACT_MIN_MEMBERS
+                    or getattr(self._worker_state, 'active', False)):
+                zip_ref.extractall(extract_dir, members=members)
+                return
+        
+        def extract_slice(slice_members):
+            with zipfile.ZipFile(zip_path, 'r', metadata_encoding=metadata_encoding) as zf:
+                for member in slice_members:
+                    try:
+                        zf.extract(member, extract_dir)
+                    except FileExistsError:
+                        # 다른 스레드가 같은 상위 디렉토리를 동시에 생성한 경우 → 한 번 더 시도
+                        zf.extract(member, extract_dir)
+        
+        workers = min(workers, len(members))
+        logger.info(f"ZIP 병렬 압축 해제: {len(members)}개 멤버, {workers}개 스레드")
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="unzip") as executor:
+            list(executor.map(extract_slice, [members[i::workers] for i in range(workers)]))
+    
+    def _extract_large_deflated(self, zip_path: Path, member: zipfile.ZipInfo, extract_dir: Path) -> bool:
+        """
+        대용량 Deflate 멤버 하나를 rapidgzip으로 병렬 해제
+        
+        로컬 헤더 뒤의 압축 데이터 구간만 rapidgzip에 넘기고, 해제 결과의 CRC/크기를 검증한다.
+        
+        Args:
+            zip_path: ZIP 파일 경로
+            member: 해제할 멤버 (암호화되지 않은 ZIP_DEFLATED)
+            extract_dir: 압축 해제 디렉토리
+        
+        Returns:
+            성공 여부 (False면 호출 측에서 zipfile로 해제)
+        """
+        if member.is_dir():
+            return False
+        
+        # ZipFile._extract_member와 같은 경로 정규화
+        # (드라이브/UNC 제거, 빈 경로·'.'·'..' 요소 제거, Windows 금지 문자 치환)
+        arcname = member.filename.replace('/', os.path.sep)
+        if os.path.altsep:
+            arcname = arcname.replace(os.path.altsep, os.path.sep)
+        arcname = os.path.splitdrive(arcname)[1]
+        arcname = os.path.sep.join(
+            part for part in arcname.split(os.path.sep) if part not in ('', os.path.curdir, os.path.pardir)
+        )
+        if os.path.sep == '\\':
+            arcname = _sanitize_windows_name(arcname, os.path.sep)
+        if not arcname:
+            return False
+        target_path = Path(os.path.normpath(os.path.join(extract_dir, arcname)))
+        
+        # 정규화 후에도 압축 해제 디렉토리 밖을 가리키면 zipfile 경로로 처리
+        if not target_path.resolve().is_relative_to(extract_dir.resolve()):
+            logger.warning(f"압축 해제 디렉토리 밖 경로, rapidgzip 해제 생략: {member.filename}")
+            return False
+        
+        try:
+            with open(zip_path, 'rb') as fp:
+                # 로컬 파일 헤더(30바이트 + 파일명 + extra) 다음부터 압축 데이터
+                fp.seek(member.header_offset)
+                header = fp.read(30)
+                if header[:4] != b'PK\x03\x04':
+                    return False
+                name_length, extra_length = struct.unpack('<HH', header[26:30])
+                data_offset = member.header_offset + 30 + name_length + extra_length
+                
+                logger.info(f"대용량 멤버 병렬 해제 (rapidgzip): {member.filename} ({member.compress_size} bytes)")
+                target_path.parent.mkdir(parents=True, exist_ok=True)
+                
+                crc = 0
+                written = 0
+                source = _ZipEntryReader(fp, data_offset, member.compress_size)
+                with rapidgzip.open(source, parallelization=os.cpu_count() or 1) as src, \
+                        open(target_path, 'wb') as dst:
+                    while True:
+                        chunk = src.read(4 * 1024 * 1024)
+                        if not chunk:
+                            break
+                        crc = zlib.crc32(chunk, crc)
+                        written += len(chunk)
+                        dst.write(chunk)
+            
+            if crc != member.CRC or written != member.file_size:
+                raise IOError(f"CRC/크기 불일치 ({written} bytes)")
+            return True
+        
+        except Exception as e:
+            logger.warning(f"rapidgzip 해제 실패, zipfile로 재시도: {member.filename} - {e}")
+            try:
+                if target_path.exists():
+                    target_path.unlink()
+            except OSError:
+                pass
+            return False
+    
     def _split_pdf_if_large(self, pdf_path: Path, max_size_mb: int = None, max_pages: int = None) -> List[Path]:
         """
         PDF 파일이 지정된 크기 또는 페이지 수보다 크면 분할
@@ -1001,9 +1407,8 @@ class FileHandler:
         elif ext == 'zip':
             # ZIP 압축 해제 (extract_zip에서 암호화 해제도 수행)
             extracted_files = self.extract_zip(file_path)
-            for extracted_file in extracted_files:
-                # 재귀 호출 시 skip_decryption=True (extract_zip에서 이미 처리됨)
-                sub_results = self.process_file(extracted_file, skip_decryption=True)
+            # 재귀 호출 시 skip_decryption=True (extract_zip에서 이미 처리됨)
+            for sub_results in self._process_many(extracted_files, skip_decryption=True):
                 results.extend(sub_results)
         
         else:
@@ -1013,6 +1418,37 @@ class FileHandler:
         
         return results
     
+    def _process_many(self, file_paths: List[Path], skip_decryption: bool = False) -> List[List[Tuple[Path, str]]]:
+        """
+        여러 파일을 process_file로 처리 (FILE_PROCESS_WORKERS > 1이면 스레드 풀 사용)
+        
+        Args:
+            file_paths: 처리할 파일 경로 목록
+            skip_decryption: 암호화 해제 건너뛰기
+        
+        Returns:
+            파일별 process_file 결과 목록 (입력 순서 유지)
+        """
+        workers = FILE_PROCESS_WORKERS if FILE_PROCESS_WORKERS > 0 else (os.cpu_count() or 1)
+        
+        # 파일이 하나뿐이거나, 이미 풀 작업 스레드 안(중첩 ZIP)이면 순차 처리
+        # (작업 스레드가 같은 풀의 결과를 기다리면 풀이 가득 찼을 때 교착 상태가 됨)
+        if workers <= 1 or len(file_paths) <= 1 or getattr(self._worker_state, 'active', False):
+            return [self.process_file(p, skip_decryption=skip_decryption) for p in file_paths]
+        
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="file_handler")
+            logger.info(f"파일 처리 스레드 풀 생성: {workers}개")
+        
+        def run(path: Path) -> List[Tuple[Path, str]]:
+            self._worker_state.active = True
+            try:
+                return self.process_file(path, skip_decryption=skip_decryption)
+            finally:
+                self._worker_state.active = False
+        
+        return list(self._executor.map(run, file_paths))
+    
     def _simplify_excel_for_table_parser(self, file_path: Path) -> Optional[Path]:
         """
         Excel 파일을 RAGFlow Table 파서에 맞게 단순화
@@ -1033,7 +1469,11 @@ class FileHandler:
                 logger.error(f"Excel 워크북 로드 실패: {file_path.name}")
                 return None
             
-            result = processor.extract_sheet_as_simplified_excel(self.temp_dir)
+            # 결과 파일명은 원본 stem으로 정해지므로 입력마다 별도 디렉토리 사용
+            # (ZIP 안의 a/목록.xlsx, b/목록.xlsx를 풀 스레드가 동시에 처리해도 서로 덮어쓰지 않음)
+            output_dir = self.temp_dir / "simplified" / uuid.uuid4().hex
+            output_dir.mkdir(parents=True, exist_ok=True)
+            result = processor.extract_sheet_as_simplified_excel(output_dir)
             processor.close()
             
             return result
@@ -1258,8 +1698,17 @@ class FileHandler:
         except Exception as e:
             logger.warning(f"임시 파일 정리 실패: {e}")
 
+    def close(self):
+        """파일 처리 스레드 풀과 한글 프로그램 정리 (여러 번 호출해도 안전, 임시 파일은 유지)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.close_hwp()
+    
     def cleanup_temp(self):
         """임시 파일 정리"""
+        self.close()
+        
         try:
             if self.temp_dir.exists():
                 shutil.rmtree(self.temp_dir)
@@ -8,7 +8,8 @@ from datetime import datetime
 import schedule
 import time
 from batch_processor import BatchProcessor
-from excel_processor import ExcelProcessor
+from excel_processor import ExcelProcessor, write_json_file
+from file_handler import enable_isal_zip
 from logger import logger
 from config import EXCEL_FILE_PATH, BATCH_SCHEDULE,FILE_SYSTEM_PATH
 
@@ -18,6 +19,9 @@ def run_batch(excel_path: str = None, data_source: str = None, filesystem_path:
     start_time = datetime.now()
     logger.info(f"\n배치 작업 시작 시간: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
     
+    # ZIP_USE_ISAL=true면 zipfile 해제를 ISA-L로 교체 (프로세스 전체에 적용되므로 배치 진입점에서만 호출)
+    enable_isal_zip()
+    
     try:
         processor = BatchProcessor(excel_path=excel_path, data_source=data_source, filesystem_path=filesystem_path)
         processor.process()
@@ -452,9 +456,7 @@ def main():
                     outdir.mkdir(parents=True, exist_ok=True)
                     safe = ''.join(ch if ch not in '\\/:*?"<>|' else '_' for ch in sheet_name).strip() or 'sheet'
                     out_file = outdir / f"{safe}.processed.json"
-                    with out_file.open('w', encoding='utf-8') as f:
-                        import json
-                        json.dump(data, f, ensure_ascii=False, indent=2)
+                    write_json_file(data, out_file)
                     logger.info(f"시트 '{sheet_name}' 처리 결과 저장: {out_file}")
                 except Exception as e:
                     logger.error(f"시트 '{sheet_name}' 처리 중 오류: {e}")
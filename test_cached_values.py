@@ -0,0 +1,127 @@
+"""
+시트 XML 직접 파싱(_load_cached_values) 결과가 openpyxl data_only 값과 같은지 확인하는 테스트
+- 공유 문자열의 _x005F_ 이스케이프, 기본 경로가 아닌 공유 문자열 파트, 인라인 문자열,
+  날짜/기간 서식, 수식 캐시 값, 병합 셀을 포함한 워크북으로 비교
+"""
+import sys
+import re
+import datetime
+import zipfile
+import tempfile
+from pathlib import Path
+
+import openpyxl
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from excel_processor import ExcelProcessor
+
+SAMPLE_EXCEL = Path(__file__).parent / "data" / "20250515_KTX-DATA_EMU.xlsx"
+
+
+def _build_workbook(path: Path):
+    """openpyxl로 기본 워크북을 만든 뒤 XML을 직접 고쳐 openpyxl이 쓰지 않는 형태를 추가"""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "값"
+    ws.append(["구분", "설명", "일자", "기간", "수식", "인라인"])
+    ws.append(["MARK_ESCAPED", "일반 문자열", datetime.datetime(2024, 5, 15, 9, 30), datetime.timedelta(hours=30), "=1+1", "INLINE_CELL"])
+    ws.append([True, 3.25, datetime.date(1999, 12, 31), None, 42, "병합"])
+    ws["D3"].number_format = "[h]:mm:ss"
+    ws["D3"] = 1.5
+    ws.merge_cells("F3:F5")
+    ws["A6"] = "MARK_ESCAPED"
+    ws2 = wb.create_sheet("두번째")
+    ws2["B2"] = "다른 시트"
+    ws2["C3"] = 7
+    tmp_path = path.with_suffix(".tmp.xlsx")
+    wb.save(tmp_path)
+
+    shared_strings = []
+
+    def to_shared(match):
+        # openpyxl은 문자열을 인라인으로 저장하므로 공유 문자열 셀로 바꿔 sharedStrings 경로를 검증
+        ref, text = match.group(1), match.group(2)
+        if ref == "F2":
+            # 인라인 문자열 셀은 서식 런과 _x005F_ 문자를 포함한 형태로 유지 (인라인은 이스케이프를 풀지 않음)
+            return f'<c r="{ref}" t="inlineStr"><is><t>인라인</t><r><t>_x005F_런</t></r></is></c>'
+        if text == "MARK_ESCAPED":
+            text = "줄_x005F_x000D_바꿈"
+        shared_strings.append(text)
+        return f'<c r="{ref}" t="s"><v>{len(shared_strings) - 1}</v></c>'
+
+    with zipfile.ZipFile(tmp_path) as src, zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            data = src.read(info.filename).decode("utf-8")
+            if info.filename.startswith("xl/worksheets/sheet"):
+                data = re.sub(r'<c r="([A-Z]+\d+)" t="inlineStr"><is><t>(.*?)</t></is></c>', to_shared, data)
+                # 수식 셀에 계산된 캐시 값 추가
+                data = data.replace("<f>1+1</f><v />", "<f>1+1</f><v>2</v>")
+            dst.writestr(info.filename, data)
+        # 공유 문자열 파트를 기본 경로(xl/sharedStrings.xml)가 아닌 곳에 두고 Content_Types/관계 파일로 연결
+        items = "".join(f"<si><t>{text}</t></si>" for text in shared_strings)
+        dst.writestr(
+            "xl/strings/shared.xml",
+            '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            f'count="{len(shared_strings)}" uniqueCount="{len(shared_strings)}">{items}</sst>'
+        )
+    with zipfile.ZipFile(path) as zf:
+        parts = {name: zf.read(name).decode("utf-8") for name in zf.namelist()}
+    parts["[Content_Types].xml"] = parts["[Content_Types].xml"].replace(
+        "</Types>",
+        '<Override PartName="/xl/strings/shared.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml" /></Types>'
+    )
+    parts["xl/_rels/workbook.xml.rels"] = parts["xl/_rels/workbook.xml.rels"].replace(
+        "</Relationships>",
+        '<Relationship Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" '
+        'Target="strings/shared.xml" Id="rIdStrings" /></Relationships>'
+    )
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in parts.items():
+            zf.writestr(name, data)
+    tmp_path.unlink()
+
+
+def _assert_same_as_data_only(excel_path: Path):
+    """모든 시트에서 _load_cached_values 그리드와 openpyxl data_only 셀 값 비교"""
+    expected_wb = openpyxl.load_workbook(excel_path, data_only=True)
+    processor = ExcelProcessor(str(excel_path))
+    assert processor.load_workbook()
+    try:
+        for sheet_name in processor.get_sheet_names():
+            expected = {
+                coord: cell.value
+                for coord, cell in expected_wb[sheet_name]._cells.items()
+                if cell.value is not None
+            }
+            grid = processor._parse_cached_values(sheet_name)
+            assert grid is not None, f"{sheet_name}: 직접 읽기 실패"
+            actual = processor._load_cached_values(processor.workbook[sheet_name])
+            assert actual == expected, f"{sheet_name}: data_only 값과 다름"
+    finally:
+        processor.close()
+        expected_wb.close()
+
+
+def test_cached_values_match_data_only():
+    """직접 만든 워크북에서 openpyxl data_only 값과 동일한지 확인"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "cached_values.xlsx"
+        _build_workbook(path)
+        _assert_same_as_data_only(path)
+
+
+def test_sample_cached_values_match_data_only():
+    """샘플 엑셀 파일에서 openpyxl data_only 값과 동일한지 확인"""
+    if not SAMPLE_EXCEL.exists():
+        print(f"샘플 파일 없음, 건너뜀: {SAMPLE_EXCEL}")
+        return
+    _assert_same_as_data_only(SAMPLE_EXCEL)
+
+
+if __name__ == "__main__":
+    test_cached_values_match_data_only()
+    test_sample_cached_values_match_data_only()
+    print("✅ 캐시 값 직접 읽기 결과가 openpyxl data_only와 일치합니다")
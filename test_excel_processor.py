@@ -0,0 +1,302 @@
+"""
+ExcelProcessor 시트 스캔 테스트
+- 연속 빈 행 기준 스캔 중단(EXCEL_BLANK_ROW_LIMIT)이 레코드/텍스트 경로에 똑같이 적용되는지 확인
+- JSON 직렬화(dumps_json)가 orjson 유무와 관계없이 같은 데이터를 쓰는지 확인
+- 셀 목록(_sheet_cells)이 openpyxl 비공개 속성 없이도 같은 값을 돌려주는지 확인
+- 시트 병렬 처리 결과/행 레코드가 순차 처리와 같은지, 병합 영역 안쪽 링크가 좌상단 셀로 연결되는지 확인
+"""
+import sys
+import copy
+import json
+import datetime
+import zipfile
+import tempfile
+from pathlib import Path
+
+import openpyxl
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import excel_processor
+from excel_processor import ExcelProcessor, dumps_json, _sheet_cells
+
+BLANK_ROW_LIMIT = 50
+
+
+def _build_gap_workbook(path: Path, gap: int):
+    """이력 시트: 데이터 2행 → 빈 행 gap개 → 데이터 1행"""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "변경이력"
+    ws.append(["번호", "내용"])
+    ws.append(["1", "앞쪽 행"])
+    ws.append(["2", "앞쪽 행 2"])
+    ws.cell(row=4 + gap, column=1, value="3")
+    ws.cell(row=4 + gap, column=2, value="빈 블록 뒤 행")
+    wb.save(path)
+
+
+def _scan(path: Path):
+    """(process_sheet 레코드 내용, 기록된 행으로 만든 텍스트, 시트를 다시 읽어 만든 텍스트)"""
+    processor = ExcelProcessor(str(path))
+    assert processor.load_workbook()
+    try:
+        _sheet_type, items, _headers = processor.process_sheet("변경이력", record_text_rows=True)
+        recorded_text = "".join(processor.iter_text_chunks("변경이력"))
+        # 기록은 1회 소비되므로 두 번째 호출은 시트를 직접 다시 훑는다
+        walked_text = "".join(processor.iter_text_chunks("변경이력"))
+    finally:
+        processor.close()
+    contents = [item["metadata"].get("내용") for item in items]
+    return contents, recorded_text, walked_text
+
+
+def _with_blank_row_limit(gap: int):
+    original_limit = excel_processor.EXCEL_BLANK_ROW_LIMIT
+    excel_processor.EXCEL_BLANK_ROW_LIMIT = BLANK_ROW_LIMIT
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "gap.xlsx"
+            _build_gap_workbook(path, gap)
+            return _scan(path)
+    finally:
+        excel_processor.EXCEL_BLANK_ROW_LIMIT = original_limit
+
+
+def test_row_after_gap_below_limit_is_kept():
+    """빈 행 수가 기준 미만이면 빈 블록 뒤 행도 레코드와 텍스트에 모두 포함"""
+    contents, recorded_text, walked_text = _with_blank_row_limit(BLANK_ROW_LIMIT - 1)
+    assert contents == ["앞쪽 행", "앞쪽 행 2", "빈 블록 뒤 행"]
+    assert "빈 블록 뒤 행" in recorded_text
+    assert walked_text == recorded_text
+
+
+def test_gap_at_limit_stops_both_paths():
+    """빈 행 수가 기준에 도달하면 레코드와 텍스트 모두 같은 행에서 중단"""
+    contents, recorded_text, walked_text = _with_blank_row_limit(BLANK_ROW_LIMIT)
+    assert contents == ["앞쪽 행", "앞쪽 행 2"]
+    assert "빈 블록 뒤 행" not in recorded_text
+    assert walked_text == recorded_text
+
+
+def _dumps_both(data, indent: bool):
+    """(orjson 사용 결과, 표준 json 결과) — orjson 미설치 환경이면 둘 다 표준 json"""
+    original_orjson = excel_processor.orjson
+    try:
+        with_orjson = dumps_json(data, indent=indent)
+        excel_processor.orjson = None
+        return with_orjson, dumps_json(data, indent=indent)
+    finally:
+        excel_processor.orjson = original_orjson
+
+
+def test_dumps_json_matches_standard_json():
+    """orjson 경로와 표준 json 경로가 같은 데이터를 쓰고, json이 거부하는 값은 둘 다 거부"""
+    data = {
+        'sheet_name': '변경이력',
+        'items': [{'metadata': {'내용': '줄\n바꿈 "따옴표"'}, 'row_number': 3, 'hyperlinks': []}],
+        'ratio': 0.1,
+        'big': 2 ** 70,
+        'int_keys': {1: 'a'},
+    }
+    for indent in (True, False):
+        fast, standard = _dumps_both(data, indent)
+        expected = json.loads(json.dumps(data, ensure_ascii=False))
+        assert json.loads(fast) == expected
+        assert json.loads(standard) == expected
+    # 한 줄 형식은 두 구현 모두 공백 없는 구분자 사용
+    fast, standard = _dumps_both({'내용': '값', '번호': '1'}, indent=False)
+    assert fast == standard == '{"내용":"값","번호":"1"}'.encode('utf-8')
+
+    for value in (datetime.date(2024, 5, 15), datetime.datetime(2024, 5, 15, 9, 30)):
+        for use_orjson in (True, False):
+            original_orjson = excel_processor.orjson
+            if not use_orjson:
+                excel_processor.orjson = None
+            try:
+                dumps_json({'date': value})
+                raise AssertionError(f"json이 거부하는 값이 직렬화됨: {value!r}")
+            except TypeError:
+                pass
+            finally:
+                excel_processor.orjson = original_orjson
+
+
+class _PublicApiSheet:
+    """Worksheet._cells가 없는 openpyxl 버전을 흉내 내는 시트 (공개 API만 노출)"""
+
+    def __init__(self, sheet):
+        self._sheet = sheet
+        self.title = sheet.title
+
+    def iter_rows(self, *args, **kwargs):
+        return self._sheet.iter_rows(*args, **kwargs)
+
+
+def test_sheet_cells_falls_back_to_iter_rows():
+    """_cells가 없으면 iter_rows()로 같은 좌표/값의 셀 목록을 구성"""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws["A1"] = "구분"
+    ws["C2"] = 3
+    ws["B4"] = "링크"
+    ws["B4"].hyperlink = "https://example.com/a.pdf"
+    ws.merge_cells("D1:E2")
+    ws["D1"] = "병합"
+
+    expected = {coord: cell.value for coord, cell in _sheet_cells(ws).items() if cell.value is not None}
+    proxy = _PublicApiSheet(ws)
+    fallback = _sheet_cells(proxy)
+    assert {coord: cell.value for coord, cell in fallback.items() if cell.value is not None} == expected
+    assert fallback[(4, 2)].hyperlink.target == "https://example.com/a.pdf"
+    # 시트당 1회만 구성
+    assert _sheet_cells(proxy) is fallback
+
+
+def _build_multi_sheet_workbook(path: Path):
+    """
+    첨부파일/이력관리/소프트웨어/REV 관리 시트가 섞인 워크북
+    - 첨부목록 시트의 C5:C6 병합 영역 링크는 저장 후 XML에서 안쪽 셀(C6)을 가리키도록 수정
+    - C8:C9 범위 링크 추가
+    """
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "첨부목록"
+    ws.append(["번호", "제목", "첨부", "비고"])
+    ws.append(["1", "설명서", "설명서.pdf", "최초"])
+    ws["C2"].hyperlink = "https://example.com/files/설명서.pdf"
+    ws.append(["2", "도면", "도면.pdf", None])
+    ws["C3"].hyperlink = "https://example.com/files/도면.pdf"
+    ws.append([None, "도면 (계속)", None, "추가 설명"])
+    ws.append(["3", "병합 첨부", "병합.pdf", None])
+    ws["C5"].hyperlink = "https://example.com/files/병합.pdf"
+    ws.merge_cells("C5:C6")
+    ws["B6"] = "병합 둘째 행"
+    ws["A8"], ws["B8"], ws["C8"] = "4", "범위 링크", "범위.pdf"
+    ws["B9"], ws["C9"] = "범위 링크 둘째 행", "범위2.pdf"
+
+    history = wb.create_sheet("변경이력")
+    history.append(["번호", "일자", "변경 내용", "작성자"])
+    for i in range(1, 31):
+        history.append([str(i), f"2024-05-{i:02d}", f"{i}차 변경", "담당자"])
+        if i % 4 == 0:
+            history.append([None, None, f"{i}차 변경 보충 설명", None])
+
+    software = wb.create_sheet("소프트웨어 형상")
+    software.append(["구분", "장치명", "버전", "비고"])
+    for i in range(1, 21):
+        software.append([f"SW-{i}", f"장치 {i}", f"1.{i}", "정상" if i % 3 else None])
+
+    rev = wb.create_sheet("문서목록")
+    rev.append(["WBS", "제목", "REV", "첨부"])
+    for i in range(1, 16):
+        rev.append([f"K20-{i:03d}", f"문서 {i}", str(i % 3), f"문서{i}.pdf"])
+        rev.cell(row=i + 1, column=4).hyperlink = f"https://example.com/docs/{i}.pdf"
+
+    tmp_path = path.with_suffix(".tmp.xlsx")
+    wb.save(tmp_path)
+    with zipfile.ZipFile(tmp_path) as src, zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            data = src.read(info.filename)
+            if info.filename == "xl/worksheets/sheet1.xml":
+                text = data.decode("utf-8")
+                # 병합 영역 안쪽 셀을 가리키는 단일 링크 + 범위 링크 (C2 링크의 관계 ID 재사용)
+                assert 'ref="C5"' in text
+                text = text.replace('ref="C5"', 'ref="C6"')
+                text = text.replace(
+                    "</hyperlinks>",
+                    '<hyperlink xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships" '
+                    'ref="C8:C9" r:id="rId1" /></hyperlinks>'
+                )
+                data = text.encode("utf-8")
+            dst.writestr(info, data)
+    tmp_path.unlink()
+
+
+def _comparable(results):
+    """process_all_sheets 결과를 비교 가능한 형태로 변환 (SheetType → 이름)"""
+    return {name: (sheet_type.name, items, headers) for name, (sheet_type, items, headers) in results.items()}
+
+
+def _text_chunks(processor, sheet_names):
+    return {name: processor.convert_sheet_to_text_chunks(name, max_length=300, return_rows_as_list=True) for name in sheet_names}
+
+
+def test_parallel_sheets_match_serial():
+    """시트 병렬 처리 결과, 작업 프로세스에서 넘어온 행 레코드, 그 레코드로 만든 텍스트가 순차 처리와 같은지 확인"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "multi.xlsx"
+        _build_multi_sheet_workbook(path)
+
+        serial = ExcelProcessor(str(path))
+        serial_results = serial.process_all_sheets(record_text_rows=True)
+        text_sheets = sorted(
+            name for name, (sheet_type, _items, _headers) in serial_results.items()
+            if sheet_type.name in ("HISTORY", "SOFTWARE")
+        )
+        assert text_sheets == ["변경이력", "소프트웨어 형상"]
+        # 텍스트 변환이 레코드의 metadata를 병합 대상으로 고쳐 쓰므로 소비 전에 깊은 복사
+        serial_records = copy.deepcopy(serial._row_records_cache)
+        serial_text = _text_chunks(serial, text_sheets)
+        serial.close()
+
+        parallel = ExcelProcessor(str(path))
+        assert parallel.load_workbook()
+        try:
+            # CPU 수와 관계없이 병렬 경로를 타도록 직접 호출 (process_all_sheets는 CPU 수로 작업 수를 제한)
+            parallel_results = parallel._process_sheets_parallel(parallel.get_sheet_names(), 2, record_text_rows=True)
+            assert list(parallel_results) == list(serial_results)
+            assert _comparable(parallel_results) == _comparable(serial_results)
+            # record_text_rows 레코드가 프로세스 경계를 넘어 그대로 전달
+            assert parallel._row_records_cache == serial_records
+            assert _text_chunks(parallel, text_sheets) == serial_text
+            # 레코드는 1회 소비 → 이후에는 시트를 다시 읽어 같은 텍스트 생성
+            assert not parallel._row_records_cache
+            assert _text_chunks(parallel, text_sheets) == serial_text
+        finally:
+            parallel.close()
+
+
+def test_hyperlinks_resolved_to_merge_origins():
+    """병합 영역 안쪽 셀을 가리키는 링크는 좌상단 셀로, 범위 링크는 각 셀로 연결 (openpyxl 셀 링크와 동일)"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "multi.xlsx"
+        _build_multi_sheet_workbook(path)
+
+        processor = ExcelProcessor(str(path))
+        assert processor.load_workbook()
+        try:
+            sheet = processor.workbook["첨부목록"]
+            link_map = processor._get_sheet_hyperlinks(sheet)
+            assert link_map[(5, 3)] == "https://example.com/files/병합.pdf"
+            assert (6, 3) not in link_map
+            assert link_map[(8, 3)] == link_map[(9, 3)] == "https://example.com/files/설명서.pdf"
+
+            # XML 직접 수집 결과가 openpyxl이 셀에 붙인 링크(폴백 경로)와 같은지 비교
+            processor._sheet_hyperlink_map.clear()
+            saved_links = processor._hyperlinks
+            processor._hyperlinks = {}
+            try:
+                assert processor._get_sheet_hyperlinks(sheet) == link_map
+            finally:
+                processor._hyperlinks = saved_links
+                processor._sheet_hyperlink_map.clear()
+
+            _sheet_type, items, _headers = processor.process_sheet("첨부목록")
+            links_by_number = {item["metadata"]["번호"]: item["hyperlinks"] for item in items}
+            # 병합 영역(C5:C6)의 링크는 한 번만, 범위 링크(C8:C9)는 두 셀이 같은 링크라 중복 제거
+            assert links_by_number["3"] == ["https://example.com/files/병합.pdf"]
+            assert links_by_number["4"] == ["https://example.com/files/설명서.pdf"]
+        finally:
+            processor.close()
+
+
+if __name__ == "__main__":
+    test_row_after_gap_below_limit_is_kept()
+    test_gap_at_limit_stops_both_paths()
+    test_dumps_json_matches_standard_json()
+    test_sheet_cells_falls_back_to_iter_rows()
+    test_parallel_sheets_match_serial()
+    test_hyperlinks_resolved_to_merge_origins()
+    print("✅ ExcelProcessor 테스트 통과")
@@ -0,0 +1,476 @@
+"""
+FileHandler 병렬 처리 / ZIP 해제 테스트
+"""
+import sys
+import zlib
+import threading
+import types
+import struct
+import zipfile
+import tempfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import openpyxl
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import file_handler
+from file_handler import FileHandler
+
+
+def _make_handler(tmp_dir: Path) -> FileHandler:
+    """임시 디렉토리를 temp_dir로 쓰는 FileHandler"""
+    handler = FileHandler()
+    handler.temp_dir = tmp_dir / "temp"
+    handler.temp_dir.mkdir(parents=True, exist_ok=True)
+    return handler
+
+
+def _workbook_values(path: Path) -> set:
+    """워크북의 모든 셀 값"""
+    wb = openpyxl.load_workbook(path, read_only=True)
+    try:
+        return {value for ws in wb.worksheets for row in ws.iter_rows(values_only=True) for value in row if value is not None}
+    finally:
+        wb.close()
+
+
+def test_same_stem_entries_in_parallel():
+    """ZIP 안의 같은 이름 Excel 파일(a/목록.xlsx, b/목록.xlsx)을 병렬 처리해도 결과가 섞이지 않는지 확인"""
+    original_workers = file_handler.FILE_PROCESS_WORKERS
+    file_handler.FILE_PROCESS_WORKERS = 4
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_dir = Path(tmp)
+            zip_path = tmp_dir / "목록묶음.zip"
+            with zipfile.ZipFile(zip_path, "w") as zf:
+                for folder in ("a", "b"):
+                    wb = openpyxl.Workbook()
+                    wb.active.append(["구분", "폴더"])
+                    for i in range(200):
+                        wb.active.append([f"{folder}-{i}", f"폴더 {folder}"])
+                    source = tmp_dir / f"{folder}.xlsx"
+                    wb.save(source)
+                    zf.write(source, f"{folder}/목록.xlsx")
+
+            handler = _make_handler(tmp_dir)
+            try:
+                results = handler.process_file(zip_path)
+
+                assert len(results) == 2
+                paths = [path for path, _ in results]
+                assert paths[0] != paths[1], "같은 stem의 단순화 결과가 같은 경로에 저장됨"
+                markers = set()
+                for path, file_type in results:
+                    assert file_type == "xlsx"
+                    assert path.name == "목록_simplified.xlsx"
+                    values = _workbook_values(path)
+                    folders = {value for value in values if str(value).startswith("폴더 ")}
+                    assert len(folders) == 1, f"다른 입력의 행이 섞임: {folders}"
+                    markers |= folders
+                assert markers == {"폴더 a", "폴더 b"}
+            finally:
+                handler.cleanup_temp()
+    finally:
+        file_handler.FILE_PROCESS_WORKERS = original_workers
+
+
+def _fake_isal_package(calls: dict) -> types.ModuleType:
+    """isal 미설치 환경용 isal 패키지 (zlib으로 동작, 호출 횟수 기록, 오류는 isal처럼 OSError 계열)"""
+    class IsalError(OSError):
+        pass
+
+    class Decompressor:
+        def __init__(self, wbits):
+            self._decomp = zlib.decompressobj(wbits)
+
+        def decompress(self, data, max_length=0):
+            calls['decompress'] += 1
+            try:
+                return self._decomp.decompress(data, max_length)
+            except zlib.error as e:
+                raise IsalError(str(e))
+
+        def flush(self, *args):
+            return self._decomp.flush(*args)
+
+        @property
+        def eof(self):
+            return self._decomp.eof
+
+        @property
+        def unconsumed_tail(self):
+            return self._decomp.unconsumed_tail
+
+        @property
+        def unused_data(self):
+            return self._decomp.unused_data
+
+    def crc32(data, value=0):
+        calls['crc32'] += 1
+        return zlib.crc32(data, value)
+
+    isal_zlib = types.ModuleType('isal.isal_zlib')
+    isal_zlib.error = IsalError
+    isal_zlib.decompressobj = Decompressor
+    isal_zlib.crc32 = crc32
+    package = types.ModuleType('isal')
+    package.isal_zlib = isal_zlib
+    return package
+
+
+def _corrupt_member_data(zip_path: Path, fill: bytes):
+    """첫 멤버의 압축 데이터 구간을 fill 바이트로 덮어씀"""
+    with zipfile.ZipFile(zip_path) as zf:
+        member = zf.infolist()[0]
+    raw = bytearray(zip_path.read_bytes())
+    name_length, extra_length = struct.unpack('<HH', raw[member.header_offset + 26:member.header_offset + 30])
+    data_offset = member.header_offset + 30 + name_length + extra_length
+    raw[data_offset:data_offset + member.compress_size] = fill * member.compress_size
+    zip_path.write_bytes(bytes(raw))
+
+
+def test_isal_zip_extracts_known_archive():
+    """ISA-L 교체 후에도 ZIP 해제 결과가 같고, CRC/해제 오류는 표준 zlib과 같은 예외로 전달되는지 확인"""
+    calls = {'decompress': 0, 'crc32': 0}
+    saved = (zipfile.zlib, zipfile.crc32, file_handler._isal_enabled, file_handler.ZIP_USE_ISAL, sys.modules.get('isal'))
+    file_handler.ZIP_USE_ISAL = True
+    file_handler._isal_enabled = False
+    sys.modules['isal'] = _fake_isal_package(calls)
+    try:
+        assert file_handler.enable_isal_zip()
+        assert zipfile.crc32 is not saved[1]
+
+        contents = {"문서/설명.txt": "설명 본문\n".encode("utf-8") * 5000, "목록.csv": b"a,b\n1,2\n" * 3000}
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_dir = Path(tmp)
+            zip_path = tmp_dir / "known.zip"
+            with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+                for name, data in contents.items():
+                    zf.writestr(name, data)
+
+            handler = _make_handler(tmp_dir)
+            try:
+                extracted = handler.extract_zip(zip_path)
+                root = handler.temp_dir / "known"
+                assert {path.relative_to(root).as_posix(): path.read_bytes() for path in extracted} == contents
+            finally:
+                handler.cleanup_temp()
+            assert calls['decompress'] > 0 and calls['crc32'] > 0
+
+            # CRC 불일치: 저장(STORED) 멤버의 내용만 바꿔 zipfile의 CRC 검사(교체된 crc32)에서 실패
+            bad_crc = tmp_dir / "bad_crc.zip"
+            with zipfile.ZipFile(bad_crc, "w", zipfile.ZIP_STORED) as zf:
+                zf.writestr("a.txt", b"abcd" * 100)
+            _corrupt_member_data(bad_crc, b"z")
+            with zipfile.ZipFile(bad_crc) as zf:
+                try:
+                    zf.read("a.txt")
+                    raise AssertionError("CRC 불일치가 감지되지 않음")
+                except zipfile.BadZipFile:
+                    pass
+
+            # 잘못된 Deflate 블록: 표준 zlib과 같은 zlib.error
+            bad_stream = tmp_dir / "bad_stream.zip"
+            with zipfile.ZipFile(bad_stream, "w", zipfile.ZIP_DEFLATED) as zf:
+                zf.writestr("a.txt", b"abcd" * 100)
+            _corrupt_member_data(bad_stream, b"\xff")
+            with zipfile.ZipFile(bad_stream) as zf:
+                try:
+                    zf.read("a.txt")
+                    raise AssertionError("손상된 Deflate 데이터가 감지되지 않음")
+                except zlib.error:
+                    pass
+    finally:
+        zipfile.zlib, zipfile.crc32, file_handler._isal_enabled, file_handler.ZIP_USE_ISAL, isal_module = saved
+        if isal_module is None:
+            sys.modules.pop('isal', None)
+        else:
+            sys.modules['isal'] = isal_module
+
+
+class _RangeServer:
+    """
+    Range/If-Range를 지원하는 테스트 HTTP 서버
+    - mode='normal': If-Range가 현재 ETag와 같을 때만 206
+    - mode='change_after_head': HEAD 응답 후 파일 내용/ETag가 바뀜 (구간 요청은 200 전체 본문)
+    - mode='bad_content_range': 206이지만 Content-Range 시작 위치가 어긋남
+    """
+
+    def __init__(self, body: bytes, mode: str = "normal"):
+        self.body = body
+        self.etag = '"v1"'
+        self.mode = mode
+        self.range_requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send_full(self, head_only=False):
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(server.body)))
+                self.send_header("Accept-Ranges", "bytes")
+                self.send_header("ETag", server.etag)
+                self.end_headers()
+                if not head_only:
+                    self.wfile.write(server.body)
+
+            def do_HEAD(self):
+                self._send_full(head_only=True)
+                if server.mode == "change_after_head":
+                    server.body = server.body[::-1]
+                    server.etag = '"v2"'
+
+            def do_GET(self):
+                range_header = self.headers.get("Range")
+                if not range_header:
+                    return self._send_full()
+                server.range_requests.append((range_header, self.headers.get("If-Range")))
+                if self.headers.get("If-Range") != server.etag:
+                    return self._send_full()
+                start, end = (int(v) for v in range_header.split("=")[1].split("-"))
+                part = server.body[start:end + 1]
+                reported_start = start + 1 if server.mode == "bad_content_range" else start
+                self.send_response(206)
+                self.send_header("Content-Length", str(len(part)))
+                self.send_header("Content-Range", f"bytes {reported_start}-{end}/{len(server.body)}")
+                self.send_header("ETag", server.etag)
+                self.end_headers()
+                self.wfile.write(part)
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._httpd.server_address[1]}/큰파일.bin"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+def _ranged_download(mode: str):
+    """(download_file 결과 바이트, _download_ranged 성공 여부, 실패 후 남은 파일 여부, 서버)"""
+    body = bytes(range(256)) * 4096 + b"tail"
+    saved = (file_handler.RANGED_DOWNLOAD_MIN_BYTES, file_handler.DOWNLOAD_PARALLEL_PARTS)
+    file_handler.RANGED_DOWNLOAD_MIN_BYTES = 1
+    file_handler.DOWNLOAD_PARALLEL_PARTS = 4
+    try:
+        with tempfile.TemporaryDirectory() as tmp, _RangeServer(body, mode) as server:
+            handler = _make_handler(Path(tmp))
+            handler.download_dir = Path(tmp)
+            ranged_path = Path(tmp) / "ranged.bin"
+            ranged_ok = handler._download_ranged(server.url, ranged_path, 4)
+            leftover = ranged_path.exists()
+            ranged_body = ranged_path.read_bytes() if leftover else None
+            # download_file은 분할 다운로드 실패 시 단일 연결로 다시 받음
+            downloaded = handler.download_file(server.url, save_name="full.bin")
+            return ranged_ok, leftover, ranged_body, downloaded.read_bytes(), server
+    finally:
+        file_handler.RANGED_DOWNLOAD_MIN_BYTES, file_handler.DOWNLOAD_PARALLEL_PARTS = saved
+
+
+def test_ranged_download_uses_if_range():
+    """모든 구간 요청이 HEAD의 ETag로 If-Range를 보내고 결과가 원본과 같은지 확인"""
+    ranged_ok, _leftover, ranged_body, downloaded, server = _ranged_download("normal")
+    assert ranged_ok
+    assert ranged_body == server.body
+    assert downloaded == server.body
+    assert server.range_requests and all(if_range == '"v1"' for _, if_range in server.range_requests)
+
+
+def test_ranged_download_rejects_changed_file():
+    """HEAD 이후 파일이 바뀌면(200 응답) 분할 결과를 버리고 단일 연결로 새 버전 전체를 받음"""
+    ranged_ok, leftover, _ranged_body, downloaded, server = _ranged_download("change_after_head")
+    assert not ranged_ok
+    assert not leftover, "실패한 분할 다운로드 파일이 남아 있음"
+    assert downloaded == server.body
+
+
+def test_ranged_download_rejects_mismatched_content_range():
+    """206이어도 Content-Range가 요청 구간과 다르면 실패 처리"""
+    ranged_ok, leftover, _ranged_body, downloaded, server = _ranged_download("bad_content_range")
+    assert not ranged_ok
+    assert not leftover
+    assert downloaded == server.body
+
+
+class _FakeHwp:
+    """한글 프로그램 COM 객체 대역 (alive=False면 COM 호출이 실패하는 죽은 객체)"""
+
+    def __init__(self, alive: bool = True):
+        self.alive = alive
+        self.quit_calls = 0
+
+    @property
+    def Version(self):
+        if not self.alive:
+            raise OSError("RPC 서버를 사용할 수 없습니다")
+        return "12.0"
+
+    def Quit(self):
+        self.quit_calls += 1
+
+
+def _fake_com_modules(created: list) -> dict:
+    """win32com.client / pythoncom 대역 (DispatchEx로 만든 객체를 created에 기록)"""
+    def dispatch(_prog_id):
+        hwp = _FakeHwp()
+        created.append(hwp)
+        return hwp
+
+    client = types.ModuleType('win32com.client')
+    client.DispatchEx = dispatch
+    client.Dispatch = dispatch
+    win32com = types.ModuleType('win32com')
+    win32com.client = client
+    pythoncom = types.ModuleType('pythoncom')
+    pythoncom.CoInitialize = lambda: None
+    pythoncom.CoUninitialize = lambda: None
+    return {'win32com': win32com, 'win32com.client': client, 'pythoncom': pythoncom}
+
+
+def test_hwp_com_object_recreated_and_closed():
+    """죽은 한글 COM 객체는 재사용하지 않고 새로 만들며, close()가 한글 프로그램과 전용 스레드를 정리"""
+    created = []
+    modules = _fake_com_modules(created)
+    saved = {name: sys.modules.get(name) for name in modules}
+    sys.modules.update(modules)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            handler = _make_handler(Path(tmp))
+            handler._hwp_executor = file_handler.ThreadPoolExecutor(max_workers=1, thread_name_prefix="hwp_com")
+
+            first = handler._hwp_executor.submit(handler._get_hwp).result()
+            # 살아 있으면 같은 객체 재사용
+            assert handler._hwp_executor.submit(handler._get_hwp).result() is first
+
+            # 한글 프로그램이 비정상 종료된 경우 → 새 객체 생성
+            first.alive = False
+            second = handler._hwp_executor.submit(handler._get_hwp).result()
+            assert second is not first and len(created) == 2
+
+            handler.close()
+            assert second.quit_calls == 1
+            assert handler._hwp is None and handler._hwp_executor is None
+            # 두 번 호출해도 안전
+            handler.close()
+    finally:
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+
+
+def _fake_rapidgzip(calls: list, corrupt: bool = False) -> types.ModuleType:
+    """rapidgzip 대역: 넘겨받은 구간을 raw Deflate로 해제 (corrupt=True면 마지막 바이트를 바꿔 CRC 불일치 유도)"""
+    class Reader:
+        def __init__(self, source):
+            self._source = source
+            self._decomp = zlib.decompressobj(-15)
+            self._buffer = b""
+            self._done = False
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def read(self, size):
+            while len(self._buffer) < size and not self._done:
+                data = self._source.read(64 * 1024)
+                if data:
+                    self._buffer += self._decomp.decompress(data)
+                else:
+                    self._buffer += self._decomp.flush()
+                    if corrupt and self._buffer:
+                        self._buffer = self._buffer[:-1] + bytes([self._buffer[-1] ^ 0xFF])
+                    self._done = True
+            chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+            return chunk
+
+    def open_(source, parallelization=1):
+        calls.append(parallelization)
+        return Reader(source)
+
+    module = types.ModuleType('rapidgzip')
+    module.open = open_
+    return module
+
+
+def _extract_with_fake_rapidgzip(corrupt: bool):
+    """(해제 결과 {상대 경로: 내용}, 원본 내용, rapidgzip 호출 수, 압축 해제 디렉토리 밖에 파일이 생겼는지)"""
+    calls = []
+    saved = (file_handler.rapidgzip, file_handler.PARALLEL_DEFLATE_MIN_BYTES)
+    file_handler.rapidgzip = _fake_rapidgzip(calls, corrupt=corrupt)
+    file_handler.PARALLEL_DEFLATE_MIN_BYTES = 1
+    try:
+        contents = {
+            "대용량/로그.txt": "행 데이터\n".encode("utf-8") * 20000,
+            "설정.ini": b"[a]\nb=1\n" * 500,
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_dir = Path(tmp)
+            zip_path = tmp_dir / "large.zip"
+            with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+                for name, data in contents.items():
+                    zf.writestr(name, data)
+                zf.writestr("../../탈출.txt", b"outside")
+            handler = _make_handler(tmp_dir)
+            try:
+                extracted = handler.extract_zip(zip_path)
+                root = handler.temp_dir / "large"
+                result = {path.relative_to(root).as_posix(): path.read_bytes() for path in extracted}
+            finally:
+                handler.cleanup_temp()
+            escaped = (tmp_dir / "탈출.txt").exists() or (tmp_dir.parent / "탈출.txt").exists()
+        return result, contents, len(calls), escaped
+    finally:
+        file_handler.rapidgzip, file_handler.PARALLEL_DEFLATE_MIN_BYTES = saved
+
+
+def test_large_deflated_members_use_rapidgzip():
+    """rapidgzip 경로로 해제한 결과가 원본과 같고, '..' 경로는 압축 해제 디렉토리 안에 정규화"""
+    result, contents, calls, escaped = _extract_with_fake_rapidgzip(corrupt=False)
+    assert calls == 3
+    assert {name: data for name, data in result.items() if name in contents} == contents
+    assert result["탈출.txt"] == b"outside"
+    assert not escaped
+
+
+def test_rapidgzip_crc_mismatch_falls_back_to_zipfile():
+    """rapidgzip 결과의 CRC가 맞지 않으면 파일을 지우고 zipfile로 다시 해제"""
+    result, contents, calls, _escaped = _extract_with_fake_rapidgzip(corrupt=True)
+    assert calls == 3
+    assert {name: data for name, data in result.items() if name in contents} == contents
+
+
+def test_sanitize_windows_name():
+    """Windows 금지 문자 치환, 요소 끝 '.' 제거, 빈 요소 제거"""
+    names = ['a:b\\c?.\\\\d*e..', '보고서<최종>.hwp', '...\\"인용"|문서']
+    assert file_handler._sanitize_windows_name(names[0], '\\') == 'a_b\\c_\\d_e'
+    # 현재 Python의 zipfile 규칙과 같은지 비교 (비공개 메서드가 있는 버전에서만)
+    if hasattr(zipfile.ZipFile, '_sanitize_windows_name'):
+        for name in names:
+            assert file_handler._sanitize_windows_name(name, '\\') == zipfile.ZipFile._sanitize_windows_name(name, '\\')
+
+
+if __name__ == "__main__":
+    test_same_stem_entries_in_parallel()
+    test_isal_zip_extracts_known_archive()
+    test_ranged_download_uses_if_range()
+    test_ranged_download_rejects_changed_file()
+    test_ranged_download_rejects_mismatched_content_range()
+    test_hwp_com_object_recreated_and_closed()
+    test_large_deflated_members_use_rapidgzip()
+    test_rapidgzip_crc_mismatch_falls_back_to_zipfile()
+    test_sanitize_windows_name()
+    print("✅ FileHandler 테스트 통과")